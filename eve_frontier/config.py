@@ -30,6 +30,9 @@ class AppConfig(BaseModel):
     # Database settings
     # Use an absolute path to the database file
     db_url: str = f"sqlite:///{os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'eve_frontier.db'))}"
+    # SQLite synchronous mode; set EVE_FRONTIER_DB_SYNCHRONOUS=OFF to skip syncing
+    # to disk entirely, at the risk of corrupting the database on power loss
+    db_synchronous: str = os.environ.get("EVE_FRONTIER_DB_SYNCHRONOUS", "NORMAL")
     
     # UI settings
     theme: str = "default"
@@ -4,16 +4,84 @@ Base database models for EVE Frontier Blueprint Miracle.
 This module defines the SQLAlchemy base classes and database connection.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 
 from eve_frontier.config import config
 
+# Pragmas applied to every new SQLite connection: write-ahead logging, a
+# 64 MiB page cache, memory-mapped reads and in-memory temporary tables
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    f"synchronous={config.db_synchronous}",
+    "temp_store=MEMORY",
+    "mmap_size=10737418240",
+    "cache_size=-65536",
+    "busy_timeout=3000",
+)
+
+# The pragmas that do not write to the database, for read-only connections;
+# switching the journal mode needs write access
+SQLITE_READ_ONLY_PRAGMAS = tuple(
+    pragma for pragma in SQLITE_PRAGMAS if not pragma.startswith("journal_mode=")
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Apply SQLITE_PRAGMAS to a new DBAPI connection.
+    
+    Args:
+        dbapi_connection: The raw sqlite3 connection
+        connection_record: The pool's record for the connection
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+    finally:
+        cursor.close()
+
+
+def _apply_read_only_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Apply SQLITE_READ_ONLY_PRAGMAS to a new read-only DBAPI connection.
+    
+    Args:
+        dbapi_connection: The raw sqlite3 connection
+        connection_record: The pool's record for the connection
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_READ_ONLY_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+    finally:
+        cursor.close()
+
+
+def tune_sqlite(engine: Engine, read_only: bool = False) -> None:
+    """
+    Tune the connections of a SQLite engine for throughput.
+    
+    Engines for other databases are left unchanged.
+    
+    Args:
+        engine: The SQLAlchemy engine to tune
+        read_only: Whether the engine opens the database read-only, in which
+            case the journal mode is left as it is
+    """
+    listener = _apply_read_only_sqlite_pragmas if read_only else _apply_sqlite_pragmas
+    if engine.dialect.name == "sqlite" and not event.contains(engine, "connect", listener):
+        event.listen(engine, "connect", listener)
+
+
 # Create SQLAlchemy engine
 engine = create_engine(config.db_url, echo=False)
+tune_sqlite(engine)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -37,8 +105,29 @@ def get_db() -> Session:
         raise
 
 
-def init_db() -> None:
+# Databases whose tables init_db() has created, keyed by URL, or by engine for
+# in-memory databases since each engine has its own
+_initialized_databases = set()
+
+
+def init_db(bind: Optional[Engine] = None) -> None:
     """
     Initialize the database by creating all tables.
+    
+    The tables are only created by the first call for each database; later
+    calls return without issuing any DDL.
+    
+    Args:
+        bind: Engine of the database to initialize. Defaults to the application engine.
     """
-    Base.metadata.create_all(bind=engine) 
\ No newline at end of file
+    bind = engine if bind is None else bind
+    if bind.url.database in (None, "", ":memory:"):
+        key = bind
+    else:
+        key = bind.url.render_as_string(hide_password=False)
+    
+    if key in _initialized_databases:
+        return
+    
+    Base.metadata.create_all(bind=bind)
+    _initialized_databases.add(key) 
@@ -6,13 +6,16 @@ This module provides functionality to load data from JSON files and store it in
 
 import json
 import logging
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from eve_frontier.config import config
+from eve_frontier.utils.json_utils import iter_json_items
 from eve_frontier.models import (
     Base, Category, Group, Item, Blueprint, 
     BlueprintProduct, BlueprintMaterial, BlueprintActivity
@@ -20,19 +23,77 @@ from eve_frontier.models import (
 
 logger = logging.getLogger(__name__)
 
+# Rows per Core executemany insert
+INSERT_BATCH_SIZE = 10000
+
+# Item columns filled by load_items, in the order of its row tuples
+ITEM_COLUMNS = ("id", "name", "group_id", "base_price", "volume", "published")
+
 
 class DataLoader:
     """Service for loading data from JSON files into the database."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, commit: bool = True):
         """
         Initialize the DataLoader service.
         
         Args:
             db: SQLAlchemy database session
+            commit: Whether the loaders commit their work. When False they only
+                flush, leaving the caller to commit everything in one transaction.
         """
         logger.debug("Initializing DataLoader with database session")
         self.db = db
+        self.commit = commit
+    
+    def _insert_rows(self, model, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert rows into a model's table with Core executemany inserts.
+        
+        Bypasses the ORM unit of work; rows are sent in batches of
+        INSERT_BATCH_SIZE.
+        
+        Args:
+            model: Mapped model class whose table receives the rows
+            rows: Column values of each row
+        """
+        statement = insert(model.__table__)
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            self.db.execute(statement, rows[start:start + INSERT_BATCH_SIZE])
+    
+    def _insert_item_rows(self, rows: List[tuple]) -> None:
+        """
+        Insert item rows given as tuples in ITEM_COLUMNS order.
+        
+        On SQLite the rows go straight to the DB-API cursor's executemany,
+        skipping SQLAlchemy's per-row parameter processing. The cursor belongs
+        to the session's connection, so the rows share its transaction. Other
+        databases use a Core insert.
+        
+        Args:
+            rows: Item rows as tuples of ITEM_COLUMNS values
+        """
+        connection = self.db.connection()
+        if connection.dialect.name != "sqlite":
+            self._insert_rows(Item, [dict(zip(ITEM_COLUMNS, row)) for row in rows])
+            return
+        
+        statement = (
+            f"INSERT INTO {Item.__tablename__} ({', '.join(ITEM_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(ITEM_COLUMNS))})"
+        )
+        cursor = connection.connection.cursor()
+        try:
+            cursor.executemany(statement, rows)
+        finally:
+            cursor.close()
+    
+    def _commit(self) -> None:
+        """Commit the loaded rows, or only flush them when the caller commits."""
+        if self.commit:
+            self.db.commit()
+        else:
+            self.db.flush()
     
     def load_categories(self, file_path: Union[str, Path]) -> int:
         """
@@ -52,20 +113,19 @@ class DataLoader:
             
             logger.debug(f"Loaded JSON data with {len(data)} categories")
             
-            count = 0
-            for category_id, category_data in data.items():
-                logger.debug(f"Processing category ID {category_id}: {category_data}")
-                category = Category(
-                    id=int(category_id),
-                    name=category_data.get("categoryNameID", "Unknown"),
-                    published=category_data.get("published", 0) == 1
-                )
-                logger.debug(f"Created category: {category.id} - {category.name} (published: {category.published})")
-                self.db.add(category)
-                count += 1
+            categories = [
+                {
+                    "id": int(category_id),
+                    "name": category_data.get("categoryNameID", "Unknown"),
+                    "published": category_data.get("published", 0) == 1
+                }
+                for category_id, category_data in data.items()
+            ]
+            self._insert_rows(Category, categories)
+            count = len(categories)
             
             logger.debug(f"Committing {count} categories to database")
-            self.db.commit()
+            self._commit()
             logger.info(f"Loaded {count} categories")
             return count
         
@@ -92,21 +152,20 @@ class DataLoader:
             
             logger.debug(f"Loaded JSON data with {len(data)} groups")
             
-            count = 0
-            for group_id, group_data in data.items():
-                logger.debug(f"Processing group ID {group_id}: {group_data}")
-                group = Group(
-                    id=int(group_id),
-                    name=group_data.get("groupNameID", "Unknown"),
-                    category_id=group_data.get("categoryID"),
-                    published=group_data.get("published", 0) == 1
-                )
-                logger.debug(f"Created group: {group.id} - {group.name} (category: {group.category_id}, published: {group.published})")
-                self.db.add(group)
-                count += 1
+            groups = [
+                {
+                    "id": int(group_id),
+                    "name": group_data.get("groupNameID", "Unknown"),
+                    "category_id": group_data.get("categoryID"),
+                    "published": group_data.get("published", 0) == 1
+                }
+                for group_id, group_data in data.items()
+            ]
+            self._insert_rows(Group, groups)
+            count = len(groups)
             
             logger.debug(f"Committing {count} groups to database")
-            self.db.commit()
+            self._commit()
             logger.info(f"Loaded {count} groups")
             return count
         
@@ -115,73 +174,53 @@ class DataLoader:
             logger.error(f"Error loading groups: {e}")
             raise
     
-    def load_items(self, file_path: Union[str, Path]) -> int:
+    def load_items(self, file_path: Union[str, Path], batch_size: int = INSERT_BATCH_SIZE) -> int:
         """
         Load items from a JSON file.
         
+        The file is streamed when ijson is installed, and items are inserted
+        while it is read, so only one batch of rows is held in memory. Rows are
+        plain tuples written by _insert_item_rows().
+        
         Args:
             file_path: Path to the JSON file
+            batch_size: Number of items per insert
             
         Returns:
             Number of items loaded
         """
         logger.info(f"Loading items from {file_path}")
         try:
-            # Load the JSON data
             logger.debug(f"Opening file {file_path} for reading")
-            with open(file_path, 'r') as f:
-                items_data = json.load(f)
-
-            # Process the items
-            logger.info(f"Processing {len(items_data)} items")
-            logger.debug(f"First 5 item IDs: {list(items_data.keys())[:5]}")
             
-            # Create a batch for database operations
-            items_batch = []
-            
-            processed_count = 0
-            for type_id, item_data in items_data.items():
-                # Get the name from typeNameID which already contains the human-readable name
+            items = []
+            count = 0
+            for type_id, item_data in iter_json_items(file_path):
+                # Use typeNameID, which already holds the human-readable name, as the name
                 type_id = int(type_id)
-                # Instead of using typeNameID as the numeric ID, use it as the actual name
-                name = item_data.get('typeNameID', str(type_id))
-                
-                group_id = item_data.get('groupID')
-                base_price = item_data.get('basePrice', 0)
-                volume = item_data.get('volume', 0)
-                published = bool(item_data.get('published', False))
-                
-                logger.debug(f"Processing item ID {type_id}: name={name}, group_id={group_id}, base_price={base_price}, volume={volume}, published={published}")
-                
-                # Create a new Item object
-                item = Item(
-                    id=type_id,
-                    name=name,  # Use the name we extracted above
-                    group_id=group_id,
-                    base_price=base_price,
-                    volume=volume,
-                    published=published
-                )
-                
-                # Add the item to the batch
-                items_batch.append(item)
-                processed_count += 1
+                items.append((
+                    type_id,
+                    item_data.get('typeNameID', str(type_id)),
+                    item_data.get('groupID'),
+                    item_data.get('basePrice', 0),
+                    item_data.get('volume', 0),
+                    bool(item_data.get('published', False))
+                ))
+                count += 1
                 
-                # Commit in batches of 100 to avoid memory issues
-                if len(items_batch) >= 100:
-                    logger.debug(f"Committing batch of {len(items_batch)} items (total processed: {processed_count}/{len(items_data)})")
-                    self.db.add_all(items_batch)
-                    self.db.commit()
-                    items_batch = []
+                if len(items) >= batch_size:
+                    logger.debug(f"Inserting batch of {len(items)} items (total processed: {count})")
+                    self._insert_item_rows(items)
+                    items = []
             
-            # Commit any remaining items
-            if items_batch:
-                logger.debug(f"Committing final batch of {len(items_batch)} items (total processed: {processed_count}/{len(items_data)})")
-                self.db.add_all(items_batch)
-                self.db.commit()
+            # Insert any remaining items
+            if items:
+                logger.debug(f"Inserting final batch of {len(items)} items (total processed: {count})")
+                self._insert_item_rows(items)
+            self._commit()
             
-            logger.info(f"Successfully loaded {len(items_data)} items")
-            return len(items_data)
+            logger.info(f"Successfully loaded {count} items")
+            return count
         
         except Exception as e:
             self.db.rollback()
@@ -207,22 +246,23 @@ class DataLoader:
             # The blueprint data is nested under a "blueprints" key
             blueprints_data = data.get("blueprints", {})
             logger.debug(f"Loaded JSON data with {len(blueprints_data)} blueprints")
-            logger.debug(f"First 5 blueprint IDs: {list(blueprints_data.keys())[:5]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"First 5 blueprint IDs: {list(islice(blueprints_data, 5))}")
             
             # Load item names for better blueprint naming
             logger.debug("Loading item names from database for blueprint naming")
-            item_names = {}
-            items = self.db.query(Item).all()
-            for item in items:
-                item_names[item.id] = item.name
+            item_names = dict(self.db.query(Item.id, Item.name).all())
             logger.debug(f"Loaded {len(item_names)} item names")
             
-            count = 0
-            materials_count = 0
-            products_count = 0
-            activities_count = 0
+            # Rows of each table, inserted in bulk once all blueprints are read
+            blueprints = []
+            activity_rows = []
+            material_rows = []
+            product_rows = []
             
             for blueprint_id, blueprint_data in blueprints_data.items():
+                blueprint_id = int(blueprint_id)
+                
                 # Try to find a product name for a better blueprint name
                 blueprint_name = f"Blueprint {blueprint_id}"  # Default name
                 
@@ -237,75 +277,51 @@ class DataLoader:
                         if product_id in item_names:
                             blueprint_name = f"{item_names[product_id]} Blueprint"
                 
-                logger.debug(f"Processing blueprint ID {blueprint_id}: name={blueprint_name}")
-                
-                blueprint = Blueprint(
-                    id=int(blueprint_id),
-                    name=blueprint_name,
-                    max_production_limit=blueprint_data.get("maxProductionLimit", 0)
-                )
-                self.db.add(blueprint)
-                
-                # Load activities
-                activities = blueprint_data.get("activities", {})
-                logger.debug(f"Blueprint {blueprint_id} has {len(activities)} activities: {list(activities.keys())}")
+                blueprints.append({
+                    "id": blueprint_id,
+                    "name": blueprint_name,
+                    "max_production_limit": blueprint_data.get("maxProductionLimit", 0)
+                })
                 
+                # Activities, with their materials and products
                 for activity_name, activity_data in activities.items():
-                    logger.debug(f"Processing activity '{activity_name}' for blueprint {blueprint_id}")
-                    activity = BlueprintActivity(
-                        blueprint_id=int(blueprint_id),
-                        activity_name=activity_name,
-                        time=activity_data.get("time", 0)
-                    )
-                    self.db.add(activity)
-                    activities_count += 1
+                    activity_rows.append({
+                        "blueprint_id": blueprint_id,
+                        "activity_name": activity_name,
+                        "time": activity_data.get("time", 0)
+                    })
                     
-                    # Load materials for this activity
-                    materials = activity_data.get("materials", [])
-                    logger.debug(f"Activity '{activity_name}' has {len(materials)} materials")
-                    
-                    for material in materials:
-                        material_id = material.get("typeID")
-                        quantity = material.get("quantity", 1)
-                        material_name = item_names.get(material_id, f"Unknown Material {material_id}")
-                        
-                        logger.debug(f"Adding material: {material_id} ({material_name}) x{quantity}")
-                        
-                        bp_material = BlueprintMaterial(
-                            blueprint_id=int(blueprint_id),
-                            material_id=material_id,
-                            quantity=quantity
-                        )
-                        self.db.add(bp_material)
-                        materials_count += 1
-                    
-                    # Load products for this activity
-                    products = activity_data.get("products", [])
-                    logger.debug(f"Activity '{activity_name}' has {len(products)} products")
+                    material_rows.extend(
+                        {
+                            "blueprint_id": blueprint_id,
+                            "material_id": material.get("typeID"),
+                            "quantity": material.get("quantity", 1)
+                        }
+                        for material in activity_data.get("materials", [])
+                    )
                     
-                    for product in products:
-                        product_id = product.get("typeID")
-                        quantity = product.get("quantity", 1)
-                        product_name = item_names.get(product_id, f"Unknown Product {product_id}")
-                        
-                        logger.debug(f"Adding product: {product_id} ({product_name}) x{quantity}")
-                        
-                        bp_product = BlueprintProduct(
-                            blueprint_id=int(blueprint_id),
-                            product_id=product_id,
-                            quantity=quantity
-                        )
-                        self.db.add(bp_product)
-                        products_count += 1
-                
-                count += 1
-                # Commit in batches to avoid memory issues
-                if count % 100 == 0:
-                    logger.debug(f"Committing batch after processing {count} blueprints")
-                    self.db.commit()
+                    product_rows.extend(
+                        {
+                            "blueprint_id": blueprint_id,
+                            "product_id": product.get("typeID"),
+                            "quantity": product.get("quantity", 1)
+                        }
+                        for product in activity_data.get("products", [])
+                    )
             
-            logger.debug(f"Final commit for {count} blueprints")
-            self.db.commit()
+            # Blueprints first, so the other rows reference existing blueprints
+            self._insert_rows(Blueprint, blueprints)
+            self._insert_rows(BlueprintActivity, activity_rows)
+            self._insert_rows(BlueprintMaterial, material_rows)
+            self._insert_rows(BlueprintProduct, product_rows)
+            
+            count = len(blueprints)
+            activities_count = len(activity_rows)
+            materials_count = len(material_rows)
+            products_count = len(product_rows)
+            
+            logger.debug(f"Committing {count} blueprints")
+            self._commit()
             logger.info(f"Loaded {count} blueprints with {activities_count} activities, {materials_count} materials, and {products_count} products")
             return count
         
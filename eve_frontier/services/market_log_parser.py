@@ -10,14 +10,20 @@ import csv
 import json
 import logging
 import datetime
+import pickle
 import random
 import re
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any, Union, Set, Generator
 from collections import defaultdict
 
+from eve_frontier.utils.json_utils import load_json
+
 logger = logging.getLogger(__name__)
 
+# Pickle protocol of the binary sidecars written next to JSON cache files
+CACHE_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
 class MarketLogParser:
     """Parser for EVE Online market log files."""
     
@@ -428,11 +434,33 @@ class MarketLogParser:
         if not cache_path.exists():
             return None
         
+        # Binary sidecar holding the parsed data, valid while the JSON file's
+        # modification time and size are unchanged
+        sidecar_path = cache_path.with_suffix(".pickle")
+        
         try:
-            with open(cache_path, 'r') as f:
-                data = json.load(f)
+            stat = cache_path.stat()
+            source_key = (stat.st_mtime_ns, stat.st_size)
+            
+            if sidecar_path.exists():
+                try:
+                    with open(sidecar_path, 'rb') as f:
+                        sidecar_key, data = pickle.load(f)
+                    if sidecar_key == source_key:
+                        logger.info(f"Loaded cached data from {sidecar_path}")
+                        return data
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable cache sidecar {sidecar_path}: {e}")
             
+            data = load_json(cache_path)
             logger.info(f"Loaded cached data from {cache_path}")
+            
+            try:
+                with open(sidecar_path, 'wb') as f:
+                    pickle.dump((source_key, data), f, protocol=CACHE_PICKLE_PROTOCOL)
+            except Exception as e:
+                logger.warning(f"Could not write cache sidecar {sidecar_path}: {e}")
+            
             return data
             
         except Exception as e:
@@ -5,19 +5,23 @@ This module provides functionality to retrieve, analyze, and process market data
 for items in EVE Online.
 """
 
+import itertools
 import logging
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any
 from decimal import Decimal
 import datetime
 
-from sqlalchemy import or_
+from sqlalchemy import case, func, or_, select
 from sqlalchemy.orm import Session
 
-from eve_frontier.models import Item, MarketData, MarketHistory, TradingHub, MarketOrder
+from eve_frontier.models import Item, MarketData, MarketHistory, TradingHub, MarketOrder, Station
 from eve_frontier.services.market_log_parser import MarketLogParser
 
 logger = logging.getLogger(__name__)
 
+# Orders per side that get_market_statistics() looks at
+STATISTICS_ORDER_LIMIT = 100
+
 
 class MarketService:
     """Service for retrieving and analyzing market data."""
@@ -40,6 +44,12 @@ class MarketService:
         # Load unified market data
         self._unified_market_data = None
         
+        # Trading hubs are fetched once per session and dropped on reload
+        self._trading_hubs_cache: Optional[List[Union[TradingHub, Dict[str, Any]]]] = None
+        
+        # Station names resolved so far; the same stations recur across items
+        self._station_name_cache: Dict[int, str] = {}
+        
     def get_unified_market_data(self) -> Dict:
         """
         Get the unified market data.
@@ -282,11 +292,44 @@ class MarketService:
             logger.error(f"Error getting market data from logs: {e}", exc_info=True)
             return []
     
+    def get_order_book(
+        self,
+        item_id: int,
+        limit: int = 20
+    ) -> Tuple[List[MarketData], List[MarketData], Dict[int, str]]:
+        """
+        Get the buy and sell orders for an item together with their station names.
+        
+        Args:
+            item_id: ID of the item
+            limit: Maximum number of orders to load per side
+            
+        Returns:
+            Tuple of (buy orders, sell orders, station ID to name mapping)
+        """
+        # Region filtering is not supported for order book lookups
+        buy_orders = self.get_market_data(item_id=item_id, order_type="buy", limit=limit)
+        sell_orders = self.get_market_data(item_id=item_id, order_type="sell", limit=limit)
+        
+        logger.info(f"Loaded {len(buy_orders)} buy orders and {len(sell_orders)} sell orders")
+        
+        # Resolve the names of every referenced station in one lookup
+        # Handle both object and dictionary formats, deduplicating as we go
+        station_ids = {
+            o['station_id'] if isinstance(o, dict) else o.station_id
+            for o in itertools.chain(buy_orders, sell_orders)
+            if (o.get('station_id') if isinstance(o, dict) else getattr(o, 'station_id', None))
+        }
+        logger.debug(f"Looking up names for {len(station_ids)} station IDs")
+        
+        return buy_orders, sell_orders, self.fetch_station_names(station_ids)
+    
     def get_market_statistics(
         self, 
         item_id: int, 
         region_id: Optional[int] = None, 
-        days: int = 7
+        days: int = 7,
+        history: Optional[List[MarketHistory]] = None
     ) -> Dict[str, Any]:
         """
         Calculate market statistics for an item.
@@ -295,6 +338,7 @@ class MarketService:
             item_id: ID of the item
             region_id: Optional ID of the region to filter by
             days: Number of days of history to include
+            history: Optional history the caller already loaded; skips the history query
             
         Returns:
             Dictionary with market statistics
@@ -310,7 +354,7 @@ class MarketService:
                 region_id=region_id,
                 system_id=system_id,
                 order_type="sell",
-                limit=100
+                limit=STATISTICS_ORDER_LIMIT
             )
             
             buy_orders = self.get_market_data(
@@ -318,15 +362,16 @@ class MarketService:
                 region_id=region_id,
                 system_id=system_id,
                 order_type="buy",
-                limit=100
+                limit=STATISTICS_ORDER_LIMIT
             )
             
             # Get historical data from database
-            history = self._get_market_history(
-                item_id=item_id,
-                region_id=region_id,
-                cutoff_date=cutoff_date
-            )
+            if history is None:
+                history = self._get_market_history(
+                    item_id=item_id,
+                    region_id=region_id,
+                    cutoff_date=cutoff_date
+                )
             
             # If we don't have historical data, use the market logs directly
             if not history:
@@ -424,6 +469,96 @@ class MarketService:
                 "days_analyzed": days,
             }
     
+    def get_prices_bulk(self, item_ids: Iterable[int]) -> Dict[int, Tuple[Decimal, Decimal]]:
+        """
+        Get the current buy and sell prices of several items at once.
+        
+        Prices are chosen the way get_market_statistics(days=1) chooses them.
+        Items without market history in the last day take the unified market
+        log statistics when the logs have the item. All other items take the
+        highest buy and lowest sell price of their database orders, ignoring
+        zero and missing prices, from one aggregate query; a side without any
+        database prices falls back to the item's market log orders, as
+        get_market_data() does. Items without any data get zero prices.
+        
+        Args:
+            item_ids: IDs of the items to price
+            
+        Returns:
+            Dictionary mapping item IDs to (buy_price, sell_price) tuples
+        """
+        ids = {int(item_id) for item_id in item_ids}
+        if not ids:
+            return {}
+        
+        zero = Decimal('0')
+        prices = {}
+        try:
+            # Items with recent history are priced from their orders
+            cutoff_date = datetime.datetime.now() - datetime.timedelta(days=1)
+            with_history = set(self.db.scalars(
+                select(MarketHistory.item_id)
+                .where(MarketHistory.item_id.in_(ids), MarketHistory.date >= cutoff_date)
+                .distinct()
+            ))
+            
+            # The statistics parsed from the market logs take precedence otherwise
+            items = (self._load_unified_market_data() or {}).get('items', {})
+            for item_id in ids - with_history:
+                item_data = items.get(str(item_id))
+                if item_data:
+                    stats = item_data.get('statistics', {})
+                    prices[item_id] = (
+                        Decimal(str(stats.get('max_buy_price', 0) or 0)),
+                        Decimal(str(stats.get('min_sell_price', 0) or 0))
+                    )
+            
+            # Price the remaining items from their positive order prices, counting
+            # the non-null prices of each side to find sides without database orders
+            remaining = ids - prices.keys()
+            if remaining:
+                rows = self.db.execute(
+                    select(
+                        MarketData.item_id,
+                        func.max(case((MarketData.buy_price > 0, MarketData.buy_price))),
+                        func.min(case((MarketData.sell_price > 0, MarketData.sell_price))),
+                        func.count(MarketData.buy_price),
+                        func.count(MarketData.sell_price)
+                    )
+                    .where(MarketData.item_id.in_(remaining))
+                    .group_by(MarketData.item_id)
+                )
+                order_prices = {row[0]: row[1:] for row in rows}
+                
+                for item_id in remaining:
+                    max_buy, min_sell, buy_count, sell_count = order_prices.get(item_id, (None, None, 0, 0))
+                    
+                    # Sides without database prices use the first log orders of that side
+                    item_data = items.get(str(item_id))
+                    if item_data and not buy_count:
+                        max_buy = max(
+                            (order.get('price') for order in item_data.get('buy_orders', [])[:STATISTICS_ORDER_LIMIT]
+                             if order.get('price')),
+                            default=None
+                        )
+                    if item_data and not sell_count:
+                        min_sell = min(
+                            (order.get('price') for order in item_data.get('sell_orders', [])[:STATISTICS_ORDER_LIMIT]
+                             if order.get('price')),
+                            default=None
+                        )
+                    
+                    prices[item_id] = (Decimal(str(max_buy or 0)), Decimal(str(min_sell or 0)))
+        except Exception as e:
+            logger.error(f"Error fetching bulk prices: {e}", exc_info=True)
+        
+        # Items without any data get zero prices
+        for item_id in ids - prices.keys():
+            prices[item_id] = (zero, zero)
+        
+        logger.debug(f"Fetched prices for {len(prices)} items")
+        return prices
+    
     def _get_market_history(
         self, 
         item_id: int, 
@@ -453,9 +588,115 @@ class MarketService:
             query = query.filter(MarketHistory.region_id == region_id)
         
         query = query.order_by(MarketHistory.date.desc())
-        
+
         return query.all()
-    
+
+    def iter_market_history(
+        self,
+        item_id: int,
+        cutoff_date: datetime.datetime,
+        end_date: Optional[datetime.datetime] = None,
+        region_id: Optional[int] = None,
+        batch_size: int = 1000
+    ) -> Iterator[List[Tuple[datetime.datetime, float]]]:
+        """
+        Stream market history for an item in batches, oldest first.
+
+        Price history is unbounded, so rows are fetched through a server-side
+        cursor instead of being materialized in one list. Bounded order book
+        lookups (see get_market_data) keep using the default buffered path.
+
+        Args:
+            item_id: ID of the item
+            cutoff_date: Earliest date to include
+            end_date: Optional latest date to include
+            region_id: Optional ID of the region to filter by
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Lists of (date, average_price) tuples, at most batch_size long
+        """
+        stmt = (
+            select(MarketHistory.date, MarketHistory.average_price)
+            .where(
+                MarketHistory.item_id == item_id,
+                MarketHistory.date >= cutoff_date
+            )
+        )
+
+        if end_date is not None:
+            stmt = stmt.where(MarketHistory.date <= end_date)
+        if region_id is not None:
+            stmt = stmt.where(MarketHistory.region_id == region_id)
+
+        stmt = stmt.order_by(MarketHistory.date.asc()).execution_options(
+            stream_results=True, yield_per=batch_size
+        )
+
+        for partition in self.db.execute(stmt).partitions():
+            yield [tuple(row) for row in partition]
+
+    def get_price_history(
+        self,
+        item_id: int,
+        cutoff_date: datetime.datetime,
+        end_date: Optional[datetime.datetime] = None,
+        region_id: Optional[int] = None,
+        batch_size: int = 1000,
+        max_points: Optional[int] = None
+    ) -> Tuple[List[Tuple[datetime.datetime, float]], Optional[Dict[str, Any]]]:
+        """
+        Get the price history of an item together with its current prices.
+
+        Current statistics are only computed when there is no history, and
+        then without querying the history table a second time.
+
+        With max_points the history is thinned while it streams in, so at
+        most twice max_points rows (plus one batch) are held at any time:
+        every stride-th row is kept, and the stride doubles whenever more
+        than 2 * max_points rows have been kept. The newest row is always
+        included so the series ends where the history does.
+
+        Args:
+            item_id: ID of the item
+            cutoff_date: Earliest date to include
+            end_date: Optional latest date to include
+            region_id: Optional ID of the region to filter by
+            batch_size: Number of rows fetched per round trip
+            max_points: Optional number of rows to thin the history towards
+
+        Returns:
+            Tuple of ((date, average_price) rows oldest first, current statistics or None)
+        """
+        batches = self.iter_market_history(item_id, cutoff_date, end_date, region_id, batch_size)
+        if max_points is None:
+            history = list(itertools.chain.from_iterable(batches))
+        else:
+            history = []
+            stride = 1
+            row_count = 0
+            last_row = None
+            for batch in batches:
+                # Keep the rows whose position in the stream is a multiple of stride
+                offset = -row_count % stride
+                history.extend(batch[offset::stride])
+                row_count += len(batch)
+                last_row = batch[-1]
+                
+                # Double the stride, dropping every other kept row, until the
+                # kept rows fit again
+                while len(history) > 2 * max_points:
+                    stride *= 2
+                    history = history[::2]
+            
+            if last_row is not None and history[-1] is not last_row:
+                history.append(last_row)
+        
+        if history:
+            return history, None
+
+        return history, self.get_market_statistics(item_id, region_id=region_id, days=1, history=[])
+
     def _calculate_price_trend(self, history: List[MarketHistory]) -> float:
         """
         Calculate the price trend from historical data.
@@ -499,6 +740,19 @@ class MarketService:
         """
         Get a list of trading hubs.
         
+        The result is cached until reload_market_data() is called.
+        
+        Returns:
+            List of TradingHub objects or dictionaries with hub information
+        """
+        if self._trading_hubs_cache is None:
+            self._trading_hubs_cache = self._fetch_trading_hubs()
+        return self._trading_hubs_cache
+    
+    def _fetch_trading_hubs(self) -> List[Union[TradingHub, Dict[str, Any]]]:
+        """
+        Fetch trading hubs from the database, falling back to the market logs.
+        
         Returns:
             List of TradingHub objects or dictionaries with hub information
         """
@@ -571,8 +825,8 @@ class MarketService:
             # Clear the cache and reload from log files
             unified_data = self.market_log_parser.clear_cache_and_reload()
             
-            # Update our in-memory cache
-            self._unified_market_data = unified_data
+            # Update our in-memory caches
+            self.set_unified_market_data(unified_data)
             
             # Log some statistics
             item_count = len(unified_data.get('items', {}))
@@ -584,6 +838,19 @@ class MarketService:
             logger.error(f"Failed to reload market data: {e}", exc_info=True)
             return False
     
+    def set_unified_market_data(self, unified_data: Optional[Dict]):
+        """
+        Replace the unified market data and drop the caches derived from it.
+        
+        Lets a service adopt data that another instance reloaded.
+        
+        Args:
+            unified_data: Unified market data, or None to load it again on next use
+        """
+        self._unified_market_data = unified_data
+        self._trading_hubs_cache = None
+        self._station_name_cache.clear()
+    
     def batch_get_station_names(self, station_ids: List[int]) -> Dict[int, str]:
         """
         Get multiple station names at once.
@@ -605,4 +872,40 @@ class MarketService:
             return result
         except Exception as e:
             logger.error(f"Error batch getting station names: {e}", exc_info=True)
-            return {sid: f"Station {sid}" for sid in station_ids} 
\ No newline at end of file
+            return {sid: f"Station {sid}" for sid in station_ids} 
+
+    def fetch_station_names(self, station_ids: Iterable[int]) -> Dict[int, str]:
+        """
+        Get the names of several stations with a single database query.
+        
+        Stations missing from the database fall back to the market log parser's
+        naming, so every requested ID is present in the result. Resolved names
+        are cached until reload_market_data() is called, and only stations not
+        seen before are queried.
+        
+        Args:
+            station_ids: Station IDs to look up
+            
+        Returns:
+            Dictionary mapping station IDs to their names
+        """
+        ids = {int(sid) for sid in station_ids}
+        cache = self._station_name_cache
+        missing = ids - cache.keys()
+        
+        if missing:
+            found = {}
+            try:
+                rows = self.db.execute(
+                    select(Station.id, Station.name).where(Station.id.in_(missing))
+                )
+                found = {station_id: name for station_id, name in rows}
+            except Exception as e:
+                logger.error(f"Error fetching station names: {e}", exc_info=True)
+            
+            for sid in missing - found.keys():
+                found[sid] = self.market_log_parser.get_station_name(sid)
+            
+            cache.update(found)
+        
+        return {sid: cache[sid] for sid in ids}
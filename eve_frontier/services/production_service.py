@@ -6,9 +6,10 @@ and optimize manufacturing processes.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
 from decimal import Decimal
 
+from sqlalchemy import Integer, and_, literal, select
 from sqlalchemy.orm import Session
 
 from eve_frontier.models import (
@@ -101,14 +102,34 @@ class ProductionChainNode:
 class ProductionService:
     """Service for analyzing production chains and manufacturing calculations."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, market_service=None):
         """
         Initialize the ProductionService.
         
         Args:
             db: SQLAlchemy database session
+            market_service: Optional MarketService used for prices, e.g. one whose
+                market data is already loaded; created on first use otherwise
         """
         self.db = db
+        self._market_service = market_service
+        
+        # IDs of items with a manufacturing blueprint, loaded on first use
+        self._manufacturable_product_ids: Optional[FrozenSet[int]] = None
+    
+    def _get_market_service(self):
+        """
+        Get the market service used for prices, creating it on first use.
+        
+        Reusing one instance keeps its unified market data loaded across calls.
+        
+        Returns:
+            MarketService instance
+        """
+        if self._market_service is None:
+            from eve_frontier.services.market_service import MarketService
+            self._market_service = MarketService(self.db)
+        return self._market_service
     
     def get_manufacturing_details(
         self, 
@@ -119,6 +140,7 @@ class ProductionService:
         facility_bonus: float = 0.0,  # Facility bonus reduction (0.0 to 1.0)
         max_depth: int = 3,  # Maximum depth of the production chain
         ignore_items: Optional[List[int]] = None,  # Items to consider as "buy"
+        memo: Optional[dict] = None,
     ) -> Optional[ProductionChainNode]:
         """
         Get manufacturing details for an item, including its production chain.
@@ -131,6 +153,8 @@ class ProductionService:
             facility_bonus: Facility bonus reduction (0.0 to 1.0)
             max_depth: Maximum depth of the production chain to calculate
             ignore_items: List of item IDs to ignore for manufacturing (buy instead)
+            memo: Optional dict shared across calls (e.g. one analysis run) so
+                items loaded or priced by an earlier call are not looked up again
             
         Returns:
             A ProductionChainNode representing the root of the production chain,
@@ -138,54 +162,135 @@ class ProductionService:
         """
         logger.debug(f"Getting manufacturing details for item_id={item_id}, quantity={quantity}")
         
+        # Load the chain's items unless earlier calls already loaded all of them,
+        # as happens for sub-chains shared between items
+        chain_items = memo.setdefault("chain_items", {}) if memo is not None else {}
+        if self._missing_chain_items(item_id, max_depth, chain_items):
+            chain_items.update(self._load_chain_items(item_id, max_depth))
+            
+            # Remember items that do not exist so they are not queried again
+            for missing_id in self._missing_chain_items(item_id, max_depth, chain_items):
+                chain_items[missing_id] = None
+        
+        chain = self._build_chain(
+            item_id=item_id,
+            quantity=quantity,
+            me_level=me_level,
+            te_level=te_level,
+            facility_bonus=facility_bonus,
+            max_depth=max_depth,
+            ignore_items=ignore_items,
+            chain_items=chain_items
+        )
+        if chain is None:
+            return None
+        
+        # Collect every node, parents before their children
+        nodes = []
+        stack = [chain]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.materials)
+        
+        # Price the whole chain with a single lookup, skipping memoized prices
+        prices = memo.setdefault("prices", {}) if memo is not None else {}
+        missing_ids = {node.item_id for node in nodes} - prices.keys()
+        if missing_ids:
+            prices.update(self._get_market_service().get_prices_bulk(missing_ids))
+        
+        # Walk children before parents so material costs are known when needed
+        zero = Decimal('0')
+        for node in reversed(nodes):
+            buy_price, sell_price = prices.get(node.item_id, (zero, zero))
+            node.buy_price = buy_price
+            node.sell_price = sell_price
+            
+            if node.blueprint_id is None:
+                # Use buy price as production cost for raw materials
+                node.production_cost = buy_price
+            elif node.quantity <= 0:
+                node.production_cost = zero
+            elif node.materials:
+                # Use each material's production cost if available, otherwise its market buy price
+                production_cost = zero
+                for material_node in node.materials:
+                    material_cost = material_node.production_cost or material_node.buy_price or zero
+                    production_cost += material_cost * Decimal(material_node.quantity)
+                node.production_cost = production_cost / Decimal(node.quantity)
+            else:
+                # If no materials (or they couldn't be processed), use market price
+                node.production_cost = buy_price
+        
+        return chain
+    
+    def _build_chain(
+        self,
+        item_id: int,
+        quantity: int,
+        me_level: int,
+        te_level: int,
+        facility_bonus: float,
+        max_depth: int,
+        ignore_items: Optional[List[int]],
+        chain_items: Dict[int, dict],
+    ) -> Optional[ProductionChainNode]:
+        """
+        Build the production chain for an item without market prices.
+        
+        The chain is assembled from the rows preloaded by _load_chain_items(),
+        so building it issues no queries.
+        
+        Args:
+            item_id: ID of the item
+            quantity: Quantity to manufacture
+            me_level: Material Efficiency level of the blueprint (0-10)
+            te_level: Time Efficiency level of the blueprint (0-20)
+            facility_bonus: Facility bonus reduction (0.0 to 1.0)
+            max_depth: Maximum depth of the production chain to calculate
+            ignore_items: List of item IDs to ignore for manufacturing (buy instead)
+            chain_items: Chain data by item ID, as returned by _load_chain_items(),
+                with None for items that do not exist
+            
+        Returns:
+            The root ProductionChainNode, or None if the item cannot be manufactured
+        """
         # Avoid circular dependencies by tracking processed items
         processed_items = set(ignore_items or [])
         
         # Get the item
-        item = self.db.query(Item).filter(Item.id == item_id).first()
+        item = chain_items.get(item_id)
         if not item:
             logger.warning(f"Item with ID {item_id} not found")
             return None
         
         # Check if this is a manufacturable item
-        blueprint = self._find_manufacturing_blueprint(item_id)
+        blueprint_id = item["blueprint_id"]
         
         # If no blueprint found or we hit max depth, return a market-based node
-        if not blueprint or max_depth <= 0:
-            if not blueprint:
+        if blueprint_id is None or max_depth <= 0:
+            if blueprint_id is None:
                 logger.info(f"No manufacturing blueprint found for item_id={item_id}")
             
-            # Get market data for this item from MarketService
-            from eve_frontier.services.market_service import MarketService
-            market_service = MarketService(self.db)
-            market_stats = market_service.get_market_statistics(item_id, days=1)
-            
-            buy_price = Decimal(str(market_stats.get('buy_price', 0))) if market_stats else Decimal('0')
-            sell_price = Decimal(str(market_stats.get('sell_price', 0))) if market_stats else Decimal('0')
-            
-            # Return a node with market data
             return ProductionChainNode(
                 item_id=item_id,
-                item_name=item.name,
+                item_name=item["name"],
                 quantity=quantity,
                 blueprint_id=None,
                 activity_id=None,
                 activity_name=None,
                 materials=[],
-                buy_price=buy_price,
-                sell_price=sell_price,
-                production_cost=buy_price,  # Use buy price as production cost for raw materials
                 time_required=None,
             )
         
         # Get the manufacturing activity
-        manufacturing_activity = self._get_manufacturing_activity(blueprint.id)
+        manufacturing_activity = item["activity"]
         if not manufacturing_activity:
-            logger.warning(f"No manufacturing activity found for blueprint_id={blueprint.id}")
+            logger.warning(f"No manufacturing activity found for blueprint_id={blueprint_id}")
             return None
+        activity_id, activity_name, base_time = manufacturing_activity
         
         # Calculate adjusted time (placeholder calculation)
-        base_time = manufacturing_activity.time
         # A basic time efficiency formula (placeholder)
         adjusted_time = base_time * (1 - min(0.2 * te_level, 0.8)) * (1 - facility_bonus)
         
@@ -196,11 +301,9 @@ class ProductionService:
             processed_items.add(item_id)
             
             # Get the materials for this blueprint's manufacturing activity
-            materials = self._get_blueprint_materials(blueprint.id, manufacturing_activity.id)
-            
-            for material in materials:
+            for material_id, material_quantity in item["materials"]:
                 # Calculate adjusted quantity
-                adjusted_quantity = material.quantity
+                adjusted_quantity = material_quantity
                 
                 # Apply material efficiency (placeholder formula)
                 if me_level > 0:
@@ -212,136 +315,168 @@ class ProductionService:
                 total_quantity = adjusted_quantity * quantity
                 
                 # Process this material recursively if it's not in the ignore list
-                if material.material_id not in processed_items:
-                    material_node = self.get_manufacturing_details(
-                        item_id=material.material_id,
+                if material_id not in processed_items:
+                    material_node = self._build_chain(
+                        item_id=material_id,
                         quantity=total_quantity,
                         me_level=me_level,
                         te_level=te_level,
                         facility_bonus=facility_bonus,
                         max_depth=max_depth - 1,
-                        ignore_items=list(processed_items)
+                        ignore_items=list(processed_items),
+                        chain_items=chain_items
                     )
                     
                     if material_node:
                         materials_nodes.append(material_node)
-
-        # Get market data for this item
-        from eve_frontier.services.market_service import MarketService
-        market_service = MarketService(self.db)
-        market_stats = market_service.get_market_statistics(item_id, days=1)
-        
-        buy_price = Decimal(str(market_stats.get('buy_price', 0))) if market_stats else Decimal('0')
-        sell_price = Decimal(str(market_stats.get('sell_price', 0))) if market_stats else Decimal('0')
-        
-        # Calculate production cost based on material costs
-        production_cost = Decimal('0')
-        if materials_nodes:
-            for material_node in materials_nodes:
-                # Use the material's production cost if available, otherwise use market buy price
-                material_cost = material_node.production_cost or material_node.buy_price or Decimal('0')
-                production_cost += material_cost * Decimal(material_node.quantity)
-        else:
-            # If no materials (or they couldn't be processed), use market price
-            production_cost = buy_price * Decimal(quantity)
         
         # Create and return the production chain node
         return ProductionChainNode(
             item_id=item_id,
-            item_name=item.name,
+            item_name=item["name"],
             quantity=quantity,
-            blueprint_id=blueprint.id if blueprint else None,
-            activity_id=manufacturing_activity.id if manufacturing_activity else None,
-            activity_name=manufacturing_activity.activity_name if manufacturing_activity else None,
+            blueprint_id=blueprint_id,
+            activity_id=activity_id,
+            activity_name=activity_name,
             materials=materials_nodes,
-            buy_price=buy_price,
-            sell_price=sell_price,
-            production_cost=production_cost / Decimal(quantity) if quantity > 0 else Decimal('0'),
-            time_required=adjusted_time if manufacturing_activity else None,
+            time_required=adjusted_time,
         )
     
-    def _find_manufacturing_blueprint(self, product_id: int) -> Optional[Blueprint]:
+    def _missing_chain_items(self, item_id: int, max_depth: int, chain_items: Dict[int, Optional[dict]]) -> Set[int]:
         """
-        Find a blueprint that can manufacture the specified item.
+        Find the items _build_chain() would need that chain_items lacks.
         
         Args:
-            product_id: ID of the product item
+            item_id: ID of the item at the root of the chain
+            max_depth: Maximum depth of the production chain
+            chain_items: Chain data by item ID loaded so far
             
         Returns:
-            Blueprint object if found, None otherwise
+            IDs of the items in the chain that are not in chain_items
         """
-        # First, check if any blueprint products exist for this item
-        product_count = (
-            self.db.query(BlueprintProduct)
-            .filter(BlueprintProduct.product_id == product_id)
-            .count()
-        )
+        missing = set()
         
-        logger.debug(f"Found {product_count} blueprint products for product_id={product_id}")
-        
-        if product_count == 0:
-            return None
-        
-        # If products exist, find the blueprint
-        blueprint = (
-            self.db.query(Blueprint)
-            .join(BlueprintProduct, Blueprint.id == BlueprintProduct.blueprint_id)
-            .filter(
-                BlueprintProduct.product_id == product_id
-            )
-            .first()
-        )
-        
-        if blueprint:
-            logger.debug(f"Found blueprint ID {blueprint.id} ({blueprint.name}) for product_id={product_id}")
-        else:
-            logger.debug(f"No blueprint found for product_id={product_id}")
+        # Walk the chain, visiting each item once at the largest depth left
+        depth_left = {}
+        stack = [(item_id, max_depth)]
+        while stack:
+            current_id, depth = stack.pop()
+            if depth_left.get(current_id, -1) >= depth:
+                continue
+            depth_left[current_id] = depth
+            
+            if current_id not in chain_items:
+                missing.add(current_id)
+                continue
+            
+            item = chain_items[current_id]
+            if item is not None and item["blueprint_id"] is not None and depth > 0:
+                stack.extend((material_id, depth - 1) for material_id, _ in item["materials"])
         
-        return blueprint
+        return missing
     
-    def _get_manufacturing_activity(self, blueprint_id: int) -> Optional[BlueprintActivity]:
+    def _load_chain_items(self, item_id: int, max_depth: int) -> Dict[int, dict]:
         """
-        Get the manufacturing activity for a blueprint.
+        Load the data for an item's production chain in a single query.
+        
+        A recursive CTE follows blueprint products to their materials from the
+        item down to max_depth levels. Every item reached is then joined with
+        its blueprint, manufacturing activity and blueprint materials.
         
         Args:
-            blueprint_id: ID of the blueprint
+            item_id: ID of the item at the root of the chain
+            max_depth: Maximum depth of the production chain to load
             
         Returns:
-            BlueprintActivity object if found, None otherwise
+            Dictionary mapping item IDs to dicts with the item "name", its
+            "blueprint_id" (None if not manufacturable), its manufacturing
+            "activity" as an (id, name, time) tuple or None, and its blueprint
+            "materials" as (material_id, quantity) tuples
         """
-        activity = (
-            self.db.query(BlueprintActivity)
-            .filter(
-                BlueprintActivity.blueprint_id == blueprint_id,
-                BlueprintActivity.activity_name == "manufacturing"
+        # Items reachable from the root, with the level they were reached at
+        chain = (
+            select(literal(item_id, Integer).label("item_id"), literal(0, Integer).label("depth"))
+            .cte("chain", recursive=True)
+        )
+        chain = chain.union(
+            select(BlueprintMaterial.material_id, chain.c.depth + 1)
+            .join(BlueprintProduct, BlueprintProduct.blueprint_id == BlueprintMaterial.blueprint_id)
+            .where(BlueprintProduct.product_id == chain.c.item_id, chain.c.depth < max_depth)
+        )
+        
+        # Rows are ordered so the first blueprint and activity of each item win,
+        # and materials keep their blueprint order
+        rows = self.db.execute(
+            select(
+                Item.id,
+                Item.name,
+                BlueprintProduct.id,
+                BlueprintProduct.blueprint_id,
+                BlueprintActivity.id,
+                BlueprintActivity.activity_name,
+                BlueprintActivity.time,
+                BlueprintMaterial.material_id,
+                BlueprintMaterial.quantity
+            )
+            .where(Item.id.in_(select(chain.c.item_id)))
+            .outerjoin(BlueprintProduct, BlueprintProduct.product_id == Item.id)
+            .outerjoin(
+                BlueprintActivity,
+                and_(
+                    BlueprintActivity.blueprint_id == BlueprintProduct.blueprint_id,
+                    BlueprintActivity.activity_name == "manufacturing"
+                )
             )
-            .first()
+            .outerjoin(BlueprintMaterial, BlueprintMaterial.blueprint_id == BlueprintProduct.blueprint_id)
+            .order_by(Item.id, BlueprintProduct.id, BlueprintActivity.id, BlueprintMaterial.id)
         )
-        return activity
+        
+        chain_items = {}
+        for (row_item_id, name, product_row_id, blueprint_id, activity_id, activity_name,
+                activity_time, material_id, material_quantity) in rows:
+            item = chain_items.get(row_item_id)
+            if item is None:
+                item = chain_items[row_item_id] = {
+                    "name": name,
+                    "blueprint_id": blueprint_id,
+                    "activity": (activity_id, activity_name, activity_time) if activity_id is not None else None,
+                    "materials": [],
+                    "_rows": (product_row_id, activity_id),
+                }
+            elif item["_rows"] != (product_row_id, activity_id):
+                # Another blueprint or activity for an item that already has one
+                continue
+            
+            if material_id is not None:
+                item["materials"].append((material_id, material_quantity))
+        
+        for item in chain_items.values():
+            del item["_rows"]
+        
+        logger.debug(f"Loaded {len(chain_items)} items for the production chain of item_id={item_id}")
+        return chain_items
     
-    def _get_blueprint_materials(
-        self, 
-        blueprint_id: int, 
-        activity_id: int
-    ) -> List[BlueprintMaterial]:
+    def get_manufacturable_product_ids(self) -> FrozenSet[int]:
         """
-        Get the materials required for a blueprint activity.
+        Get the IDs of all items that a blueprint can manufacture.
+        
+        An item counts as manufacturable when any blueprint lists it as a
+        product. The set is loaded with one query and cached for the lifetime
+        of the service.
         
-        Args:
-            blueprint_id: ID of the blueprint
-            activity_id: ID of the activity
-            
         Returns:
-            List of BlueprintMaterial objects
+            Frozen set of product item IDs
         """
-        materials = (
-            self.db.query(BlueprintMaterial)
-            .filter(
-                BlueprintMaterial.blueprint_id == blueprint_id
+        if self._manufacturable_product_ids is None:
+            product_ids = self.db.scalars(
+                select(BlueprintProduct.product_id)
+                .join(Blueprint, Blueprint.id == BlueprintProduct.blueprint_id)
+                .distinct()
             )
-            .all()
-        )
-        return materials
+            self._manufacturable_product_ids = frozenset(product_ids)
+            logger.debug(f"Loaded {len(self._manufacturable_product_ids)} manufacturable product IDs")
+        
+        return self._manufacturable_product_ids
     
     def get_skill_requirements(
         self, 
@@ -374,6 +509,7 @@ class ProductionService:
         quantity: int = 1,
         me_level: int = 0,
         include_components: bool = True,
+        memo: Optional[dict] = None,
     ) -> Dict[str, Union[Decimal, int, float]]:
         """
         Calculate the profit for producing an item.
@@ -383,14 +519,45 @@ class ProductionService:
             quantity: Quantity to produce
             me_level: Material Efficiency level
             include_components: Whether to include the component breakdown
+            memo: Optional dict shared across calls (e.g. one analysis run) that
+                caches results and the prices of chain items; market and
+                blueprint data must not change while it is in use
+            
+        Returns:
+            Dictionary with profit information
+        """
+        if memo is None:
+            return self._calculate_production_profit(item_id, quantity, me_level, include_components, None)
+        
+        key = ("profit", item_id, quantity, me_level, include_components)
+        if key not in memo:
+            memo[key] = self._calculate_production_profit(item_id, quantity, me_level, include_components, memo)
+        return memo[key]
+    
+    def _calculate_production_profit(
+        self,
+        item_id: int,
+        quantity: int,
+        me_level: int,
+        include_components: bool,
+        memo: Optional[dict],
+    ) -> Dict[str, Union[Decimal, int, float]]:
+        """
+        Calculate the profit for producing an item without result caching.
+        
+        Args:
+            item_id: ID of the item
+            quantity: Quantity to produce
+            me_level: Material Efficiency level
+            include_components: Whether to include the component breakdown
+            memo: Optional dict passed on to get_manufacturing_details()
             
         Returns:
             Dictionary with profit information
         """
         try:
             # Get market data for the item
-            from eve_frontier.services.market_service import MarketService
-            market_service = MarketService(self.db)
+            market_service = self._get_market_service()
             
             # Get market statistics for this item
             market_stats = market_service.get_market_statistics(item_id, days=1)
@@ -409,7 +576,8 @@ class ProductionService:
                 item_id=item_id,
                 quantity=quantity,
                 me_level=me_level,
-                max_depth=3 if include_components else 1
+                max_depth=3 if include_components else 1,
+                memo=memo
             )
             
             if not production_chain:
@@ -5,10 +5,10 @@ This module provides functionality to search for items, blueprints, and other en
 """
 
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from sqlalchemy import or_, func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from eve_frontier.models import Category, Group, Item, Blueprint
 
@@ -26,6 +26,9 @@ class SearchService:
             db: SQLAlchemy database session
         """
         self.db = db
+        
+        # Categories rarely change during a session; cache them per filter flag
+        self._categories_cache: Dict[bool, List[Category]] = {}
     
     def search_items(
         self, 
@@ -49,16 +52,69 @@ class SearchService:
             List of matching Item objects
         """
         logger.debug(f"Searching for items: query='{query}' category_id={category_id} group_id={group_id}")
+        return self._match_items(self._filter_items_query, query, category_id, group_id, published_only, limit)
+    
+    def search_item_rows(
+        self, 
+        query: str, 
+        category_id: Optional[int] = None, 
+        group_id: Optional[int] = None,
+        published_only: bool = True,
+        limit: int = 50
+    ) -> List[Tuple[int, str, str]]:
+        """
+        Search for items matching the query, returning only display columns.
+        
+        Matches the same items as search_items(), but selects the ID, name and
+        category name in SQL instead of loading Item objects.
+        
+        Args:
+            query: Search query string
+            category_id: Optional category ID to filter by
+            group_id: Optional group ID to filter by
+            published_only: Whether to only return published items
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of (item_id, item_name, category_name) rows; the category name
+            is 'Unknown' for items without a category
+        """
+        logger.debug(f"Searching for item rows: query='{query}' category_id={category_id} group_id={group_id}")
+        return self._match_items(self._filter_item_rows_query, query, category_id, group_id, published_only, limit)
+    
+    def _match_items(
+        self,
+        build_query: Callable,
+        query: str,
+        category_id: Optional[int],
+        group_id: Optional[int],
+        published_only: bool,
+        limit: int
+    ) -> list:
+        """
+        Run the item search, from exact matches down to matching any term.
         
+        Args:
+            build_query: Function creating a filtered query from a name filter,
+                with the signature of _filter_items_query()
+            query: Search query string
+            category_id: Optional category ID to filter by
+            group_id: Optional group ID to filter by
+            published_only: Whether to only return published items
+            limit: Maximum number of results to return
+            
+        Returns:
+            Results of the first matching stage
+        """
         if not query:
             # If no query is provided, return all items (with filters)
-            return self._filter_items_query(None, category_id, group_id, published_only, limit).all()
+            return build_query(None, category_id, group_id, published_only, limit).all()
         
         # Normalize the query
         normalized_query = query.strip().lower()
         
         # First, try to find exact matches (case-insensitive)
-        exact_matches = self._filter_items_query(
+        exact_matches = build_query(
             Item.name.ilike(normalized_query),
             category_id, 
             group_id, 
@@ -71,7 +127,7 @@ class SearchService:
             return exact_matches
         
         # Next, try to find items that start with the query
-        starts_with_matches = self._filter_items_query(
+        starts_with_matches = build_query(
             Item.name.ilike(f"{normalized_query}%"),
             category_id, 
             group_id, 
@@ -92,8 +148,8 @@ class SearchService:
             for term in terms:
                 all_terms_filter.append(Item.name.ilike(f"%{term}%"))
             
-            all_terms_matches = self._filter_items_query(
-                *all_terms_filter,
+            all_terms_matches = build_query(
+                all_terms_filter,
                 category_id=category_id, 
                 group_id=group_id, 
                 published_only=published_only, 
@@ -109,7 +165,7 @@ class SearchService:
         for term in terms:
             filter_conditions.append(Item.name.ilike(f"%{term}%"))
         
-        any_term_matches = self._filter_items_query(
+        any_term_matches = build_query(
             or_(*filter_conditions) if filter_conditions else None,
             category_id, 
             group_id, 
@@ -141,9 +197,67 @@ class SearchService:
         Returns:
             Filtered SQLAlchemy query object
         """
-        # Start with a base query on the Item model
-        query_obj = self.db.query(Item)
+        # Start with a base query on the Item model, loading the group and
+        # category with the items so callers can read category names without
+        # a lazy load per row
+        query_obj = self.db.query(Item).options(
+            joinedload(Item.group).joinedload(Group.category)
+        )
+        
+        # Filter by category if specified
+        if category_id is not None:
+            query_obj = query_obj.join(Group).filter(Group.category_id == category_id)
         
+        return self._apply_item_filters(query_obj, name_filter, group_id, published_only, limit)
+    
+    def _filter_item_rows_query(
+        self,
+        name_filter=None,
+        category_id=None,
+        group_id=None,
+        published_only=True,
+        limit=50
+    ):
+        """
+        Create a filtered query for item ID, name and category name rows.
+        
+        Args:
+            name_filter: Name filter condition
+            category_id: Optional category ID to filter by
+            group_id: Optional group ID to filter by
+            published_only: Whether to only return published items
+            limit: Maximum number of results to return
+            
+        Returns:
+            Filtered SQLAlchemy query object
+        """
+        # Project the category name in SQL; items without one get 'Unknown'
+        query_obj = (
+            self.db.query(Item.id, Item.name, func.coalesce(Category.name, 'Unknown'))
+            .outerjoin(Item.group)
+            .outerjoin(Group.category)
+        )
+        
+        # Filter by category if specified
+        if category_id is not None:
+            query_obj = query_obj.filter(Group.category_id == category_id)
+        
+        return self._apply_item_filters(query_obj, name_filter, group_id, published_only, limit)
+    
+    def _apply_item_filters(self, query_obj, name_filter, group_id, published_only, limit):
+        """
+        Apply the name, group, published and limit filters to an item query.
+        
+        Args:
+            query_obj: Query selecting from the Item model
+            name_filter: Name filter condition
+            group_id: Optional group ID to filter by
+            published_only: Whether to only return published items
+            limit: Maximum number of results to return
+            
+        Returns:
+            Filtered SQLAlchemy query object
+        """
         # Add name filter if provided
         if name_filter is not None:
             if isinstance(name_filter, list):
@@ -152,10 +266,6 @@ class SearchService:
             else:
                 query_obj = query_obj.filter(name_filter)
         
-        # Filter by category if specified
-        if category_id is not None:
-            query_obj = query_obj.join(Group).filter(Group.category_id == category_id)
-        
         # Filter by group if specified
         if group_id is not None:
             query_obj = query_obj.filter(Item.group_id == group_id)
@@ -216,7 +326,9 @@ class SearchService:
     
     def get_categories(self, published_only: bool = True) -> List[Category]:
         """
-        Get all categories.
+        Get all categories, sorted by name.
+        
+        Results are cached until invalidate_categories() is called.
         
         Args:
             published_only: Whether to only return published categories
@@ -224,12 +336,22 @@ class SearchService:
         Returns:
             List of Category objects
         """
+        cached = self._categories_cache.get(published_only)
+        if cached is not None:
+            return cached
+        
         query = self.db.query(Category)
         
         if published_only:
             query = query.filter(Category.published == True)
         
-        return query.order_by(Category.name).all()
+        categories = query.order_by(Category.name).all()
+        self._categories_cache[published_only] = categories
+        return categories
+    
+    def invalidate_categories(self):
+        """Drop cached categories so the next get_categories() call re-queries."""
+        self._categories_cache.clear()
     
     def get_groups(
         self, 
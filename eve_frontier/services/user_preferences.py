@@ -4,17 +4,40 @@ User Preferences Service for EVE Frontier Blueprint Miracle.
 This module provides functionality to store and retrieve user preferences and settings.
 """
 
+import atexit
 import json
 import logging
 import os
+import weakref
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from eve_frontier.utils.json_utils import dumps_json, load_json
+
 logger = logging.getLogger(__name__)
 
+# Live services, flushed once at interpreter exit; weak references let
+# discarded services be garbage collected
+_open_services: "weakref.WeakSet[UserPreferencesService]" = weakref.WeakSet()
+
+
+def _flush_open_services():
+    """Save pending changes of all services that are still alive."""
+    for service in list(_open_services):
+        service.flush()
+
+
+atexit.register(_flush_open_services)
+
 
 class UserPreferencesService:
-    """Service for managing user preferences and settings."""
+    """
+    Service for managing user preferences and settings.
+    
+    Preferences are read from disk once and kept in memory. Setters only
+    change the in-memory copy; changes are written back by flush(), which
+    also runs when the service is garbage collected or the interpreter exits.
+    """
     
     def __init__(self, config_dir: Optional[str] = None):
         """
@@ -24,6 +47,10 @@ class UserPreferencesService:
             config_dir: Optional custom directory for storing configuration files.
                 If not provided, will use a default location in the user's home directory.
         """
+        # Whether the in-memory preferences have changes not yet saved; set
+        # first so __del__ works even if the rest of __init__ fails
+        self._dirty = False
+        
         if config_dir:
             self.config_dir = Path(config_dir)
         else:
@@ -38,6 +65,12 @@ class UserPreferencesService:
         
         # Initialize preferences dictionary
         self._preferences = self._load_preferences()
+        
+        _open_services.add(self)
+    
+    def __del__(self):
+        """Save pending changes when the service is garbage collected."""
+        self.flush()
     
     def _load_preferences(self) -> Dict[str, Any]:
         """
@@ -51,8 +84,7 @@ class UserPreferencesService:
             return self._create_default_preferences()
         
         try:
-            with open(self.preferences_file, 'r') as f:
-                return json.load(f)
+            return load_json(self.preferences_file)
         except json.JSONDecodeError:
             logger.warning(f"Error parsing preferences file at {self.preferences_file}, using defaults")
             return self._create_default_preferences()
@@ -69,12 +101,28 @@ class UserPreferencesService:
         """
         try:
             with open(self.preferences_file, 'w') as f:
-                json.dump(self._preferences, f, indent=2)
+                f.write(dumps_json(self._preferences, indent=True))
             return True
         except Exception as e:
             logger.error(f"Error saving preferences: {e}")
             return False
     
+    def flush(self) -> bool:
+        """
+        Save the preferences to the preferences file if they have changed.
+        
+        Returns:
+            True if successful or nothing needed saving, False otherwise
+        """
+        if not self._dirty:
+            return True
+        
+        if not self._save_preferences():
+            return False
+        
+        self._dirty = False
+        return True
+    
     def _create_default_preferences(self) -> Dict[str, Any]:
         """
         Create default preferences.
@@ -138,24 +186,25 @@ class UserPreferencesService:
         """
         Set a preference value.
         
+        The value is not written to disk until flush() is called.
+        
         Args:
             section: Preference section
             key: Preference key
             value: Value to set
             
         Returns:
-            True if successful, False otherwise
+            True if the value was set in memory, False otherwise
         """
         try:
             # Ensure the section exists
             if section not in self._preferences:
                 self._preferences[section] = {}
             
-            # Set the value
+            # Set the value; it is saved by the next flush()
             self._preferences[section][key] = value
-            
-            # Save the preferences
-            return self._save_preferences()
+            self._dirty = True
+            return True
         except Exception as e:
             logger.error(f"Error setting preference {section}.{key}: {e}")
             return False
@@ -173,11 +222,13 @@ class UserPreferencesService:
         """
         Reset preferences to default values.
         
+        The defaults are not written to disk until flush() is called.
+        
         Args:
             section: Optional section to reset. If None, reset all preferences.
             
         Returns:
-            True if successful, False otherwise
+            True if the preferences were reset in memory, False otherwise
         """
         try:
             defaults = self._create_default_preferences()
@@ -192,8 +243,9 @@ class UserPreferencesService:
                 logger.warning(f"Unknown preference section: {section}")
                 return False
             
-            # Save the preferences
-            return self._save_preferences()
+            # Mark the preferences for the next flush()
+            self._dirty = True
+            return True
         except Exception as e:
             logger.error(f"Error resetting preferences: {e}")
             return False
@@ -202,12 +254,14 @@ class UserPreferencesService:
         """
         Add a search term to the recent searches list.
         
+        The change is not written to disk until flush() is called.
+        
         Args:
             search_term: Search term to add
             max_recent_searches: Maximum number of recent searches to keep
             
         Returns:
-            True if successful, False otherwise
+            True if the list was updated in memory, False otherwise
         """
         try:
             # Get the current list of recent searches
@@ -234,11 +288,13 @@ class UserPreferencesService:
         """
         Add an item to the favorite items list.
         
+        The change is not written to disk until flush() is called.
+        
         Args:
             item_id: ID of the item to add
             
         Returns:
-            True if successful, False otherwise
+            True if the list was updated in memory, False otherwise
         """
         try:
             # Get the current list of favorite items
@@ -259,11 +315,13 @@ class UserPreferencesService:
         """
         Remove an item from the favorite items list.
         
+        The change is not written to disk until flush() is called.
+        
         Args:
             item_id: ID of the item to remove
             
         Returns:
-            True if successful, False otherwise
+            True if the list was updated in memory, False otherwise
         """
         try:
             # Get the current list of favorite items
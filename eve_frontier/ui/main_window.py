@@ -120,6 +120,9 @@ class MainWindow(QMainWindow):
         self.market_data_tab = MarketDataTab(db)
         self.tab_widget.addTab(self.market_data_tab, "Market Data")
         
+        # Cached production chains carry market prices, so drop them on a reload
+        self.market_data_tab.market_data_reloaded.connect(self.production_chain_tab.invalidate_caches)
+        
         logger.debug("Tabs created")
     
     def _create_item_search_tab(self):
@@ -6,6 +6,7 @@ blueprint information, including materials, products, and manufacturing details.
 """
 
 import logging
+from collections import defaultdict
 from typing import List, Optional, Dict, Any
 
 from PySide6.QtWidgets import (
@@ -244,13 +245,29 @@ class BlueprintBrowserTab(QWidget):
         Args:
             blueprints: List of Blueprint objects to display
         """
-        # Clear the table
+        # Suspend painting, sorting and selection signals during the bulk fill
+        sorting_enabled = self.results_table.isSortingEnabled()
+        self.results_table.setUpdatesEnabled(False)
+        self.results_table.setSortingEnabled(False)
+        self.results_table.blockSignals(True)
+        
+        # Load the product names of every listed blueprint with one query
+        product_names = defaultdict(list)
+        if blueprints:
+            rows = (
+                self.db.query(BlueprintProduct.blueprint_id, Item.name, BlueprintProduct.quantity)
+                .join(Item, Item.id == BlueprintProduct.product_id)
+                .filter(BlueprintProduct.blueprint_id.in_([blueprint.id for blueprint in blueprints]))
+                .order_by(BlueprintProduct.id)
+            )
+            for blueprint_id, name, quantity in rows:
+                product_names[blueprint_id].append(f"{name} ({quantity})")
+        
+        # Clear the table and allocate all rows up front
         self.results_table.setRowCount(0)
+        self.results_table.setRowCount(len(blueprints))
         
-        for blueprint in blueprints:
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-            
+        for row, blueprint in enumerate(blueprints):
             # Set ID
             id_item = QTableWidgetItem(str(blueprint.id))
             id_item.setData(Qt.UserRole, blueprint.id)  # Store the actual ID for later use
@@ -259,15 +276,12 @@ class BlueprintBrowserTab(QWidget):
             # Set Name
             self.results_table.setItem(row, 1, QTableWidgetItem(blueprint.name))
             
-            # Set Products - get the product names for this blueprint
-            products = self.db.query(BlueprintProduct).filter_by(blueprint_id=blueprint.id).all()
-            product_names = []
-            for product in products:
-                item = self.db.query(Item).filter_by(id=product.product_id).first()
-                if item:
-                    product_names.append(f"{item.name} ({product.quantity})")
-            
-            self.results_table.setItem(row, 2, QTableWidgetItem(", ".join(product_names)))
+            # Set Products
+            self.results_table.setItem(row, 2, QTableWidgetItem(", ".join(product_names[blueprint.id])))
+        
+        self.results_table.blockSignals(False)
+        self.results_table.setSortingEnabled(sorting_enabled)
+        self.results_table.setUpdatesEnabled(True)
         
         # Resize columns to contents
         self.results_table.resizeColumnsToContents()
@@ -342,26 +356,31 @@ class BlueprintBrowserTab(QWidget):
         self.products_table.setRowCount(0)
         self.products_table.clearContents()
         
-        # Get products for this blueprint
-        products = self.db.query(BlueprintProduct).filter_by(blueprint_id=blueprint_id).all()
+        # Get products for this blueprint, with their item names from the same query
+        products = (
+            self.db.query(BlueprintProduct.product_id, Item.name, BlueprintProduct.quantity)
+            .outerjoin(Item, Item.id == BlueprintProduct.product_id)
+            .filter(BlueprintProduct.blueprint_id == blueprint_id)
+            .order_by(BlueprintProduct.id)
+            .all()
+        )
         logger.debug(f"Found {len(products)} products for blueprint ID: {blueprint_id}")
         
-        for product in products:
-            row = self.products_table.rowCount()
-            self.products_table.insertRow(row)
+        # Allocate all rows up front instead of inserting them one by one
+        self.products_table.setRowCount(len(products))
+        for row, (product_id, name, quantity) in enumerate(products):
             
             # Set Product ID
-            self.products_table.setItem(row, 0, QTableWidgetItem(str(product.product_id)))
+            self.products_table.setItem(row, 0, QTableWidgetItem(str(product_id)))
             
             # Set Product Name
-            item = self.db.query(Item).filter_by(id=product.product_id).first()
-            name = item.name if item else "Unknown"
+            name = name if name is not None else "Unknown"
             self.products_table.setItem(row, 1, QTableWidgetItem(name))
             
             # Set Quantity
-            self.products_table.setItem(row, 2, QTableWidgetItem(str(product.quantity)))
+            self.products_table.setItem(row, 2, QTableWidgetItem(str(quantity)))
             
-            logger.debug(f"Added product: {name} (ID: {product.product_id}, Quantity: {product.quantity})")
+            logger.debug(f"Added product: {name} (ID: {product_id}, Quantity: {quantity})")
         
         # Resize columns to contents
         self.products_table.resizeColumnsToContents()
@@ -382,26 +401,31 @@ class BlueprintBrowserTab(QWidget):
         self.materials_table.setRowCount(0)
         self.materials_table.clearContents()
         
-        # Get materials for this blueprint
-        materials = self.db.query(BlueprintMaterial).filter_by(blueprint_id=blueprint_id).all()
+        # Get materials for this blueprint, with their item names from the same query
+        materials = (
+            self.db.query(BlueprintMaterial.material_id, Item.name, BlueprintMaterial.quantity)
+            .outerjoin(Item, Item.id == BlueprintMaterial.material_id)
+            .filter(BlueprintMaterial.blueprint_id == blueprint_id)
+            .order_by(BlueprintMaterial.id)
+            .all()
+        )
         logger.debug(f"Found {len(materials)} materials for blueprint ID: {blueprint_id}")
         
-        for material in materials:
-            row = self.materials_table.rowCount()
-            self.materials_table.insertRow(row)
+        # Allocate all rows up front instead of inserting them one by one
+        self.materials_table.setRowCount(len(materials))
+        for row, (material_id, name, quantity) in enumerate(materials):
             
             # Set Material ID
-            self.materials_table.setItem(row, 0, QTableWidgetItem(str(material.material_id)))
+            self.materials_table.setItem(row, 0, QTableWidgetItem(str(material_id)))
             
             # Set Material Name
-            item = self.db.query(Item).filter_by(id=material.material_id).first()
-            name = item.name if item else "Unknown"
+            name = name if name is not None else "Unknown"
             self.materials_table.setItem(row, 1, QTableWidgetItem(name))
             
             # Set Quantity
-            self.materials_table.setItem(row, 2, QTableWidgetItem(str(material.quantity)))
+            self.materials_table.setItem(row, 2, QTableWidgetItem(str(quantity)))
             
-            logger.debug(f"Added material: {name} (ID: {material.material_id}, Quantity: {material.quantity})")
+            logger.debug(f"Added material: {name} (ID: {material_id}, Quantity: {quantity})")
         
         # Resize columns to contents
         self.materials_table.resizeColumnsToContents()
@@ -426,9 +450,9 @@ class BlueprintBrowserTab(QWidget):
         activities = self.db.query(BlueprintActivity).filter_by(blueprint_id=blueprint_id).all()
         logger.debug(f"Found {len(activities)} activities for blueprint ID: {blueprint_id}")
         
-        for activity in activities:
-            row = self.activities_table.rowCount()
-            self.activities_table.insertRow(row)
+        # Allocate all rows up front instead of inserting them one by one
+        self.activities_table.setRowCount(len(activities))
+        for row, activity in enumerate(activities):
             
             # Set Activity Name
             self.activities_table.setItem(row, 0, QTableWidgetItem(activity.activity_name))
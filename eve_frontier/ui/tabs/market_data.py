@@ -13,26 +13,32 @@ Implementation features:
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+import sys
+import threading
+from typing import Optional, Dict, Any
 import datetime
 import random
+from concurrent.futures import Future, ThreadPoolExecutor
 from collections import defaultdict
+from functools import lru_cache, partial
+
+import numpy as np
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-    QComboBox, QTableWidget, QTableWidgetItem, QTabWidget,
+    QComboBox, QTabWidget,
     QPushButton, QGroupBox, QFormLayout, QSplitter, QHeaderView,
     QCheckBox, QScrollArea, QSpinBox, QTreeWidget, QTreeWidgetItem,
     QFrame, QSizePolicy, QDateEdit, QApplication, QMessageBox,
     QTableView
 )
-from PySide6.QtCore import Qt, Signal, Slot, QSize, QDate, QObject, QThread, QTimer, QAbstractTableModel, QModelIndex
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QDate, QDateTime, QEvent, QObject, QTimer, QAbstractTableModel, QModelIndex, QPointF
 from PySide6.QtGui import QFont, QIcon, QPainter, QColor
 from PySide6.QtCharts import QChart, QChartView, QLineSeries, QDateTimeAxis, QValueAxis
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
-from eve_frontier.models import Item, TradingHub, MarketData, MarketHistory
+from eve_frontier.models import Item, Group, TradingHub, MarketData, MarketHistory
 from eve_frontier.services.search_service import SearchService
 from eve_frontier.services.market_service import MarketService
 from eve_frontier.ui.widgets.profitability_analyzer_widget import ProfitabilityAnalyzerWidget
@@ -44,198 +50,377 @@ RESULTS_COLUMNS = ["Item", "Category"]
 HUB_COMPARISON_COLUMNS = ["Trading Hub", "Sell Price", "Buy Price", "Spread"]
 ORDER_COLUMNS = ["Price", "Quantity", "Location", "Updated"]
 
+# Maximum number of points pushed into a chart series
+MAX_CHART_POINTS = 2000
+
+# Series animations are skipped above this many points
+CHART_ANIMATION_MAX_POINTS = 500
+
+# Hub comparisons with more hubs than this compute spreads with numpy
+HUB_VECTORIZE_MIN = 16
+
 
-class DataLoader(QThread):
+def _decimate(ts: np.ndarray, px: np.ndarray, max_points: int):
     """
-    Background thread for loading data without freezing the UI.
+    Stride-decimate a time series to at most max_points samples.
     
-    Features:
-    - Safe cancellation mechanism using a flag instead of direct termination
-    - Proper signal handling for communication with the main thread
-    - Status tracking to monitor active state
+    Args:
+        ts: Timestamps in milliseconds
+        px: Prices matching ts
+        max_points: Maximum number of samples to keep
+        
+    Returns:
+        Tuple of (timestamps, prices) arrays
     """
+    if len(ts) <= max_points:
+        return ts, px
+    idx = np.linspace(0, len(ts) - 1, max_points).astype(np.int64)
+    return ts[idx], px[idx]
+
+
+@lru_cache(maxsize=4096)
+def _fmt_isk(price) -> str:
+    """Format a price as an ISK string, caching repeated values."""
+    return f"{price:,.2f} ISK"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_qty(volume) -> str:
+    """Format a quantity with thousands separators, caching repeated values."""
+    return f"{volume:,}"
+
+
+class LoadingOverlayFilter(QObject):
+    """
+    Event filter that keeps a loading overlay sized to the widget it covers.
     
-    # Define signals for communication with the main thread
-    finished = Signal(bool, str)  # Success flag, error message if any
+    The filter is owned by the overlay, so deleting the overlay removes it too.
+    """
     
-    def __init__(self, market_service):
+    def __init__(self, overlay: QLabel):
         """
-        Initialize the data loader thread.
+        Initialize the filter.
         
         Args:
-            market_service: The market service to use for data loading
+            overlay: The overlay label to resize
+        """
+        super().__init__(overlay)
+        self._overlay = overlay
+    
+    def eventFilter(self, obj, event):
+        """Resize the overlay along with the watched widget."""
+        if event.type() == QEvent.Resize:
+            self._overlay.resize(event.size())
+        return False
+
+
+class OrderBookModel(QAbstractTableModel):
+    """
+    Model for order book data following the Qt Model-View architecture.
+    """
+    
+    def __init__(self, orders=None, station_names=None):
+        """
+        Initialize the order book model.
+        
+        Args:
+            orders: List of order objects
+            station_names: Dictionary mapping station IDs to names
         """
         super().__init__()
-        self.market_service = market_service
-        self._is_running = False
-        self._should_cancel = False
+        self.orders = orders or []
+        self.station_names = self._normalize_station_names(station_names)
+        self.headers = ORDER_COLUMNS
+        self._order_ids, self._cols = self._build_columns(self.orders)
     
-    def run(self):
-        """Run the data loading operation in the background thread."""
-        self._is_running = True
-        self._should_cancel = False
-        try:
-            while not self._should_cancel:
-                logger.info("Starting background market data reload")
-                
-                # Perform the data loading operation
-                success = self.market_service.reload_market_data()
-                
-                # Check if we should cancel after loading
-                if self._should_cancel:
-                    logger.info("Background market data reload was cancelled after loading")
-                    self.finished.emit(False, "Operation cancelled")
-                    break
-                    
-                if success:
-                    logger.info("Background market data reload completed successfully")
-                    self.finished.emit(True, "")
-                else:
-                    logger.error("Background market data reload failed")
-                    self.finished.emit(False, "Failed to reload market data")
-                
-                # Only run once, not in a continuous loop
-                break
-                
-        except Exception as e:
-            logger.error(f"Error in background market data reload: {e}", exc_info=True)
-            self.finished.emit(False, str(e))
-        finally:
-            self._is_running = False
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of rows in the model."""
+        return len(self.orders)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns in the model."""
+        return len(self.headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Return data for the given index and role.
+        
+        Args:
+            index: Model index to get data for
+            role: Data role (display, edit, etc.)
             
-    def cancel(self):
+        Returns:
+            Data for the given index and role
         """
-        Request cancellation of the operation.
+        if role == Qt.DisplayRole and index.isValid():
+            return self._cols[index.column()][index.row()]
         
-        Sets the cancellation flag that will be checked during execution to allow
-        for graceful termination of the thread instead of using terminate().
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        Return header data for the given section, orientation, and role.
+        
+        Args:
+            section: Header section index
+            orientation: Header orientation (horizontal or vertical)
+            role: Data role (display, edit, etc.)
+            
+        Returns:
+            Header data for the given section, orientation, and role
+        """
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            if 0 <= section < len(self.headers):
+                return self.headers[section]
+        
+        return None
+        
+    def setOrders(self, orders, station_names=None):
+        """
+        Set the orders for the model.
+        
+        Args:
+            orders: List of order objects
+            station_names: Dictionary mapping station IDs to names
+        """
+        self.beginResetModel()
+        self.orders = orders or []
+        if station_names:
+            self.station_names = self._normalize_station_names(station_names)
+        self._order_ids, self._cols = self._build_columns(self.orders)
+        self.endResetModel()
+    
+    def setOrdersIncremental(self, orders, station_names=None):
+        """
+        Update the orders in place, emitting only row and cell deltas.
+        
+        Orders are matched by ID. Rows whose orders disappeared are removed,
+        new orders are inserted at their positions and changed cells emit
+        dataChanged. Falls back to a full reset when IDs are missing or
+        duplicated, or when the surviving orders were reordered.
+        
+        Args:
+            orders: List of order objects
+            station_names: Dictionary mapping station IDs to names
+        """
+        orders = orders or []
+        if station_names:
+            self.station_names = self._normalize_station_names(station_names)
+        new_ids, new_cols = self._build_columns(orders)
+        
+        new_id_set = set(new_ids)
+        old_id_set = set(self._order_ids)
+        if (None in new_id_set or len(new_id_set) != len(new_ids)
+                or None in old_id_set or len(old_id_set) != len(self._order_ids)):
+            self.setOrders(orders)
+            return
+        
+        kept_ids = [order_id for order_id in new_ids if order_id in old_id_set]
+        if kept_ids != [order_id for order_id in self._order_ids if order_id in new_id_set]:
+            self.setOrders(orders)
+            return
+        
+        self.orders = list(self.orders)
+        
+        # Remove vanished orders bottom-up so earlier row numbers stay valid
+        for row in reversed(range(len(self._order_ids))):
+            if self._order_ids[row] not in new_id_set:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._order_ids[row]
+                del self.orders[row]
+                for col in self._cols:
+                    del col[row]
+                self.endRemoveRows()
+        
+        # Insert new orders at their final positions
+        for row, order_id in enumerate(new_ids):
+            if row >= len(self._order_ids) or self._order_ids[row] != order_id:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._order_ids.insert(row, order_id)
+                self.orders.insert(row, orders[row])
+                for col, new_col in zip(self._cols, new_cols):
+                    col.insert(row, new_col[row])
+                self.endInsertRows()
+        
+        # Refresh the cells of kept orders whose values changed
+        changed_rows = [
+            row for row in range(len(new_ids))
+            if any(col[row] != new_col[row] for col, new_col in zip(self._cols, new_cols))
+        ]
+        self.orders = list(orders)
+        self._cols = new_cols
+        if changed_rows:
+            self.dataChanged.emit(
+                self.index(changed_rows[0], 0),
+                self.index(changed_rows[-1], len(self.headers) - 1),
+                [Qt.DisplayRole]
+            )
+    
+    @staticmethod
+    def _normalize_station_names(station_names) -> Dict[int, str]:
         """
-        logger.info("Cancellation requested for data loader")
-        self._should_cancel = True
+        Normalize a station name mapping to int keys and interned names.
+        
+        Args:
+            station_names: Dictionary mapping station IDs (int or str) to names
             
-    def is_active(self):
+        Returns:
+            Dictionary mapping int station IDs to interned name strings
+        """
+        return {int(k): sys.intern(str(v)) for k, v in (station_names or {}).items()}
+    
+    def _build_columns(self, orders):
         """
-        Check if the thread is still processing data.
+        Precompute the order IDs and display strings for every cell of orders.
+        
+        The order format (dict or model object) is detected once per call so
+        that data() is reduced to a single list lookup per cell.
         
+        Args:
+            orders: List of order objects
+            
         Returns:
-            bool: True if the thread is still running, False otherwise
+            Tuple of (order IDs, per-column lists of display strings indexed [column][row])
         """
-        return self._is_running
+        if orders and isinstance(orders[0], dict):
+            order_ids = [order.get('id', order.get('order_id')) for order in orders]
+            prices = [order.get('buy_price', order.get('sell_price')) for order in orders]
+            volumes = [order.get('buy_volume', order.get('sell_volume')) for order in orders]
+            station_ids = [order.get('station_id') for order in orders]
+            timestamps = [order.get('timestamp') for order in orders]
+        else:
+            order_ids = [getattr(order, 'id', None) for order in orders]
+            prices = [getattr(order, 'buy_price', None) or getattr(order, 'sell_price', None) for order in orders]
+            volumes = [getattr(order, 'buy_volume', None) or getattr(order, 'sell_volume', None) for order in orders]
+            station_ids = [getattr(order, 'station_id', None) for order in orders]
+            timestamps = [getattr(order, 'timestamp', None) for order in orders]
+        
+        # Orders loaded together often share timestamps; format each one once
+        ts_cache = {}
+        
+        def fmt_ts(ts):
+            text = ts_cache.get(ts)
+            if text is None:
+                text = ts.strftime("%Y-%m-%d %H:%M") if hasattr(ts, 'strftime') else str(ts)
+                ts_cache[ts] = text
+            return text
+        
+        station_names = self.station_names
+        return order_ids, [
+            [_fmt_isk(price) if price else "0.00 ISK" for price in prices],
+            [_fmt_qty(volume) if volume else "0" for volume in volumes],
+            [
+                station_names.get(int(station_id), f"Station {station_id}") if station_id is not None else "Unknown"
+                for station_id in station_ids
+            ],
+            [fmt_ts(ts) if ts else "Unknown" for ts in timestamps],
+        ]
 
 
-class OrderLoader(QThread):
+class ResultsModel(QAbstractTableModel):
     """
-    Background thread for loading market orders without freezing the UI.
-    
-    Features:
-    - Safe cancellation mechanism using a flag instead of direct termination
-    - Proper signal handling for communicating loaded data back to the main thread
-    - Status tracking to monitor active state
+    Model for item search results following the Qt Model-View architecture.
     """
     
-    # Define signals for communication with the main thread
-    orders_loaded = Signal(list, list)  # buy_orders, sell_orders
-    error_occurred = Signal(str)  # error message
-    
-    def __init__(self, market_service, item_id, trading_hub_id=None, limit=20):
+    def __init__(self, rows=None):
         """
-        Initialize the order loader thread.
+        Initialize the results model.
         
         Args:
-            market_service: The market service to use for data loading
-            item_id: The ID of the item to load orders for
-            trading_hub_id: Optional trading hub ID for reference (not used in query)
-            limit: Maximum number of orders to load
+            rows: List of (item_id, name, category) tuples
         """
         super().__init__()
-        self.market_service = market_service
-        self.item_id = item_id
-        self.trading_hub_id = trading_hub_id
-        self.limit = limit
-        self._is_running = False
-        self._should_cancel = False
+        self.rows = rows or []
+        self.headers = RESULTS_COLUMNS
     
-    def run(self):
-        """Run the order loading operation in the background thread."""
-        self._is_running = True
-        self._should_cancel = False
-        try:
-            while not self._should_cancel:
-                logger.info(f"Starting background order loading for item {self.item_id}")
-                
-                # Load buy orders - don't filter by region_id since it's not supported
-                buy_orders = self.market_service.get_market_data(
-                    item_id=self.item_id,
-                    order_type="buy",
-                    limit=self.limit
-                )
-                
-                # Check for cancellation
-                if self._should_cancel:
-                    logger.info(f"Background order loading for item {self.item_id} was cancelled after loading buy orders")
-                    self.error_occurred.emit("Operation cancelled")
-                    break
-                
-                # Load sell orders - don't filter by region_id since it's not supported
-                sell_orders = self.market_service.get_market_data(
-                    item_id=self.item_id,
-                    order_type="sell",
-                    limit=self.limit
-                )
-                
-                logger.info(f"Loaded {len(buy_orders)} buy orders and {len(sell_orders)} sell orders")
-                self.orders_loaded.emit(buy_orders, sell_orders)
-                
-                # Only run once, not in a continuous loop
-                break
-                
-        except Exception as e:
-            logger.error(f"Error in background order loading: {e}", exc_info=True)
-            self.error_occurred.emit(str(e))
-        finally:
-            self._is_running = False
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of rows in the model."""
+        return len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns in the model."""
+        return len(self.headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Return data for the given index and role.
+        
+        The item ID is exposed through Qt.UserRole on every column.
+        
+        Args:
+            index: Model index to get data for
+            role: Data role (display, edit, etc.)
             
-    def cancel(self):
+        Returns:
+            Data for the given index and role
         """
-        Request cancellation of the operation.
+        if not index.isValid():
+            return None
         
-        Sets the cancellation flag that will be checked during execution to allow
-        for graceful termination of the thread instead of using terminate().
+        if role == Qt.DisplayRole:
+            return self.rows[index.row()][index.column() + 1]
+        if role == Qt.UserRole:
+            return self.rows[index.row()][0]
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
         """
-        logger.info(f"Cancellation requested for order loader (item {self.item_id})")
-        self._should_cancel = True
+        Return header data for the given section, orientation, and role.
+        
+        Args:
+            section: Header section index
+            orientation: Header orientation (horizontal or vertical)
+            role: Data role (display, edit, etc.)
             
-    def is_active(self):
+        Returns:
+            Header data for the given section, orientation, and role
         """
-        Check if the thread is still processing data.
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            if 0 <= section < len(self.headers):
+                return self.headers[section]
         
-        Returns:
-            bool: True if the thread is still running, False otherwise
+        return None
+    
+    def setItems(self, items, default_category=""):
+        """
+        Set the search results from a list of Item objects.
+        
+        Args:
+            items: List of Item objects
+            default_category: Category text for items without a category
         """
-        return self._is_running
+        self.beginResetModel()
+        self.rows = [
+            (
+                item.id,
+                item.name,
+                item.group.category.name if item.group and item.group.category else default_category,
+            )
+            for item in items
+        ]
+        self.endResetModel()
 
 
-class OrderBookModel(QAbstractTableModel):
+class HubComparisonModel(QAbstractTableModel):
     """
-    Model for order book data following the Qt Model-View architecture.
+    Model for the trading hub price comparison following the Qt Model-View architecture.
     """
     
-    def __init__(self, orders=None, station_names=None):
+    def __init__(self, rows=None):
         """
-        Initialize the order book model.
+        Initialize the hub comparison model.
         
         Args:
-            orders: List of order objects
-            station_names: Dictionary mapping station IDs to names
+            rows: List of preformatted (hub_name, sell, buy, spread) string tuples
         """
         super().__init__()
-        self.orders = orders or []
-        self.station_names = station_names or {}
-        self.headers = ORDER_COLUMNS
+        self.rows = rows or []
+        self.headers = HUB_COMPARISON_COLUMNS
     
     def rowCount(self, parent=QModelIndex()):
         """Return the number of rows in the model."""
-        return len(self.orders)
+        return len(self.rows)
     
     def columnCount(self, parent=QModelIndex()):
         """Return the number of columns in the model."""
@@ -252,63 +437,11 @@ class OrderBookModel(QAbstractTableModel):
         Returns:
             Data for the given index and role
         """
-        if not index.isValid() or not (0 <= index.row() < len(self.orders)):
+        if not index.isValid() or role != Qt.DisplayRole:
             return None
         
-        order = self.orders[index.row()]
-        column = index.column()
-        
-        if role == Qt.DisplayRole:
-            # Price column
-            if column == 0:
-                price = None
-                # Handle different order data formats safely
-                if isinstance(order, dict):
-                    price = order.get('buy_price', order.get('sell_price'))
-                else:
-                    price = getattr(order, 'buy_price', None) or getattr(order, 'sell_price', None)
-                
-                return f"{price:,.2f} ISK" if price else "0.00 ISK"
-            
-            # Quantity column
-            elif column == 1:
-                volume = None
-                # Handle different order data formats safely
-                if isinstance(order, dict):
-                    volume = order.get('buy_volume', order.get('sell_volume'))
-                else:
-                    volume = getattr(order, 'buy_volume', None) or getattr(order, 'sell_volume', None)
-                
-                return f"{volume:,}" if volume else "0"
-            
-            # Location column
-            elif column == 2:
-                station_id = None
-                # Handle different order data formats safely
-                if isinstance(order, dict):
-                    station_id = order.get('station_id')
-                else:
-                    station_id = getattr(order, 'station_id', None)
-                
-                if station_id is not None:
-                    # Convert to string for lookup to ensure consistency
-                    return self.station_names.get(station_id, f"Station {station_id}")
-                return "Unknown"
-            
-            # Updated column
-            elif column == 3:
-                timestamp = None
-                # Handle different order data formats safely
-                if isinstance(order, dict):
-                    timestamp = order.get('timestamp')
-                else:
-                    timestamp = getattr(order, 'timestamp', None)
-                
-                if timestamp:
-                    return timestamp.strftime("%Y-%m-%d %H:%M") if hasattr(timestamp, 'strftime') else str(timestamp)
-                return "Unknown"
-        
-        return None
+        # Rows are formatted once when set, so painting is a plain lookup
+        return self.rows[index.row()][index.column()]
     
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         """
@@ -327,25 +460,35 @@ class OrderBookModel(QAbstractTableModel):
                 return self.headers[section]
         
         return None
-        
-    def setOrders(self, orders, station_names=None):
+    
+    def setRows(self, rows):
         """
-        Set the orders for the model.
+        Set the comparison rows for the model.
         
         Args:
-            orders: List of order objects
-            station_names: Dictionary mapping station IDs to names
+            rows: List of preformatted (hub_name, sell, buy, spread) string tuples
         """
         self.beginResetModel()
-        self.orders = orders or []
-        if station_names:
-            self.station_names = station_names
+        self.rows = rows or []
         self.endResetModel()
 
 
 class MarketDataTab(QWidget):
     """Market Data tab for viewing and analyzing market data."""
     
+    # Results of background jobs, emitted from pool threads and delivered
+    # to the UI thread through queued connections
+    _orders_ready = Signal(int, object)  # token, (buy_orders, sell_orders, station_names)
+    _orders_failed = Signal(int, str)  # token, error message
+    _orders_cancelled = Signal(int)  # token
+    _reload_finished = Signal(object, str)  # reloaded unified market data or None, error message if any
+    _price_history_ready = Signal(int, object)  # token, chart data
+    _price_history_failed = Signal(int, str)  # token, error message
+    _price_history_cancelled = Signal(int)  # token
+    
+    # Emitted after market data was reloaded, so other tabs can drop stale caches
+    market_data_reloaded = Signal()
+    
     def __init__(self, db: Session):
         """
         Initialize the Market Data tab.
@@ -363,10 +506,53 @@ class MarketDataTab(QWidget):
         # State tracking
         self.selected_item_id = None
         self.selected_trading_hub_id = None
-        
-        # Thread tracking
-        self._active_data_loader = None
-        self._active_order_loader = None
+        self._order_book_item_id = None
+        
+        # (item_id, hub_id) currently displayed; re-selecting it skips the refresh
+        self._last_shown = (None, None)
+        
+        # Unified market data for hub comparison, dropped whenever data is reloaded
+        self._unified_cache: Optional[Dict] = None
+        
+        # Background work runs on a bounded pool owned by the tab; each pool
+        # thread keeps its own session and MarketService, since sessions cannot
+        # be shared between threads, and the service keeps its caches across jobs
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="market")
+        self._worker_local = threading.local()
+        
+        # Bumped after each reload so worker services adopt the reloaded data
+        self._market_data_generation = 0
+        self._reloaded_market_data: Optional[Dict] = None
+        self._order_future: Optional[Future] = None
+        self._reload_future: Optional[Future] = None
+        self._orders_ready.connect(self._on_orders_ready)
+        self._orders_failed.connect(self._on_orders_failed)
+        self._orders_cancelled.connect(self._on_orders_cancelled)
+        
+        # Monotonic token of the latest order book request; older results are dropped
+        self._request_seq = 0
+        self._reload_finished.connect(self._on_data_reload_finished)
+        
+        # Price history is loaded on the pool the same way, with its own token
+        self._price_future: Optional[Future] = None
+        self._price_request_seq = 0
+        self._price_history_ready.connect(self._on_price_history_ready)
+        self._price_history_failed.connect(self._on_price_history_failed)
+        self._price_history_cancelled.connect(self._on_price_history_cancelled)
+        
+        # Debounce searches triggered while typing
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self._do_search)
+        
+        # Only show the busy cursor for loads that take longer than 100 ms
+        self._busy_widget_count = 0
+        self._busy_cursor_shown = False
+        self._busy_timer = QTimer(self)
+        self._busy_timer.setSingleShot(True)
+        self._busy_timer.setInterval(100)
+        self._busy_timer.timeout.connect(self._show_busy_cursor)
         
         # Initialize UI
         self._init_ui()
@@ -383,61 +569,27 @@ class MarketDataTab(QWidget):
         """
         Clean up resources when the widget is being closed.
         
-        Implements a safe shutdown process:
-        1. Calls _clean_up_threads to ensure all background threads are terminated
-        2. Processes events to allow thread cleanup operations to complete
-        3. Uses a timer to ensure thread cleanup has fully completed before proceeding
-        4. Only then allows the original close event to proceed
+        Cancels queued background jobs and blocks until jobs that are already
+        running have finished, then lets the close event proceed once.
         
         Args:
             event: Close event
         """
-        # Clean up any running threads
         self._clean_up_threads()
+        self._pool.shutdown(wait=True, cancel_futures=True)
         
-        # Process events to allow thread cleanup operations to complete
-        QApplication.processEvents()
-        
-        # Ensure threads are really gone before continuing
-        QTimer.singleShot(100, lambda: super().closeEvent(event))
-        
-        # Continue with original close event for now
         super().closeEvent(event)
     
     def _clean_up_threads(self):
         """
-        Clean up any running background threads.
-        
-        Implements a robust thread cleanup strategy:
-        1. Requests cancellation of the thread using the cancel() method
-        2. Calls quit() to stop the event loop
-        3. Waits for the thread to finish with a timeout
-        4. Only uses terminate() as a last resort if the thread doesn't exit cleanly
-        5. Properly nullifies thread references to avoid memory leaks
-        """
-        # Clean up data loader thread
-        if self._active_data_loader:
-            logger.info("Cleaning up data loader thread")
-            if self._active_data_loader.isRunning():
-                self._active_data_loader.cancel()
-                self._active_data_loader.quit()
-                if not self._active_data_loader.wait(3000):  # 3 second timeout
-                    logger.warning("Data loader thread did not exit cleanly, forcing termination")
-                    self._active_data_loader.terminate()
-                    self._active_data_loader.wait()
-            self._active_data_loader = None
-
-        # Clean up order loader thread
-        if self._active_order_loader:
-            logger.info("Cleaning up order loader thread")
-            if self._active_order_loader.isRunning():
-                self._active_order_loader.cancel()
-                self._active_order_loader.quit()
-                if not self._active_order_loader.wait(3000):  # 3 second timeout
-                    logger.warning("Order loader thread did not exit cleanly, forcing termination")
-                    self._active_order_loader.terminate()
-                    self._active_order_loader.wait()
-            self._active_order_loader = None
+        Cancel background jobs that have not started yet.
+        
+        Jobs already running on the pool cannot be interrupted; their results
+        are still delivered to the UI thread when they finish.
+        """
+        for future in (self._order_future, self._price_future, self._reload_future):
+            if future is not None and future.cancel():
+                logger.info("Cancelled pending market data job")
     
     def _init_ui(self):
         """Initialize the UI components."""
@@ -476,22 +628,20 @@ class MarketDataTab(QWidget):
         # Search input
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search for items...")
-        self.search_input.textChanged.connect(self.search_items)
+        self.search_input.textChanged.connect(lambda _: self._search_timer.start())
         search_layout.addWidget(self.search_input, 3)
         
         # Category filter
         self.category_filter = QComboBox()
         self.category_filter.addItem("All Categories")
         # Populate categories
-        categories = self.search_service.get_categories()
-        for category in sorted(categories, key=lambda x: x.name):
+        for category in self.search_service.get_categories():
             self.category_filter.addItem(category.name, category.id)
-        self.category_filter.currentIndexChanged.connect(self.search_items)
+        self.category_filter.currentIndexChanged.connect(self._do_search)
         search_layout.addWidget(self.category_filter, 1)
         
         # Search button
         self.search_button = QPushButton("Search")
-        self.search_button.clicked.connect(self.search_items)
         search_layout.addWidget(self.search_button)
         
         # Reload market data button
@@ -510,14 +660,13 @@ class MarketDataTab(QWidget):
         results_layout = QVBoxLayout()
         
         # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(len(RESULTS_COLUMNS))
-        self.results_table.setHorizontalHeaderLabels(RESULTS_COLUMNS)
+        self.results_table = QTableView()
+        self.results_model = ResultsModel()
+        self.results_table.setModel(self.results_model)
         self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.results_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.results_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.results_table.itemSelectionChanged.connect(self.update_market_data)
+        self.results_table.setSelectionBehavior(QTableView.SelectRows)
+        self.results_table.setSelectionMode(QTableView.SingleSelection)
         
         results_layout.addWidget(self.results_table)
         self.results_group.setLayout(results_layout)
@@ -565,23 +714,18 @@ class MarketDataTab(QWidget):
         hub_selection_layout = QHBoxLayout()
         hub_selection_layout.addWidget(QLabel("Select Trading Hubs:"))
         
-        # Trading hub checkboxes
+        # Trading hub checkboxes are created by _load_trading_hubs
         self.hub_checkboxes = {}
-        self.trading_hubs = self.market_service.get_trading_hubs()
-        
-        for hub in self.trading_hubs:
-            checkbox = QCheckBox(hub.get('name', str(hub.get('id'))))
-            checkbox.setChecked(True)
-            checkbox.stateChanged.connect(self.update_hub_comparison)
-            self.hub_checkboxes[hub.get('id')] = checkbox
-            hub_selection_layout.addWidget(checkbox)
+        self.trading_hubs = []
+        self._hub_name_by_id = {}
+        self.hub_selection_layout = hub_selection_layout
         
         trading_hubs_layout.addLayout(hub_selection_layout)
         
         # Hub comparison table
-        self.hub_comparison_table = QTableWidget()
-        self.hub_comparison_table.setColumnCount(len(HUB_COMPARISON_COLUMNS))
-        self.hub_comparison_table.setHorizontalHeaderLabels(HUB_COMPARISON_COLUMNS)
+        self.hub_comparison_table = QTableView()
+        self.hub_comparison_model = HubComparisonModel()
+        self.hub_comparison_table.setModel(self.hub_comparison_model)
         self.hub_comparison_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         
         trading_hubs_layout.addWidget(self.hub_comparison_table)
@@ -660,18 +804,33 @@ class MarketDataTab(QWidget):
         # Create layout for profitability tab
         profitability_layout = QVBoxLayout(self.profitability_tab)
         
-        # Create profitability analyzer widget
-        self.profitability_analyzer = ProfitabilityAnalyzerWidget(self.db)
-        profitability_layout.addWidget(self.profitability_analyzer)
+        # The analyzer widget is created on first activation of the tab
+        self.profitability_analyzer = None
+        self._profitability_placeholder = QLabel("Loading...")
+        self._profitability_placeholder.setAlignment(Qt.AlignCenter)
+        profitability_layout.addWidget(self._profitability_placeholder)
         
         # Set layout
         self.profitability_tab.setLayout(profitability_layout)
     
+    def _ensure_profitability_analyzer(self):
+        """Create the profitability analyzer widget, replacing the placeholder, once."""
+        if self.profitability_analyzer is not None:
+            return
+        
+        logger.info("Creating profitability analyzer widget")
+        self.profitability_analyzer = ProfitabilityAnalyzerWidget(self.db)
+        
+        layout = self.profitability_tab.layout()
+        layout.replaceWidget(self._profitability_placeholder, self.profitability_analyzer)
+        self._profitability_placeholder.deleteLater()
+        self._profitability_placeholder = None
+    
     def _connect_signals(self):
         """Connect signals to slots."""
-        self.search_button.clicked.connect(self.search_items)
-        self.search_input.returnPressed.connect(self.search_items)
-        self.results_table.itemSelectionChanged.connect(self.update_market_data)
+        self.search_button.clicked.connect(self._do_search)
+        self.search_input.returnPressed.connect(self._do_search)
+        self.results_table.selectionModel().selectionChanged.connect(self.update_market_data)
         self.update_chart_button.clicked.connect(self.update_price_chart)
         self.reload_button.clicked.connect(self.reload_market_data)
         
@@ -694,6 +853,10 @@ class MarketDataTab(QWidget):
         # Clean up threads when leaving the Market Analysis tab (index 0)
         if index != 0:
             self._clean_up_threads()
+        
+        # Build the profitability analyzer the first time its tab is shown
+        if self.analysis_tabs.widget(index) is self.profitability_tab:
+            self._ensure_profitability_analyzer()
     
     def _load_trading_hubs(self):
         """Load trading hubs and create checkboxes."""
@@ -701,6 +864,7 @@ class MarketDataTab(QWidget):
         for checkbox in self.hub_checkboxes.values():
             checkbox.setParent(None)
         self.hub_checkboxes.clear()
+        self._hub_name_by_id = {}
         
         # Get trading hubs from the service
         self.trading_hubs = self.market_service.get_trading_hubs()
@@ -719,11 +883,15 @@ class MarketDataTab(QWidget):
                 hub_name = hub.name
                 logger.debug(f"Added hub from database: {hub_name} (ID: {hub_id})")
             
+            # Remember the name for hub comparison lookups
+            self._hub_name_by_id[str(hub_id)] = hub_name
+            
             # Create checkbox
             checkbox = QCheckBox(hub_name)
             checkbox.setChecked(True)
             checkbox.stateChanged.connect(self.update_hub_comparison)
             self.hub_checkboxes[hub_id] = checkbox
+            self.hub_selection_layout.addWidget(checkbox)
         
         logger.info(f"Created {len(self.hub_checkboxes)} trading hub checkboxes")
     
@@ -732,12 +900,11 @@ class MarketDataTab(QWidget):
         Show or hide loading indicators for a widget.
         
         Creates a semi-transparent overlay with "Loading..." text for better
-        visual feedback during long operations. Implementation features:
-        
-        1. Safe resize event handling without relying on sip.isdeleted
-        2. Proper storage and restoration of the original resize event handler
-        3. Ensures overlay is always properly sized regardless of widget resizing
-        4. Cleans up resources when the overlay is no longer needed
+        visual feedback during long operations. The overlay is kept sized to
+        the widget by a LoadingOverlayFilter installed on the widget, and both
+        are removed again when loading finishes. The application-wide busy
+        cursor is only applied once some widget has been loading for 100 ms,
+        so fast operations do not make the cursor flicker.
         
         Args:
             widget: The widget to show loading state for
@@ -745,76 +912,83 @@ class MarketDataTab(QWidget):
         """
         if not widget:
             return
-            
-        # Find existing overlay
-        overlay = widget.findChild(QLabel, "loadingOverlay")
+        
+        overlay = getattr(widget, '_loading_overlay', None)
         
         if is_loading:
-            # Set wait cursor for entire application
-            QApplication.setOverrideCursor(Qt.WaitCursor)
             widget.setEnabled(False)
             
-            # Create overlay if it doesn't exist
-            if not overlay:
-                overlay = QLabel(widget)
-                overlay.setObjectName("loadingOverlay")
-                overlay.setText("Loading...")
-                overlay.setAlignment(Qt.AlignCenter)
-                
-                # Make semi-transparent
-                overlay.setStyleSheet("""
-                    background-color: rgba(0, 0, 0, 50%);
-                    color: white;
-                    font-size: 16px;
-                    font-weight: bold;
-                    border-radius: 5px;
-                """)
-                
-                # Size the overlay to cover the widget
-                overlay.setFixedSize(widget.size())
-                
-                # Center in parent widget
-                overlay.move(0, 0)
-                
-                # Store original resize event handler
-                if not hasattr(widget, '_oldResizeEvent'):
-                    widget._oldResizeEvent = widget.resizeEvent
-                
-                # Create a safe resize handler that checks if overlay exists
-                def safeResizeHandler(event):
-                    # Check if overlay still exists by searching the widget's children
-                    overlay_obj = widget.findChild(QLabel, "loadingOverlay")
-                    if overlay_obj:
-                        overlay_obj.resize(event.size())
-                    # Call the original resize handler
-                    if hasattr(widget, '_oldResizeEvent') and widget._oldResizeEvent:
-                        widget._oldResizeEvent(event)
-                
-                # Set the new resize handler
-                widget.resizeEvent = safeResizeHandler
-                
-                # Bring to front
-                overlay.raise_()
-                overlay.show()
+            # Already loading: keep the existing overlay and cursor state
+            if overlay is not None:
+                return
+            
+            # Arm the busy cursor when the first widget starts loading
+            self._busy_widget_count += 1
+            if self._busy_widget_count == 1 and not self._busy_cursor_shown:
+                self._busy_timer.start()
+            
+            # Create overlay
+            overlay = QLabel(widget)
+            overlay.setObjectName("loadingOverlay")
+            overlay.setText("Loading...")
+            overlay.setAlignment(Qt.AlignCenter)
+            
+            # Make semi-transparent
+            overlay.setStyleSheet("""
+                background-color: rgba(0, 0, 0, 50%);
+                color: white;
+                font-size: 16px;
+                font-weight: bold;
+                border-radius: 5px;
+            """)
+            
+            # Cover the widget and follow its resizes
+            overlay.setGeometry(0, 0, widget.width(), widget.height())
+            overlay_filter = LoadingOverlayFilter(overlay)
+            widget.installEventFilter(overlay_filter)
+            widget._loading_overlay = overlay
+            widget._overlay_filter = overlay_filter
+            
+            # Bring to front
+            overlay.raise_()
+            overlay.show()
         else:
-            # Restore normal cursor
-            QApplication.restoreOverrideCursor()
             widget.setEnabled(True)
             
-            # Remove the overlay if it exists
-            if overlay:
-                # Restore original resize event
-                if hasattr(widget, '_oldResizeEvent'):
-                    widget.resizeEvent = widget._oldResizeEvent
-                    delattr(widget, '_oldResizeEvent')
-                
-                # Delete overlay safely
-                overlay.hide()
-                overlay.deleteLater()
+            # Nothing else to undo if the widget was not loading
+            if overlay is None:
+                return
+            
+            widget.removeEventFilter(widget._overlay_filter)
+            overlay.hide()
+            overlay.deleteLater()  # also deletes the filter it owns
+            widget._loading_overlay = None
+            widget._overlay_filter = None
+            
+            # Drop the busy cursor, or cancel it, once nothing is loading
+            self._busy_widget_count -= 1
+            if self._busy_widget_count == 0:
+                self._busy_timer.stop()
+                if self._busy_cursor_shown:
+                    QApplication.restoreOverrideCursor()
+                    self._busy_cursor_shown = False
+    
+    def _show_busy_cursor(self):
+        """Apply the busy cursor for loads still running after the delay."""
+        if self._busy_widget_count and not self._busy_cursor_shown:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            self._busy_cursor_shown = True
     
     @Slot()
     def search_items(self):
+        """Schedule a debounced search so rapid typing triggers a single query."""
+        self._search_timer.start()
+    
+    def _do_search(self):
         """Search for items based on the search input and category filter."""
+        # Run now and drop any pending debounced search
+        self._search_timer.stop()
+        
         # Show loading state
         self._show_loading_state(self.search_button, True)
         
@@ -838,17 +1012,14 @@ class MarketDataTab(QWidget):
             # Search for items
             items = self.search_service.search_items(search_term, category_id=category_id)
             
-            # Update results table
-            self.results_table.setRowCount(len(items))
+            # Update results model, keeping selection signals from re-entering update_market_data during the reset
+            selection_model = self.results_table.selectionModel()
+            was_blocked = selection_model.blockSignals(True)
+            try:
+                self.results_model.setItems(items)
+            finally:
+                selection_model.blockSignals(was_blocked)
             
-            for i, item in enumerate(items):
-                self.results_table.setItem(i, 0, QTableWidgetItem(item.name))
-                category_name = item.group.category.name if item.group and item.group.category else ""
-                self.results_table.setItem(i, 1, QTableWidgetItem(category_name))
-                
-                # Store item ID in the first column
-                self.results_table.item(i, 0).setData(Qt.UserRole, item.id)
-                
             logger.info(f"Found {len(items)} items matching search term '{search_term}'")
         except Exception as e:
             logger.error(f"Error searching for items: {e}", exc_info=True)
@@ -857,50 +1028,22 @@ class MarketDataTab(QWidget):
             # Restore cursor
             self._show_loading_state(self.search_button, False)
     
-    def _update_results_table(self, items: List[Item]):
-        """
-        Update the results table with the given items.
-        
-        Args:
-            items: List of Item objects to display
-        """
-        # Clear the table
-        self.results_table.clearContents()
-        self.results_table.setRowCount(0)
-        
-        # Add items to the table
-        for row, item in enumerate(items):
-            self.results_table.insertRow(row)
-            
-            # Item name
-            name_item = QTableWidgetItem(item.name)
-            name_item.setData(Qt.UserRole, item.id)  # Store item ID
-            self.results_table.setItem(row, 0, name_item)
-            
-            # Category name
-            category_name = item.group.category.name if item.group and item.group.category else "N/A"
-            category_item = QTableWidgetItem(category_name)
-            self.results_table.setItem(row, 1, category_item)
-        
-        logger.debug(f"Updated results table with {len(items)} items")
-        
-        # Clear market data 
-        self._clear_market_data()
-    
     def _clear_market_data(self):
         """Clear all market data displays."""
-        # Clear price history chart
-        self.price_chart.setChart(QChart())
+        self._last_shown = (None, None)
+        
+        # Clear the retained price history chart
+        self._history_series.clear()
+        self._sell_series.clear()
+        self._buy_series.clear()
+        self._chart.setTitle("Price History")
         
         # Clear order book tables
-        self.buy_orders_table.clearContents()
-        self.buy_orders_table.setRowCount(0)
-        self.sell_orders_table.clearContents()
-        self.sell_orders_table.setRowCount(0)
+        self.buy_order_model.setOrders([])
+        self.sell_order_model.setOrders([])
         
         # Clear hub comparison table
-        self.hub_comparison_table.clearContents()
-        self.hub_comparison_table.setRowCount(0)
+        self.hub_comparison_model.setRows([])
         
         # Clear item details
         self.item_name_label.setText("Select an item")
@@ -911,17 +1054,15 @@ class MarketDataTab(QWidget):
     @Slot()
     def update_market_data(self):
         """Update all market data displays for the current item and trading hub."""
-        # Get the selected item from the table
-        selected_items = self.results_table.selectedItems()
-        if not selected_items:
+        # Get the selected item from the results view
+        current = self.results_table.selectionModel().currentIndex()
+        if not current.isValid() or not self.results_table.selectionModel().hasSelection():
             logger.warning("No item selected in results table")
             return
         
-        # Get the item ID from the name column (column 0)
-        row = selected_items[0].row()
-        item_cell = self.results_table.item(row, 0)
-        item_name = item_cell.text()
-        item_id = item_cell.data(Qt.UserRole)
+        # Get the item ID stored on the selected row
+        item_name = current.siblingAtColumn(0).data(Qt.DisplayRole)
+        item_id = current.data(Qt.UserRole)
         self.selected_item_id = item_id
         
         logger.info(f"Selected item: '{item_name}' (ID: {item_id})")
@@ -945,6 +1086,12 @@ class MarketDataTab(QWidget):
         
         self.selected_trading_hub_id = trading_hub_id
         
+        # Nothing to refresh when the same item and hub are already shown
+        if (item_id, trading_hub_id) == self._last_shown:
+            logger.debug(f"Item ID {item_id} at hub ID {trading_hub_id} already shown")
+            return
+        self._last_shown = (item_id, trading_hub_id)
+        
         logger.info(f"Updating market data for item ID {self.selected_item_id} at hub '{trading_hub_name}' (ID: {trading_hub_id})")
         
         # Update the price history chart
@@ -956,20 +1103,60 @@ class MarketDataTab(QWidget):
         # Update the trading hub comparison
         self.update_hub_comparison()
         
-        # Update item details
-        item = self.db.query(Item).filter(Item.id == self.selected_item_id).first()
+        # Update item details, loading the group and category in the same query
+        item = (
+            self.db.query(Item)
+            .options(joinedload(Item.group).joinedload(Group.category))
+            .filter(Item.id == self.selected_item_id)
+            .first()
+        )
         if item:
             self.item_name_label.setText(item.name)
             self.item_category_label.setText(item.group.category.name if item.group and item.group.category else "")
             self.item_volume_label.setText(f"{item.volume:.2f} m³" if item.volume else "")
     
     def _create_price_chart(self):
-        """Create a chart for displaying price history."""
+        """
+        Create the chart used for displaying price history.
+        
+        The chart, its series and its axes are built once and kept for the
+        lifetime of the tab; update_price_chart only replaces their data.
+        
+        Returns:
+            Chart view displaying the price history chart
+        """
         # Create chart
         chart = QChart()
         chart.setTitle("Price History")
         chart.setAnimationOptions(QChart.SeriesAnimations)
         
+        # Create series for the traded price history and current sell/buy prices
+        self._history_series = QLineSeries()
+        self._history_series.setName("Average Price")
+        
+        self._sell_series = QLineSeries()
+        self._sell_series.setName("Sell Price")
+        
+        self._buy_series = QLineSeries()
+        self._buy_series.setName("Buy Price")
+        
+        # Create axes
+        self._date_axis = QDateTimeAxis()
+        self._date_axis.setTitleText("Date")
+        self._date_axis.setFormat("MMM dd")
+        chart.addAxis(self._date_axis, Qt.AlignBottom)
+        
+        self._value_axis = QValueAxis()
+        self._value_axis.setTitleText("Price (ISK)")
+        chart.addAxis(self._value_axis, Qt.AlignLeft)
+        
+        for series in (self._history_series, self._sell_series, self._buy_series):
+            chart.addSeries(series)
+            series.attachAxis(self._date_axis)
+            series.attachAxis(self._value_axis)
+        
+        self._chart = chart
+        
         # Create chart view
         chart_view = QChartView(chart)
         chart_view.setRenderHint(QPainter.Antialiasing)
@@ -977,90 +1164,256 @@ class MarketDataTab(QWidget):
         return chart_view
     
     def update_price_chart(self):
-        """Update the price history chart for the selected item."""
+        """
+        Update the price history chart for the selected item.
+        
+        The history is queried and downsampled on the tab's thread pool;
+        the resulting points are applied to the retained chart on the UI
+        thread. Results of superseded requests are dropped.
+        """
         if not self.selected_item_id:
             return
         
-        # Show loading state
-        self._show_loading_state(self.price_chart, True)
+        # Get date range
+        from_date = self.from_date.date().toPython()
+        to_date = self.to_date.date().toPython()
         
-        try:
-            # Get date range
-            from_date = self.from_date.date().toPython()
-            to_date = self.to_date.date().toPython()
-            
-            # Validate date range
-            if from_date > to_date:
-                QMessageBox.warning(self, "Invalid Date Range", "Start date must be before end date")
-                return
-            
-            # Get price history
-            history = self.market_service.get_market_statistics(
-                self.selected_item_id,
-                days=(to_date - from_date).days + 1
-            )
-            
-            # Clean up old chart to prevent memory leaks
-            old_chart = self.price_chart.chart()
-            if old_chart:
-                old_chart.deleteLater()
-            
-            # Create chart
-            chart = QChart()
-            chart.setTitle("Price History")
-            chart.setAnimationOptions(QChart.SeriesAnimations)
-            
-            # Create series for sell and buy prices
-            sell_series = QLineSeries()
-            sell_series.setName("Sell Price")
-            
-            buy_series = QLineSeries()
-            buy_series.setName("Buy Price")
+        # Validate date range
+        if from_date > to_date:
+            QMessageBox.warning(self, "Invalid Date Range", "Start date must be before end date")
+            return
+        
+        range_start = datetime.datetime.combine(from_date, datetime.time.min)
+        range_end = datetime.datetime.combine(to_date, datetime.time.max)
+        
+        # Tag the request so that results of superseded loads are dropped; this
+        # happens before cancelling so the cancelled job's callback is stale
+        self._price_request_seq += 1
+        token = self._price_request_seq
+        
+        # Show loading state once per burst of requests
+        if self._price_future is None:
+            self._show_loading_state(self.price_chart, True)
+        else:
+            self._price_future.cancel()
+        
+        self._price_future = self._pool.submit(
+            self._load_price_history,
+            self.selected_item_id,
+            range_start,
+            range_end
+        )
+        self._price_future.add_done_callback(partial(
+            self._forward_job_result, "price history", "_price_request_seq",
+            self._price_history_ready, self._price_history_failed, self._price_history_cancelled, token
+        ))
+    
+    def _worker_market_service(self) -> MarketService:
+        """
+        Get the calling pool thread's MarketService, creating it on first use.
+        
+        After a reload, the service adopts the reloaded market data before
+        it is used again.
+        
+        Returns:
+            MarketService bound to a session owned by the calling thread
+        """
+        local = self._worker_local
+        service = getattr(local, "market_service", None)
+        if service is None:
+            service = MarketService(Session(bind=self.db.get_bind()))
+            local.market_service = service
+            local.generation = self._market_data_generation
+        elif local.generation != self._market_data_generation:
+            local.generation = self._market_data_generation
+            service.set_unified_market_data(self._reloaded_market_data)
+        return service
+    
+    def _run_market_query(self, method_name: str, *args, **kwargs):
+        """
+        Call a method of the pool thread's MarketService.
+        
+        Runs on a pool thread. The session is closed once the call returns,
+        which detaches the returned objects; only their loaded column
+        attributes are used afterwards.
+        
+        Args:
+            method_name: Name of the MarketService method to call
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
             
-            # Add data points
-            if history and 'price_history' in history:
-                for point in history['price_history']:
-                    date = datetime.datetime.fromisoformat(point['date']).timestamp() * 1000
-                    sell_series.append(date, point['sell'])
-                    buy_series.append(date, point['buy'])
-            else:
-                # Add single data point with current price if no history
-                now = datetime.datetime.now().timestamp() * 1000
-                current_stats = self.market_service.get_market_statistics(self.selected_item_id, days=1)
-                
-                if current_stats:
-                    sell_series.append(now, current_stats.get('sell_price', 0))
-                    buy_series.append(now, current_stats.get('buy_price', 0))
-                    
-                    # Add note about limited data
-                    chart.setTitle("Price History (Limited Data Available)")
+        Returns:
+            The method's return value
+        """
+        service = self._worker_market_service()
+        try:
+            return getattr(service, method_name)(*args, **kwargs)
+        finally:
+            service.db.close()
+    
+    def _load_price_history(self, item_id: int, range_start: datetime.datetime,
+                            range_end: datetime.datetime) -> Dict[str, Any]:
+        """
+        Load and downsample the price history of an item.
+        
+        Runs on a pool thread and touches no widgets.
+        
+        Args:
+            item_id: ID of the item to chart
+            range_start: Start of the selected date range
+            range_end: End of the selected date range
             
-            # Add series to chart
-            chart.addSeries(sell_series)
-            chart.addSeries(buy_series)
+        Returns:
+            Dictionary with the series points, axis ranges and chart title
+        """
+        # Load the history rows, thinned while they stream in, and only if there
+        # are none, the current prices
+        history, current_stats = self._run_market_query(
+            "get_price_history",
+            item_id,
+            cutoff_date=range_start,
+            end_date=range_end,
+            batch_size=1000,
+            max_points=MAX_CHART_POINTS
+        )
+        
+        title = "Price History"
+        history_points = []
+        sell_points = []
+        buy_points = []
+        x_values = []
+        y_values = []
+        
+        if history:
+            # Convert the whole date column in C rather than per row
+            ts = np.array([date for date, _ in history], dtype='datetime64[ms]').astype(np.int64)
+            px = np.fromiter((price for _, price in history), dtype=np.float64, count=len(history))
             
-            # Create axes
-            date_axis = QDateTimeAxis()
-            date_axis.setTitleText("Date")
-            date_axis.setFormat("MMM dd")
-            chart.addAxis(date_axis, Qt.AlignBottom)
-            sell_series.attachAxis(date_axis)
-            buy_series.attachAxis(date_axis)
+            # Downsample to roughly screen resolution
+            ts, px = _decimate(ts, px, MAX_CHART_POINTS)
             
-            value_axis = QValueAxis()
-            value_axis.setTitleText("Price (ISK)")
-            chart.addAxis(value_axis, Qt.AlignLeft)
-            sell_series.attachAxis(value_axis)
-            buy_series.attachAxis(value_axis)
+            # History dates are naive local times; shift them to epoch milliseconds
+            utc_offset = range_end.astimezone().utcoffset()
+            ts = (ts - int(utc_offset.total_seconds() * 1000)).astype(np.float64)
+            history_points = [QPointF(t, p) for t, p in zip(ts.tolist(), px.tolist())]
+            x_values = [ts.min(), ts.max()]
+            y_values = [px.min(), px.max()]
+        elif current_stats:
+            # Add single data point with current price if no history
+            now = datetime.datetime.now().timestamp() * 1000
+            sell_price = current_stats.get('sell_price', 0)
+            buy_price = current_stats.get('buy_price', 0)
+            sell_points = [QPointF(now, sell_price)]
+            buy_points = [QPointF(now, buy_price)]
+            x_values = [now]
+            y_values = [sell_price, buy_price]
             
-            # Set the chart
-            self.price_chart.setChart(chart)
+            # Add note about limited data
+            title = "Price History (Limited Data Available)"
+        
+        # Fit the axes to the data, falling back to the selected date range
+        if x_values:
+            x_min, x_max = float(min(x_values)), float(max(x_values))
+        else:
+            x_min, x_max = range_start.timestamp() * 1000, range_end.timestamp() * 1000
+        if x_min == x_max:
+            x_min -= 12 * 3600 * 1000
+            x_max += 12 * 3600 * 1000
+        
+        y_min, y_max = (float(min(y_values)), float(max(y_values))) if y_values else (0.0, 1.0)
+        padding = (y_max - y_min) * 0.05 or max(abs(y_max) * 0.05, 1.0)
+        
+        return {
+            'title': title,
+            'history': history_points,
+            'sell': sell_points,
+            'buy': buy_points,
+            'x_range': (int(x_min), int(x_max)),
+            'y_range': (y_min - padding, y_max + padding),
+        }
+    
+    @Slot(int, object)
+    def _on_price_history_ready(self, token: int, chart_data: Dict[str, Any]):
+        """
+        Apply loaded price history if it belongs to the latest request.
+        
+        Args:
+            token: Request token the history was loaded for
+            chart_data: Series points, axis ranges and title for the chart
+        """
+        if token != self._price_request_seq:
+            logger.debug(f"Ignoring stale price history result (request {token})")
+            return
+        
+        try:
+            self._apply_price_history(chart_data)
         except Exception as e:
             logger.error(f"Error updating price chart: {e}", exc_info=True)
             QMessageBox.warning(self, "Chart Error", f"An error occurred while updating the price chart: {str(e)}")
         finally:
             # Restore cursor
             self._show_loading_state(self.price_chart, False)
+            self._price_future = None
+    
+    @Slot(int, str)
+    def _on_price_history_failed(self, token: int, error_message: str):
+        """
+        Report a price history load error if it belongs to the latest request.
+        
+        Args:
+            token: Request token the history was loaded for
+            error_message: Error message from the job
+        """
+        if token != self._price_request_seq:
+            logger.debug(f"Ignoring stale price history error (request {token})")
+            return
+        
+        logger.error(f"Error loading price history: {error_message}")
+        QMessageBox.warning(self, "Chart Error", f"An error occurred while updating the price chart: {error_message}")
+        
+        # Restore cursor
+        self._show_loading_state(self.price_chart, False)
+        self._price_future = None
+    
+    @Slot(int)
+    def _on_price_history_cancelled(self, token: int):
+        """
+        Clear the loading state of a cancelled price history load.
+        
+        Args:
+            token: Request token of the cancelled load
+        """
+        if token != self._price_request_seq:
+            return
+        
+        # The chart was not updated, so the item must load again when re-selected
+        self._show_loading_state(self.price_chart, False)
+        self._price_future = None
+        self._last_shown = (None, None)
+    
+    def _apply_price_history(self, chart_data: Dict[str, Any]):
+        """
+        Push loaded price history into the retained chart.
+        
+        Args:
+            chart_data: Series points, axis ranges and title for the chart
+        """
+        # Animating thousands of points costs more than it shows
+        animations = (QChart.SeriesAnimations if len(chart_data['history']) <= CHART_ANIMATION_MAX_POINTS
+                      else QChart.NoAnimation)
+        if self._chart.animationOptions() != animations:
+            self._chart.setAnimationOptions(animations)
+        if self._chart.title() != chart_data['title']:
+            self._chart.setTitle(chart_data['title'])
+        
+        # Push each series' points in one call
+        self._history_series.replace(chart_data['history'])
+        self._sell_series.replace(chart_data['sell'])
+        self._buy_series.replace(chart_data['buy'])
+        
+        x_min, x_max = chart_data['x_range']
+        self._date_axis.setRange(QDateTime.fromMSecsSinceEpoch(x_min), QDateTime.fromMSecsSinceEpoch(x_max))
+        self._value_axis.setRange(*chart_data['y_range'])
     
     def update_order_book(self):
         """
@@ -1069,11 +1422,10 @@ class MarketDataTab(QWidget):
         Implements thread-safe order loading:
         1. Validates that required data is available
         2. Shows loading state to provide visual feedback
-        3. Cleans up any existing order loader thread
+        3. Cancels any queued order load that has not started
         4. Resets models to handle UI state properly
-        5. Creates a new thread with proper parent-child relationship
-        6. Connects signals for handling loaded orders and errors
-        7. Tracks the active thread for proper cleanup
+        5. Submits the load to the tab's thread pool
+        6. Delivers the orders or the error back through queued signals
         """
         if not self.selected_item_id or not self.selected_trading_hub_id:
             logger.warning("Cannot update order book: No item or hub selected")
@@ -1084,42 +1436,125 @@ class MarketDataTab(QWidget):
         # Show loading state
         self._show_loading_state(self.order_book_tab, True)
         
-        # Clean up any existing order loader
-        if self._active_order_loader:
-            if self._active_order_loader.isRunning():
-                self._active_order_loader.cancel()
-                self._active_order_loader.wait()
-            self._active_order_loader = None
-        
-        # Clear existing tables
-        # Reset models to empty
-        self.buy_order_model.setOrders([])
-        self.sell_order_model.setOrders([])
-        
-        # Create the order loader thread
-        self.order_loader = OrderLoader(
-            self.market_service, 
+        # Tag the request so that results of superseded loads are dropped; this
+        # happens before cancelling so the cancelled job's callback is stale
+        self._request_seq += 1
+        token = self._request_seq
+        
+        # Drop a queued order load that has not started yet
+        if self._order_future is not None:
+            self._order_future.cancel()
+        
+        # Reset models to empty when switching to another item; refreshes of
+        # the same item are applied as deltas once the orders arrive
+        if self._order_book_item_id != self.selected_item_id:
+            self.buy_order_model.setOrders([])
+            self.sell_order_model.setOrders([])
+            self._order_book_item_id = None
+        
+        # Load the orders on the pool
+        self._order_future = self._pool.submit(
+            self._run_market_query,
+            "get_order_book",
             self.selected_item_id,
-            self.selected_trading_hub_id,
             limit=20
         )
-        self.order_loader.setParent(self)  # Ensure proper parent-child relationship
+        self._order_future.add_done_callback(partial(
+            self._forward_job_result, "order book", "_request_seq",
+            self._orders_ready, self._orders_failed, self._orders_cancelled, token
+        ))
+    
+    def _forward_job_result(self, job_name: str, seq_attr: str, ready: Signal, failed: Signal,
+                            cancelled: Signal, token: int, future: Future):
+        """
+        Forward a finished pool job to the UI thread.
+        
+        Runs on the pool thread that completed the job, or on the cancelling
+        thread for jobs cancelled before they started. Results of superseded
+        requests are dropped; a cancelled latest request is reported so its
+        loading state is cleared. The receiving slots check the token again
+        since newer requests may still arrive while the signal is queued.
+        
+        Args:
+            job_name: Name of the job used in log messages
+            seq_attr: Name of the attribute holding the job's latest request token
+            ready: Signal emitted with (token, result) on success
+            failed: Signal emitted with (token, error message) on failure
+            cancelled: Signal emitted with (token) when the job was cancelled
+            token: Request token the job was submitted with
+            future: The completed future
+        """
+        if token != getattr(self, seq_attr):
+            logger.debug(f"Dropping stale {job_name} result (request {token})")
+            return
+        
+        # The latest request was cancelled, e.g. when leaving the tab
+        if future.cancelled():
+            logger.debug(f"Cancelled {job_name} job (request {token})")
+            cancelled.emit(token)
+            return
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Error in background {job_name} loading: {e}", exc_info=True)
+            failed.emit(token, str(e))
+            return
+        
+        ready.emit(token, result)
+    
+    @Slot(int, object)
+    def _on_orders_ready(self, token: int, order_book):
+        """
+        Populate the order book if the result belongs to the latest request.
+        
+        Args:
+            token: Request token the orders were loaded for
+            order_book: Tuple of (buy orders, sell orders, station ID to name mapping)
+        """
+        if token != self._request_seq:
+            logger.debug(f"Ignoring stale order book result (request {token})")
+            return
+        self._populate_order_tables(*order_book)
+    
+    @Slot(int, str)
+    def _on_orders_failed(self, token: int, error_message: str):
+        """
+        Report an order load error if it belongs to the latest request.
         
-        # Connect signals
-        self.order_loader.orders_loaded.connect(self._populate_order_tables)
-        self.order_loader.error_occurred.connect(self._handle_order_load_error)
+        Args:
+            token: Request token the orders were loaded for
+            error_message: Error message from the job
+        """
+        if token != self._request_seq:
+            logger.debug(f"Ignoring stale order book error (request {token})")
+            return
+        self._handle_order_load_error(error_message)
+    
+    @Slot(int)
+    def _on_orders_cancelled(self, token: int):
+        """
+        Clear the loading state of a cancelled order book load.
+        
+        Args:
+            token: Request token of the cancelled load
+        """
+        if token != self._request_seq:
+            return
         
-        # Start the background thread - Keep a reference to the thread
-        self._active_order_loader = self.order_loader
-        self.order_loader.start()
+        # The order book was not updated, so the item must load again when re-selected
+        self._show_loading_state(self.order_book_tab, False)
+        self._order_future = None
+        self._last_shown = (None, None)
     
-    def _populate_order_tables(self, buy_orders, sell_orders):
+    def _populate_order_tables(self, buy_orders, sell_orders, station_names=None):
         """
         Populate order book tables with the loaded orders.
         
         Args:
             buy_orders: List of buy orders
             sell_orders: List of sell orders
+            station_names: Dictionary mapping station IDs to names
         """
         try:
             # Validate the input
@@ -1136,27 +1571,14 @@ class MarketDataTab(QWidget):
                 logger.error(f"Expected sell_orders to be a list, got {type(sell_orders)}")
                 sell_orders = []
             
-            # Get a mapping of station IDs to names
-            station_ids = []
-            for o in buy_orders + sell_orders:
-                # Handle both object and dictionary formats
-                if isinstance(o, dict):
-                    if 'station_id' in o and o['station_id']:
-                        station_ids.append(o['station_id'])
-                else:
-                    if hasattr(o, 'station_id') and o.station_id:
-                        station_ids.append(o.station_id)
-                    
-            station_ids = list(set(station_ids))  # Deduplicate
-            logger.debug(f"Looking up names for {len(station_ids)} station IDs")
-            
-            station_names = self._get_station_names(station_ids)
-            
-            # Update buy orders model
-            self.buy_order_model.setOrders(buy_orders, station_names)
-            
-            # Update sell orders model
-            self.sell_order_model.setOrders(sell_orders, station_names)
+            if self._order_book_item_id == self.selected_item_id:
+                # Same item as displayed: only apply what changed
+                self.buy_order_model.setOrdersIncremental(buy_orders, station_names)
+                self.sell_order_model.setOrdersIncremental(sell_orders, station_names)
+            else:
+                self.buy_order_model.setOrders(buy_orders, station_names)
+                self.sell_order_model.setOrders(sell_orders, station_names)
+                self._order_book_item_id = self.selected_item_id
             
             logger.info(f"Order book updated with {len(buy_orders)} buy orders and {len(sell_orders)} sell orders")
         except Exception as e:
@@ -1165,23 +1587,7 @@ class MarketDataTab(QWidget):
         finally:
             # Restore cursor
             self._show_loading_state(self.order_book_tab, False)
-            
-            # Clean up the thread safely
-            if self._active_order_loader:
-                # Disconnect signals
-                try:
-                    self._active_order_loader.orders_loaded.disconnect()
-                    self._active_order_loader.error_occurred.disconnect()
-                except (RuntimeError, TypeError) as e:
-                    # Signal was already disconnected
-                    logger.warning(f"Signal disconnect error: {e}")
-                
-                # Thread should already be finished, but wait just in case
-                if self._active_order_loader.isRunning():
-                    self._active_order_loader.wait()
-                
-                # Now safe to clean up
-                self._active_order_loader = None
+            self._order_future = None
     
     def _handle_order_load_error(self, error_message: str):
         """
@@ -1195,58 +1601,7 @@ class MarketDataTab(QWidget):
         
         # Restore cursor
         self._show_loading_state(self.order_book_tab, False)
-        
-        # Clean up the thread safely
-        if self._active_order_loader:
-            # Disconnect signals
-            try:
-                self._active_order_loader.orders_loaded.disconnect()
-                self._active_order_loader.error_occurred.disconnect()
-            except (RuntimeError, TypeError) as e:
-                # Signal was already disconnected
-                logger.warning(f"Signal disconnect error: {e}")
-            
-            # Thread should already be finished, but wait just in case
-            if self._active_order_loader.isRunning():
-                self._active_order_loader.wait()
-            
-            # Now safe to clean up
-            self._active_order_loader = None
-    
-    def _get_station_names(self, station_ids: List[int]) -> Dict[int, str]:
-        """
-        Get a mapping of station IDs to names.
-        
-        Uses the MarketService to batch lookup station names.
-        
-        Args:
-            station_ids: List of station IDs to look up
-            
-        Returns:
-            Dictionary mapping station IDs to names
-        """
-        if not station_ids:
-            return {}
-        
-        try:
-            # Use the market service's batch method to get station names
-            station_names = self.market_service.batch_get_station_names(station_ids)
-            
-            # Validate the response
-            if station_names is None or not isinstance(station_names, dict):
-                logger.error(f"Invalid station names response: {station_names}")
-                return {sid: f"Station {sid}" for sid in station_ids}
-            
-            # Ensure all requested station IDs have a name
-            for sid in station_ids:
-                if sid not in station_names:
-                    station_names[sid] = f"Station {sid}"
-                
-            return station_names
-        except Exception as e:
-            logger.error(f"Error looking up station names: {e}", exc_info=True)
-            # Fallback to providing generic station names
-            return {sid: f"Station {sid}" for sid in station_ids}
+        self._order_future = None
     
     @Slot()
     def reload_market_data(self):
@@ -1255,55 +1610,99 @@ class MarketDataTab(QWidget):
         
         Implements thread-safe data loading:
         1. Shows loading state to provide visual feedback
-        2. Cleans up any existing data loader thread
-        3. Creates a new thread with proper parent-child relationship
-        4. Connects signals for handling success and failure
-        5. Tracks the active thread for proper cleanup
+        2. Ignores the request while a reload is already in flight
+        3. Submits the reload to the tab's thread pool
+        4. Delivers the result back through a queued signal
         """
+        if self._reload_future is not None and not self._reload_future.done():
+            logger.info("Market data reload already in progress")
+            return
+        
         logger.info("Starting market data reload")
         
         # Show loading state
         self._show_loading_state(self.reload_button, True)
         self.reload_button.setText("Loading...")
         
-        # Clean up any existing data loader
-        if self._active_data_loader:
-            if self._active_data_loader.isRunning():
-                self._active_data_loader.cancel()
-                self._active_data_loader.wait()
-            self._active_data_loader = None
+        # The reload runs on a worker's service; the UI thread's service adopts
+        # the reloaded data once the result is delivered
+        self._unified_cache = None
+        self._reload_future = self._pool.submit(self._reload_unified_market_data)
+        self._reload_future.add_done_callback(self._emit_reload_result)
+    
+    def _reload_unified_market_data(self) -> Optional[Dict]:
+        """
+        Reload market data from log files on a pool thread.
+        
+        Returns:
+            The reloaded unified market data, or None if the reload failed
+        """
+        service = self._worker_market_service()
+        if not service.reload_market_data():
+            return None
+        return service.get_unified_market_data()
+    
+    def _emit_reload_result(self, future: Future):
+        """
+        Forward a finished reload job to the UI thread.
+        
+        Runs on the pool thread that completed the job.
         
-        # Create the data loader thread
-        self.data_loader = DataLoader(self.market_service)
-        self.data_loader.setParent(self)  # Ensure proper parent-child relationship
+        Args:
+            future: The completed reload future
+        """
+        if future.cancelled():
+            self._reload_finished.emit(None, "Operation cancelled")
+            return
         
-        # Connect signals - use specific method signatures for better control
-        self.data_loader.finished.connect(self._on_data_reload_finished)
+        try:
+            unified_data = future.result()
+        except Exception as e:
+            logger.error(f"Error in background market data reload: {e}", exc_info=True)
+            self._reload_finished.emit(None, str(e))
+            return
         
-        # Start the background thread - Keep a reference to the thread
-        self._active_data_loader = self.data_loader
-        self.data_loader.start()
+        if unified_data is not None:
+            logger.info("Background market data reload completed successfully")
+            self._reload_finished.emit(unified_data, "")
+        else:
+            logger.error("Background market data reload failed")
+            self._reload_finished.emit(None, "Failed to reload market data")
     
-    @Slot(bool, str)
-    def _on_data_reload_finished(self, success: bool, error_message: str):
+    @Slot(object, str)
+    def _on_data_reload_finished(self, unified_data: Optional[Dict], error_message: str):
         """
         Handle the completion of data reload.
         
         Args:
-            success: Whether the reload was successful
+            unified_data: Reloaded unified market data, or None if the reload failed
             error_message: Error message if the reload failed
         """
+        success = unified_data is not None
         # Reset button state
         self.reload_button.setText("Reload Market Data")
         self._show_loading_state(self.reload_button, False)
+        self._unified_cache = None
+        self._last_shown = (None, None)
         
         if success:
+            # Adopt the reloaded data here and, on their next job, in the worker services
+            self.market_service.set_unified_market_data(unified_data)
+            self._reloaded_market_data = unified_data
+            self._market_data_generation += 1
+            
+            # Drop cached lookups that a data reload may have changed
+            self.search_service.invalidate_categories()
+            
             # Reload trading hubs
             self._load_trading_hubs()
             
             # Update market data if an item is selected
             if self.selected_item_id:
                 self.update_market_data()
+            
+            # Let other tabs drop results based on the old data
+            self.market_data_reloaded.emit()
                 
             # Show success message
             logger.info("Market data successfully reloaded")
@@ -1313,21 +1712,7 @@ class MarketDataTab(QWidget):
             logger.error(f"Failed to reload market data: {error_message}")
             QMessageBox.critical(self, "Reload Error", f"Failed to reload market data: {error_message}")
         
-        # Clean up the thread safely
-        if self._active_data_loader:
-            # Disconnect signals
-            try:
-                self._active_data_loader.finished.disconnect()
-            except (RuntimeError, TypeError) as e:
-                # Signal was already disconnected
-                logger.warning(f"Signal disconnect error: {e}")
-            
-            # Thread should already be finished, but wait just in case
-            if self._active_data_loader.isRunning():
-                self._active_data_loader.wait()
-            
-            # Now safe to clean up
-            self._active_data_loader = None
+        self._reload_future = None
 
     def update_hub_comparison(self):
         """Update the trading hub comparison table."""
@@ -1337,8 +1722,10 @@ class MarketDataTab(QWidget):
         # Get selected hubs
         selected_hubs = [hub_id for hub_id, checkbox in self.hub_checkboxes.items() if checkbox.isChecked()]
         
-        # Get market data
-        market_data = self.market_service.get_unified_market_data()
+        # Get market data, parsed at most once per reload
+        if self._unified_cache is None:
+            self._unified_cache = self.market_service.get_unified_market_data() or {}
+        market_data = self._unified_cache
         if not market_data or 'items' not in market_data:
             return
         
@@ -1346,11 +1733,10 @@ class MarketDataTab(QWidget):
         item_id_str = str(self.selected_item_id)
         item_data = market_data['items'].get(item_id_str, {})
         
-        # Clear table
-        self.hub_comparison_table.setRowCount(0)
-        
-        # Add rows for each hub
-        row = 0
+        # Collect the prices of every selected hub that has data
+        hub_names = []
+        sell_prices = []
+        buy_prices = []
         for hub_id in selected_hubs:
             # Convert hub_id to string for lookup
             hub_id_str = str(hub_id)
@@ -1358,34 +1744,28 @@ class MarketDataTab(QWidget):
             if not hub_data:
                 continue
             
-            self.hub_comparison_table.insertRow(row)
-            
-            # Hub name
-            hub_name = "Unknown"
-            for hub in self.trading_hubs:
-                # Handle both dict and object formats
-                if isinstance(hub, dict):
-                    if str(hub.get('id')) == hub_id_str:
-                        hub_name = hub.get('name', str(hub_id))
-                        break
-                else:
-                    if str(hub.id) == hub_id_str:
-                        hub_name = hub.name
-                        break
-            
-            self.hub_comparison_table.setItem(row, 0, QTableWidgetItem(hub_name))
-            
-            # Sell price
-            sell_price = hub_data.get('sell', 0)
-            self.hub_comparison_table.setItem(row, 1, QTableWidgetItem(f"{sell_price:,.2f}"))
-            
-            # Buy price
-            buy_price = hub_data.get('buy', 0)
-            self.hub_comparison_table.setItem(row, 2, QTableWidgetItem(f"{buy_price:,.2f}"))
-            
-            # Spread
-            spread = sell_price - buy_price
-            spread_pct = (spread / sell_price * 100) if sell_price else 0
-            self.hub_comparison_table.setItem(row, 3, QTableWidgetItem(f"{spread:,.2f} ({spread_pct:.2f}%)"))
-            
-            row += 1 
\ No newline at end of file
+            hub_names.append(self._hub_name_by_id.get(hub_id_str, "Unknown"))
+            sell_prices.append(hub_data.get('sell', 0))
+            buy_prices.append(hub_data.get('buy', 0))
+        
+        # Spreads, computed in one numpy pass when many hubs are compared
+        if len(hub_names) > HUB_VECTORIZE_MIN:
+            sell = np.asarray(sell_prices, dtype=np.float64)
+            spread = sell - np.asarray(buy_prices, dtype=np.float64)
+            spread_pct = np.divide(spread * 100, sell, out=np.zeros_like(spread), where=sell != 0)
+            spreads = spread.tolist()
+            spread_pcts = spread_pct.tolist()
+        else:
+            spreads = [sell - buy for sell, buy in zip(sell_prices, buy_prices)]
+            spread_pcts = [(spread / sell * 100) if sell else 0 for spread, sell in zip(spreads, sell_prices)]
+        
+        # Build one preformatted row per hub
+        fmt = "{:,.2f}".format
+        fmt_pct = "{:.2f}".format
+        rows = [
+            (hub_name, fmt(sell), fmt(buy), f"{fmt(spread)} ({fmt_pct(spread_pct)}%)")
+            for hub_name, sell, buy, spread, spread_pct
+            in zip(hub_names, sell_prices, buy_prices, spreads, spread_pcts)
+        ]
+        
+        self.hub_comparison_model.setRows(rows)
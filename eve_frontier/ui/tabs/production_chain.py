@@ -6,31 +6,208 @@ calculate material requirements, and estimate production costs.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
-from decimal import Decimal
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import List, Optional, Dict, Any, Tuple
+from decimal import Decimal, ROUND_HALF_EVEN
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QComboBox, QTableWidget, QTableWidgetItem, QTabWidget,
     QPushButton, QGroupBox, QFormLayout, QSplitter, QHeaderView,
     QCheckBox, QScrollArea, QSpinBox, QTreeWidget, QTreeWidgetItem,
-    QFrame, QSizePolicy
+    QFrame, QSizePolicy, QTableView, QStyledItemDelegate
 )
-from PySide6.QtCore import Qt, Signal, Slot, QSize
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QTimer, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont, QIcon
 
 from sqlalchemy.orm import Session
 
-from eve_frontier.models import Item, Blueprint, BlueprintMaterial
+from eve_frontier.models import Blueprint, BlueprintMaterial
 from eve_frontier.services.search_service import SearchService
 from eve_frontier.services.production_service import ProductionService, ProductionChainNode
 from eve_frontier.services.market_service import MarketService
 
 logger = logging.getLogger(__name__)
 
+# Table column constants
+RAW_MATERIALS_COLUMNS = ["Material ID", "Name", "Quantity", "Cost"]
+
+# Number of calculated or prefetched production chains kept per tab
+CHAIN_CACHE_SIZE = 32
+
+# Number of top search results whose chains are calculated ahead of time
+SEARCH_PREFETCH_COUNT = 3
+
+# Number of item search results kept per tab, keyed by query
+SEARCH_CACHE_SIZE = 256
+
+# Formatted cost strings keyed by whole cents, shared across cells
+_COST_STRINGS: Dict[int, str] = {}
+_COST_STRINGS_MAX = 4096
+
+
+@lru_cache(maxsize=2048)
+def _format_time(seconds: Optional[int]) -> str:
+    """
+    Format time in seconds to a readable string.
+    
+    Args:
+        seconds: Time in seconds
+        
+    Returns:
+        Formatted time string
+    """
+    if seconds is None:
+        return "N/A"
+    
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    elif minutes > 0:
+        return f"{minutes}m {seconds}s"
+    else:
+        return f"{seconds}s"
+
+
+def _format_cost(cost) -> str:
+    """
+    Format an ISK amount with two decimals.
+    
+    Chains repeat the same amounts many times, so each distinct cent value is
+    formatted once and the string is reused.
+    
+    Args:
+        cost: Amount in ISK (Decimal, float or int)
+        
+    Returns:
+        Formatted cost string
+    """
+    cents = int((Decimal(cost) * 100).to_integral_value(ROUND_HALF_EVEN))
+    if cents == 0 and cost < 0:
+        # Keep the sign of tiny negative amounts, as format() does
+        return "-0.00 ISK"
+    text = _COST_STRINGS.get(cents)
+    if text is None:
+        if len(_COST_STRINGS) >= _COST_STRINGS_MAX:
+            _COST_STRINGS.clear()
+        text = _COST_STRINGS[cents] = f"{Decimal(cents).scaleb(-2):.2f} ISK"
+    return text
+
+
+class RightAlignDelegate(QStyledItemDelegate):
+    """Item delegate that right-aligns the cells of the columns it is set on."""
+    
+    def initStyleOption(self, option, index):
+        """
+        Initialize the style option with right-aligned text.
+        
+        Args:
+            option: Style option to initialize
+            index: Model index being painted
+        """
+        super().initStyleOption(option, index)
+        option.displayAlignment = Qt.AlignRight | Qt.AlignVCenter
+
+
+class RawMaterialsModel(QAbstractTableModel):
+    """
+    Model for the raw materials of a production chain following the Qt Model-View architecture.
+    
+    Each column is kept in its own list; the view only asks for visible cells.
+    """
+    
+    def __init__(self):
+        """Initialize an empty raw materials model."""
+        super().__init__()
+        self.headers = RAW_MATERIALS_COLUMNS
+        self.ids: List[int] = []
+        self.names: List[str] = []
+        self.quantities: List[int] = []
+        self.costs: List[Optional[Decimal]] = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of rows in the model."""
+        return len(self.ids)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns in the model."""
+        return len(self.headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Return data for the given index and role.
+        
+        Args:
+            index: Model index to get data for
+            role: Data role (display, edit, etc.)
+            
+        Returns:
+            Data for the given index and role
+        """
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            # IDs and quantities are numbers; the view formats them
+            if column == 0:
+                return self.ids[row]
+            elif column == 1:
+                return self.names[row]
+            elif column == 2:
+                return self.quantities[row]
+            elif column == 3:
+                cost = self.costs[row]
+                return _format_cost(cost) if cost is not None else "N/A"
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        Return header data for the given section, orientation, and role.
+        
+        Args:
+            section: Header section index
+            orientation: Header orientation (horizontal or vertical)
+            role: Data role (display, edit, etc.)
+            
+        Returns:
+            Header data for the given section, orientation, and role
+        """
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            if 0 <= section < len(self.headers):
+                return self.headers[section]
+        
+        return None
+    
+    def setMaterials(self, raw_materials):
+        """
+        Set the raw materials for the model.
+        
+        Args:
+            raw_materials: List of (material_name, material_id, quantity, cost) entries
+        """
+        self.beginResetModel()
+        self.names = [entry[0] for entry in raw_materials]
+        self.ids = [entry[1] for entry in raw_materials]
+        self.quantities = [entry[2] for entry in raw_materials]
+        self.costs = [entry[3] for entry in raw_materials]
+        self.endResetModel()
+
+
 class ProductionChainTab(QWidget):
     """Production Chain tab for analyzing item manufacturing chains."""
     
+    # Signals used to hand background results back to the UI thread
+    _chain_ready = Signal(int, object)  # token, production chain
+    _chain_failed = Signal(int, str)  # token, error message
+    
     def __init__(self, db: Session):
         """
         Initialize the Production Chain tab.
@@ -43,12 +220,39 @@ class ProductionChainTab(QWidget):
         # Initialize services
         self.db = db
         self.search_service = SearchService(db)
-        self.production_service = ProductionService(db)
         self.market_service = MarketService(db)
         
         # Store current production chain
         self.current_chain: Optional[ProductionChainNode] = None
         
+        # Raw materials and total time of the current chain, computed once per chain
+        self._raw_materials: List[list] = []
+        self._total_time = 0
+        
+        # Chains are calculated on a background pool; futures are kept per set of
+        # production options so a prefetched chain is reused by Calculate
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="production")
+        
+        # The pool gets its own session, as searches keep using the UI thread's
+        # session while chains are prefetched
+        self._worker_db = Session(bind=db.get_bind())
+        self.production_service = ProductionService(self._worker_db)
+        self._chain_futures: "OrderedDict[tuple, Future]" = OrderedDict()
+        self._prefetch_keys: List[tuple] = []
+        self._calc_seq = 0
+        self._calc_request: Optional[tuple] = None
+        self._calc_item_name = ""
+        self._chain_ready.connect(self._on_chain_ready)
+        self._chain_failed.connect(self._on_chain_failed)
+        
+        # Item searches run 200 ms after typing stops; results are cached per query
+        # as (item_id, item_name, category_name) rows
+        self._search_cache: "OrderedDict[str, List[tuple]]" = OrderedDict()
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self.search_items)
+        
         # Initialize UI
         self._init_ui()
         
@@ -171,11 +375,17 @@ class ProductionChainTab(QWidget):
         # Materials tab
         self.materials_tab = QWidget()
         materials_layout = QVBoxLayout(self.materials_tab)
-        self.materials_table = QTableWidget(0, 4)  # columns: ID, Name, Quantity, Cost
-        self.materials_table.setHorizontalHeaderLabels(["Material ID", "Name", "Quantity", "Cost"])
+        self.materials_table = QTableView()
+        self.raw_materials_model = RawMaterialsModel()
+        self.materials_table.setModel(self.raw_materials_model)
         self.materials_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.materials_table.verticalHeader().setVisible(False)
-        self.materials_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.materials_table.setEditTriggers(QTableView.NoEditTriggers)
+        
+        # Quantity and cost are right-aligned by the delegate at paint time
+        self.materials_alignment_delegate = RightAlignDelegate(self.materials_table)
+        self.materials_table.setItemDelegateForColumn(2, self.materials_alignment_delegate)
+        self.materials_table.setItemDelegateForColumn(3, self.materials_alignment_delegate)
         materials_layout.addWidget(self.materials_table)
         self.details_tabs.addTab(self.materials_tab, "Raw Materials")
         
@@ -213,14 +423,21 @@ class ProductionChainTab(QWidget):
         # Connect Enter key in search input to search action
         self.item_search_input.returnPressed.connect(self.search_items)
         
-        # Connect item selection to enable calculate button
+        # Search as the user types, once typing pauses
+        self.item_search_input.textChanged.connect(lambda _: self._search_timer.start())
+        
+        # Connect item selection to enable calculate button and warm the chain cache
         self.item_results_table.itemSelectionChanged.connect(self._enable_calculate)
+        self.item_results_table.itemSelectionChanged.connect(self._prefetch_selected_chain)
         
         # Connect calculate button to calculate action
         self.calculate_button.clicked.connect(self.calculate_production_chain)
         
         # Connect tree selection to update material details
         self.chain_tree.itemSelectionChanged.connect(self._update_material_details)
+        
+        # Populate deeper chain levels when they are expanded
+        self.chain_tree.itemExpanded.connect(self._on_chain_item_expanded)
     
     @Slot()
     def _enable_calculate(self):
@@ -230,25 +447,25 @@ class ProductionChainTab(QWidget):
     @Slot()
     def search_items(self):
         """Search for items based on the current criteria."""
+        # Run now and drop any pending debounced search
+        self._search_timer.stop()
+        
         query = self.item_search_input.text().strip()
         
         logger.debug(f"Starting item search with query: '{query}'")
         self.status_label.setText(f"Searching for items matching '{query}'...")
         
         try:
-            # Get items from search service
-            logger.debug("Calling search_service.search_items")
-            items = self.search_service.search_items(
-                query=query,
-                limit=10  # Limit to 10 results for simplicity
-            )
-            logger.debug(f"Found {len(items)} items: {[item.name for item in items]}")
+            rows = self._search_item_rows(query)
             
             # Update the results table
             logger.debug("Updating item results table")
-            self._update_item_results_table(items)
+            self._update_item_results_table(rows)
             
-            self.status_label.setText(f"Found {len(items)} items matching '{query}'")
+            # Warm the chain cache for the results the user is most likely to pick
+            self._prefetch_chains([self._chain_key(item_id) for item_id, _, _ in rows[:SEARCH_PREFETCH_COUNT]])
+            
+            self.status_label.setText(f"Found {len(rows)} items matching '{query}'")
             
         except Exception as e:
             logger.error(f"Error searching for items: {e}")
@@ -256,67 +473,289 @@ class ProductionChainTab(QWidget):
             logger.error(traceback.format_exc())
             self.status_label.setText(f"Error: {str(e)}")
     
-    def _update_item_results_table(self, items: List[Item]):
+    def _search_item_rows(self, query: str) -> List[tuple]:
+        """
+        Search for items, reusing the results of earlier identical queries.
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            List of (item_id, item_name, category_name) tuples
+        """
+        rows = self._search_cache.get(query)
+        if rows is not None:
+            self._search_cache.move_to_end(query)
+            logger.debug(f"Using cached search results for '{query}'")
+            return rows
+        
+        # Get (id, name, category) rows from the search service
+        logger.debug("Calling search_service.search_item_rows")
+        rows = self.search_service.search_item_rows(
+            query=query,
+            limit=10  # Limit to 10 results for simplicity
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Found {len(rows)} items: {[item_name for _, item_name, _ in rows]}")
+        
+        self._search_cache[query] = rows
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        
+        return rows
+    
+    @Slot()
+    def invalidate_caches(self):
+        """
+        Drop cached search results and production chains after a data reload.
+        
+        Prefetched chains that have not started are cancelled. The production
+        service is replaced so later chains load the reloaded market prices; a
+        chain that is running or awaited by Calculate finishes with the old one.
+        """
+        self._search_cache.clear()
+        
+        # Cancel queued prefetches and forget finished chains
+        for key, future in self._chain_futures.items():
+            if key != self._calc_request:
+                future.cancel()
+        self._chain_futures.clear()
+        self._prefetch_keys = []
+        
+        # A new service creates its own market service, with freshly loaded data
+        self.production_service = ProductionService(self._worker_db)
+        logger.info("Production chain caches invalidated")
+    
+    def _update_item_results_table(self, rows: List[tuple]):
         """
         Update the results table with the item data.
         
         Args:
-            items: List of Item objects to display
+            rows: List of (item_id, item_name, category_name) tuples to display
         """
-        # Clear the table
+        # Suspend painting, sorting and selection signals during the bulk fill
+        sorting_enabled = self.item_results_table.isSortingEnabled()
+        self.item_results_table.setUpdatesEnabled(False)
+        self.item_results_table.setSortingEnabled(False)
+        self.item_results_table.blockSignals(True)
+        
+        # Clear the table and allocate all rows up front
         self.item_results_table.setRowCount(0)
+        self.item_results_table.setRowCount(len(rows))
         
-        for item in items:
-            row = self.item_results_table.rowCount()
-            self.item_results_table.insertRow(row)
-            
-            # Item ID
-            id_item = QTableWidgetItem(str(item.id))
+        for row, (item_id, item_name, category_name) in enumerate(rows):
+            # Item ID, stored as a number so it sorts numerically
+            id_item = QTableWidgetItem()
+            id_item.setData(Qt.DisplayRole, item_id)
             self.item_results_table.setItem(row, 0, id_item)
             
             # Item Name
-            name_item = QTableWidgetItem(item.name)
+            name_item = QTableWidgetItem(item_name)
             self.item_results_table.setItem(row, 1, name_item)
             
             # Category (via group relationship)
-            category_name = item.group.category.name if item.group and item.group.category else "Unknown"
             category_item = QTableWidgetItem(category_name)
             self.item_results_table.setItem(row, 2, category_item)
+        
+        self.item_results_table.blockSignals(False)
+        self.item_results_table.setSortingEnabled(sorting_enabled)
+        self.item_results_table.setUpdatesEnabled(True)
+        
+        # The selection was cleared while signals were blocked
+        self._enable_calculate()
     
-    @Slot()
-    def calculate_production_chain(self):
-        """Calculate the production chain for the selected item."""
-        # Get the selected item
+    def closeEvent(self, event):
+        """
+        Clean up resources when the widget is being closed.
+        
+        Cancels queued chain calculations and waits for a running one to finish.
+        
+        Args:
+            event: Close event
+        """
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._worker_db.close()
+        super().closeEvent(event)
+    
+    def _selected_chain_request(self) -> Optional[tuple]:
+        """
+        Build the chain calculation request for the selected item.
+        
+        Returns:
+            Tuple of (cache key, item name), or None if no item is selected. The
+            key is (item_id, quantity, me_level, te_level, facility_bonus).
+        """
         selected_items = self.item_results_table.selectedItems()
         if not selected_items:
+            return None
+        
+        # Get the item ID and name from the selected row
+        row = selected_items[0].row()
+        item_id = self.item_results_table.item(row, 0).data(Qt.DisplayRole)
+        item_name = self.item_results_table.item(row, 1).text()
+        
+        return self._chain_key(item_id), item_name
+    
+    def _chain_key(self, item_id: int) -> tuple:
+        """
+        Build the chain cache key for an item with the current production options.
+        
+        Args:
+            item_id: ID of the item to manufacture
+            
+        Returns:
+            (item_id, quantity, me_level, te_level, facility_bonus) tuple
+        """
+        return (
+            item_id,
+            self.quantity_spin.value(),
+            self.me_level_spin.value(),
+            self.te_level_spin.value(),
+            self.facility_combo.currentData()
+        )
+    
+    def _chain_future(self, key: tuple) -> Future:
+        """
+        Get the calculation of a production chain, submitting it if needed.
+        
+        Args:
+            key: (item_id, quantity, me_level, te_level, facility_bonus) tuple
+            
+        Returns:
+            Future resolving to the ProductionChainNode, or None if there is no chain
+        """
+        future = self._chain_futures.get(key)
+        if future is not None and not future.cancelled():
+            self._chain_futures.move_to_end(key)
+            return future
+        
+        item_id, quantity, me_level, te_level, facility_bonus = key
+        logger.debug(f"Submitting production chain calculation for item_id={item_id}")
+        future = self._pool.submit(
+            self.production_service.get_manufacturing_details,
+            item_id=item_id,
+            quantity=quantity,
+            me_level=me_level,
+            te_level=te_level,
+            facility_bonus=facility_bonus,
+            max_depth=5  # Go 5 levels deep
+        )
+        self._chain_futures[key] = future
+        
+        # Keep the cache bounded, dropping the least recently used chains
+        while len(self._chain_futures) > CHAIN_CACHE_SIZE:
+            _, old_future = self._chain_futures.popitem(last=False)
+            old_future.cancel()
+        
+        return future
+    
+    @Slot()
+    def _prefetch_selected_chain(self):
+        """Start calculating the selected item's chain before Calculate is clicked."""
+        request = self._selected_chain_request()
+        if request is None:
+            return
+        key, _ = request
+        self._prefetch_chains([key])
+    
+    def _prefetch_chains(self, keys: List[tuple]):
+        """
+        Calculate production chains in the background ahead of a Calculate click.
+        
+        Earlier prefetches that have not started yet are dropped unless they are
+        requested again or a calculation waits for them.
+        
+        Args:
+            keys: Chain cache keys to prefetch, most likely first
+        """
+        for previous in self._prefetch_keys:
+            if previous in keys or previous == self._calc_request:
+                continue
+            future = self._chain_futures.get(previous)
+            if future is not None and future.cancel():
+                del self._chain_futures[previous]
+        
+        self._prefetch_keys = list(keys)
+        for key in keys:
+            self._chain_future(key)
+    
+    @Slot()
+    def calculate_production_chain(self):
+        """
+        Calculate the production chain for the selected item.
+        
+        The chain is calculated on the tab's pool, or taken from the cache when
+        it was prefetched; the views are updated once it is ready.
+        """
+        request = self._selected_chain_request()
+        if request is None:
             logger.debug("No item selected for production chain calculation")
             return
         
-        # Get the item ID from the first column
-        item_id = int(self.item_results_table.item(selected_items[0].row(), 0).text())
-        item_name = self.item_results_table.item(selected_items[0].row(), 1).text()
+        key, item_name = request
+        item_id, quantity, me_level, te_level, facility_bonus = key
         logger.debug(f"Selected item for production chain: {item_name} (ID: {item_id})")
-        
-        # Get production options
-        quantity = self.quantity_spin.value()
-        me_level = self.me_level_spin.value()
-        te_level = self.te_level_spin.value()
-        facility_bonus = self.facility_combo.currentData()
         logger.debug(f"Production options: quantity={quantity}, ME={me_level}, TE={te_level}, facility_bonus={facility_bonus}")
         
         self.status_label.setText(f"Calculating production chain for {item_name}...")
         
+        # Tag the request so that results of superseded calculations are dropped
+        self._calc_seq += 1
+        token = self._calc_seq
+        self._calc_request = key
+        self._calc_item_name = item_name
+        
+        self._chain_future(key).add_done_callback(partial(self._forward_chain, token))
+    
+    def _forward_chain(self, token: int, future: Future):
+        """
+        Forward a finished chain calculation to the UI thread.
+        
+        Runs on the pool thread that completed the job and only emits signals;
+        the chain cache is left to the UI thread.
+        
+        Args:
+            token: Request token the calculation was requested with
+            future: The completed future
+        """
+        if token != self._calc_seq:
+            logger.debug(f"Dropping stale production chain result (request {token})")
+            return
+        
+        if future.cancelled():
+            self._chain_failed.emit(token, "Operation cancelled")
+            return
+        
         try:
-            # Get manufacturing details
-            logger.debug(f"Calling production_service.get_manufacturing_details for item_id={item_id}")
-            self.current_chain = self.production_service.get_manufacturing_details(
-                item_id=item_id,
-                quantity=quantity,
-                me_level=me_level,
-                te_level=te_level,
-                facility_bonus=facility_bonus,
-                max_depth=5  # Go 5 levels deep
-            )
+            chain = future.result()
+        except Exception as e:
+            logger.error(f"Error calculating production chain: {e}", exc_info=True)
+            self._chain_failed.emit(token, str(e))
+            return
+        
+        self._chain_ready.emit(token, chain)
+    
+    @Slot(int, object)
+    def _on_chain_ready(self, token: int, chain: Optional[ProductionChainNode]):
+        """
+        Show a calculated production chain if it belongs to the latest request.
+        
+        Args:
+            token: Request token the chain was calculated for
+            chain: The calculated chain, or None if the item cannot be manufactured
+        """
+        if token != self._calc_seq:
+            logger.debug(f"Ignoring stale production chain result (request {token})")
+            return
+        
+        item_id, quantity = self._calc_request[0], self._calc_request[1]
+        item_name = self._calc_item_name
+        
+        try:
+            self.current_chain = chain
+            
+            # Summarize the chain once for the tables and the cost analysis
+            self._raw_materials, self._total_time = self._walk_chain(self.current_chain)
             
             if self.current_chain:
                 logger.debug(f"Retrieved production chain: {self.current_chain.item_name} with {len(self.current_chain.materials)} materials")
@@ -343,6 +782,23 @@ class ProductionChainTab(QWidget):
             logger.error(traceback.format_exc())
             self.status_label.setText(f"Error: {str(e)}")
     
+    @Slot(int, str)
+    def _on_chain_failed(self, token: int, error_message: str):
+        """
+        Report a failed chain calculation if it belongs to the latest request.
+        
+        Args:
+            token: Request token the chain was calculated for
+            error_message: Error message from the calculation
+        """
+        if token != self._calc_seq:
+            logger.debug(f"Ignoring stale production chain error (request {token})")
+            return
+        
+        # Drop the failed calculation so the next Calculate submits it again
+        self._chain_futures.pop(self._calc_request, None)
+        self.status_label.setText(f"Error: {error_message}")
+    
     def _update_production_chain_tree(self):
         """Update the production chain tree with the current chain."""
         # Clear the tree
@@ -351,133 +807,144 @@ class ProductionChainTab(QWidget):
         if not self.current_chain:
             return
         
+        # Suspend painting and selection signals while the tree is built
+        self.chain_tree.setUpdatesEnabled(False)
+        self.chain_tree.blockSignals(True)
+        
         # Create the root item
-        root_item = QTreeWidgetItem([
-            self.current_chain.item_name,
-            str(self.current_chain.quantity),
-            self._format_time(self.current_chain.time_required) if self.current_chain.time_required else "N/A",
-            f"{self.current_chain.production_cost:.2f} ISK" if self.current_chain.production_cost else "N/A"
-        ])
+        root_item = self._create_chain_item(self.current_chain)
         self.chain_tree.addTopLevelItem(root_item)
         
-        # Add child nodes recursively
+        # Add the first level of materials; deeper levels are added on expansion
         self._add_child_nodes(root_item, self.current_chain.materials)
         
         # Expand the root item
         root_item.setExpanded(True)
+        
+        self.chain_tree.blockSignals(False)
+        self.chain_tree.setUpdatesEnabled(True)
+    
+    def _create_chain_item(self, node: ProductionChainNode) -> QTreeWidgetItem:
+        """
+        Create the tree item for a production chain node.
+        
+        The node is stored on the item so its materials can be added when the
+        item is first expanded.
+        
+        Args:
+            node: ProductionChainNode to display
+            
+        Returns:
+            QTreeWidgetItem for the node
+        """
+        item = QTreeWidgetItem([
+            node.item_name,
+            str(node.quantity),
+            _format_time(node.time_required) if node.time_required else "N/A",
+            _format_cost(node.production_cost) if node.production_cost else "N/A"
+        ])
+        item.setData(0, Qt.UserRole, node)
+        
+        # Show the expand arrow before the children exist
+        if node.materials:
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        
+        return item
     
     def _add_child_nodes(self, parent_item: QTreeWidgetItem, materials: List[ProductionChainNode]):
         """
-        Add child nodes to the production chain tree.
+        Add one level of child nodes to the production chain tree.
         
         Args:
             parent_item: Parent QTreeWidgetItem
             materials: List of ProductionChainNode objects to add as children
         """
-        for material in materials:
-            # Create the child item
-            child_item = QTreeWidgetItem([
-                material.item_name,
-                str(material.quantity),
-                self._format_time(material.time_required) if material.time_required else "N/A",
-                f"{material.production_cost:.2f} ISK" if material.production_cost else "N/A"
-            ])
-            parent_item.addChild(child_item)
-            
-            # Add grandchildren recursively
-            self._add_child_nodes(child_item, material.materials)
+        # Insert all siblings at once so the tree is invalidated once per level
+        parent_item.addChildren([self._create_chain_item(material) for material in materials])
+    
+    @Slot(QTreeWidgetItem)
+    def _on_chain_item_expanded(self, item: QTreeWidgetItem):
+        """
+        Add the materials of a tree item the first time it is expanded.
+        
+        Args:
+            item: The expanded QTreeWidgetItem
+        """
+        node = item.data(0, Qt.UserRole)
+        if node is None or item.childCount() or not node.materials:
+            return
+        
+        self.chain_tree.setUpdatesEnabled(False)
+        self._add_child_nodes(item, node.materials)
+        self.chain_tree.setUpdatesEnabled(True)
     
     def _update_raw_materials_table(self):
         """Update the raw materials table with the current chain's base materials."""
-        # Clear the table
-        self.materials_table.setRowCount(0)
-        
         if not self.current_chain:
+            self.raw_materials_model.setMaterials([])
             return
         
-        # Extract all raw materials (items with no materials of their own)
-        raw_materials = self._extract_raw_materials(self.current_chain)
-        
-        # Sort by name
-        raw_materials.sort(key=lambda x: x[0])
-        
-        for material_name, material_id, total_quantity, cost in raw_materials:
-            row = self.materials_table.rowCount()
-            self.materials_table.insertRow(row)
-            
-            # Material ID
-            id_item = QTableWidgetItem(str(material_id))
-            self.materials_table.setItem(row, 0, id_item)
-            
-            # Material Name
-            name_item = QTableWidgetItem(material_name)
-            self.materials_table.setItem(row, 1, name_item)
-            
-            # Quantity
-            quantity_item = QTableWidgetItem(str(total_quantity))
-            quantity_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.materials_table.setItem(row, 2, quantity_item)
-            
-            # Cost
-            cost_item = QTableWidgetItem(f"{cost:.2f} ISK" if cost is not None else "N/A")
-            cost_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.materials_table.setItem(row, 3, cost_item)
+        # Raw materials (items with no materials of their own), sorted by name
+        self.raw_materials_model.setMaterials(sorted(self._raw_materials, key=lambda x: x[0]))
     
-    def _extract_raw_materials(self, node: ProductionChainNode) -> List[tuple]:
+    def _walk_chain(self, node: ProductionChainNode) -> Tuple[List[list], int]:
         """
-        Extract all raw materials from a production chain.
+        Summarize a production chain in a single iterative post-order walk.
+        
+        Raw materials (nodes with no materials of their own) are combined by
+        item as they are reached. For parallel manufacturing, each node takes
+        its own time plus the longest time among its materials; this is a
+        simplified model, in reality you might have complex dependency trees.
         
         Args:
-            node: ProductionChainNode to extract materials from
+            node: ProductionChainNode to summarize
             
         Returns:
-            List of tuples (material_name, material_id, quantity, cost)
+            Tuple of (list of [material_name, material_id, quantity, cost]
+            entries, total time in seconds)
         """
         if not node:
-            return []
-        
-        # If this node has no materials, it's a raw material
-        if not node.materials:
-            # Ensure cost is calculated consistently
-            cost = None
-            if hasattr(node, 'buy_price') and node.buy_price is not None:
-                # Calculate total cost based on quantity
-                cost = node.buy_price * node.quantity
-            
-            # Return as a single-item list
-            return [(node.item_name, node.item_id, node.quantity, cost)]
-        
-        # Otherwise, extract materials from all children
-        result = []
-        for material in node.materials:
-            result.extend(self._extract_raw_materials(material))
+            return [], 0
         
-        # Combine like materials
         combined = {}
-        for name, id, quantity, cost in result:
-            if id not in combined:
-                combined[id] = [name, id, 0, None]
+        times = {}
+        stack = [(node, False)]
+        while stack:
+            current, visited = stack.pop()
             
-            # Add quantities
-            combined[id][2] += quantity
+            if not current.materials:
+                # Raw material; prices are Decimal from the market service, so
+                # costs add up directly
+                times[id(current)] = current.time_required or 0
+                cost = current.buy_price * current.quantity if current.buy_price is not None else None
+                
+                entry = combined.get(current.item_id)
+                if entry is None:
+                    combined[current.item_id] = [current.item_name, current.item_id, current.quantity, cost]
+                    continue
+                
+                # Add quantities and costs
+                entry[2] += current.quantity
+                if cost is not None:
+                    entry[3] = (entry[3] or Decimal(0)) + cost
+                continue
+            
+            if not visited:
+                # Revisit this node once all of its materials are done
+                stack.append((current, True))
+                stack.extend((material, False) for material in current.materials)
+                continue
+            
+            child_time = 0
+            for material in current.materials:
+                material_time = times[id(material)]
+                if material_time > child_time:
+                    child_time = material_time
             
-            # Handle cost combining with type consistency
-            if cost is not None:
-                if combined[id][3] is None:
-                    combined[id][3] = cost
-                else:
-                    # If either value is Decimal, convert both to Decimal for consistent math
-                    if isinstance(cost, Decimal) or isinstance(combined[id][3], Decimal):
-                        # Convert to Decimal if needed
-                        if not isinstance(combined[id][3], Decimal):
-                            combined[id][3] = Decimal(str(combined[id][3]))
-                        if not isinstance(cost, Decimal):
-                            cost = Decimal(str(cost))
-                        
-                    # Add the values using appropriate type
-                    combined[id][3] += cost
-        
-        return list(combined.values())
+            # Current node + longest child path
+            times[id(current)] = (current.time_required or 0) + child_time
+        
+        return list(combined.values()), times[id(node)]
     
     def _update_cost_analysis(self):
         """Update the cost analysis tab with the current chain's cost information."""
@@ -489,52 +956,28 @@ class ProductionChainTab(QWidget):
             self.profit_per_hour_label.setText("0.00 ISK/hr")
             return
         
-        # Calculate total material cost
-        raw_materials = self._extract_raw_materials(self.current_chain)
-        material_cost = sum(cost for _, _, _, cost in raw_materials if cost is not None)
+        # Calculate total material cost, exactly in Decimal
+        material_cost = sum((cost for _, _, _, cost in self._raw_materials if cost is not None), Decimal(0))
         
-        # Get total production time (recursive)
-        production_time = self._calculate_total_time(self.current_chain)
+        # Get total production time
+        production_time = self._total_time
         
         # Calculate market value (placeholder)
-        market_value = self.current_chain.sell_price * self.current_chain.quantity if self.current_chain.sell_price else 0
+        market_value = self.current_chain.sell_price * self.current_chain.quantity if self.current_chain.sell_price else Decimal(0)
         
         # Calculate profit
         profit = market_value - material_cost
         
         # Calculate profit per hour
-        profit_per_hour = (profit / (production_time / 3600)) if production_time > 0 else 0
+        profit_per_hour = (profit / Decimal(production_time)) * 3600 if production_time > 0 else Decimal(0)
         
         # Update labels
         self.total_cost_label.setText(f"{material_cost:.2f} ISK")
         self.material_cost_label.setText(f"{material_cost:.2f} ISK")
-        self.production_time_label.setText(self._format_time(production_time))
+        self.production_time_label.setText(_format_time(production_time))
         self.profit_margin_label.setText(f"{profit:.2f} ISK")
         self.profit_per_hour_label.setText(f"{profit_per_hour:.2f} ISK/hr")
     
-    def _calculate_total_time(self, node: ProductionChainNode) -> int:
-        """
-        Calculate the total production time for a chain (in seconds).
-        
-        Args:
-            node: ProductionChainNode to calculate time for
-            
-        Returns:
-            Total time in seconds
-        """
-        if not node:
-            return 0
-        
-        # Base time for this node
-        base_time = node.time_required or 0
-        
-        # For parallel manufacturing, we take the max time of child nodes
-        # This is a simplified model; in reality, you might have complex dependency trees
-        child_time = max([self._calculate_total_time(material) for material in node.materials], default=0)
-        
-        # Return total time (current node + longest child path)
-        return base_time + child_time
-    
     @Slot()
     def _update_material_details(self):
         """Update material details based on the selected node in the tree."""
@@ -542,26 +985,3 @@ class ProductionChainTab(QWidget):
         # including market prices, alternative blueprints, etc.
         # Placeholder for future implementation
         pass
-    
-    def _format_time(self, seconds: Optional[int]) -> str:
-        """
-        Format time in seconds to a readable string.
-        
-        Args:
-            seconds: Time in seconds
-            
-        Returns:
-            Formatted time string
-        """
-        if seconds is None:
-            return "N/A"
-        
-        hours, remainder = divmod(seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        
-        if hours > 0:
-            return f"{hours}h {minutes}m {seconds}s"
-        elif minutes > 0:
-            return f"{minutes}m {seconds}s"
-        else:
-            return f"{seconds}s"
\ No newline at end of file
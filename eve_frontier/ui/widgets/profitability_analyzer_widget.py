@@ -5,11 +5,16 @@ This widget allows users to analyze the profitability of manufacturing items.
 """
 
 import logging
+import os
 from typing import Dict, List, Optional, Any
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QProgressBar, QTableWidget, QTableWidgetItem,
@@ -20,21 +25,110 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal, Slot, QSize
 from PySide6.QtGui import QFont
 
+from sqlalchemy import Column, Integer, MetaData, Table, delete, insert, select
+from sqlalchemy.orm import Session
+
 from eve_frontier.services.market_service import MarketService
 from eve_frontier.services.production_service import ProductionService
 from eve_frontier.services.search_service import SearchService
 from eve_frontier.models.item import Item
+from eve_frontier.models.blueprint import Blueprint, BlueprintProduct
 
 logger = logging.getLogger(__name__)
 
+# Connection-local table holding the IDs of the items being analyzed
+_ANALYSIS_ITEM_IDS = Table(
+    "analysis_item_ids", MetaData(),
+    Column("id", Integer, primary_key=True),
+    prefixes=["TEMPORARY"]
+)
+
+# Fields of an analysis result record; the item name width is fitted to the
+# longest name of each run
+RESULT_FIELDS = [
+    ('item_id', 'i8'), ('item_name', 'U'), ('production_cost', 'f8'), ('market_price', 'f8'),
+    ('profit', 'f8'), ('profit_margin', 'f8'), ('volume', 'f8'), ('material_efficiency', 'i2')
+]
+
+# Result fields to sort by, in the order of the "Sort By" choices
+SORT_FIELDS = ('profit_margin', 'profit', 'production_cost', 'market_price')
+
+# Threads computing item profits in parallel during an analysis
+ANALYSIS_WORKERS = max(4, os.cpu_count() or 1)
+
+
+def _results_array(rows: List[tuple]) -> np.ndarray:
+    """
+    Pack analysis result rows into a structured array.
+    
+    Args:
+        rows: Result tuples in RESULT_FIELDS order
+        
+    Returns:
+        Structured array with one record per row
+    """
+    name_width = max((len(row[1]) for row in rows), default=1)
+    dtype = np.dtype([
+        (name, f"U{name_width}" if kind == 'U' else kind) for name, kind in RESULT_FIELDS
+    ])
+    return np.array(rows, dtype=dtype)
+
+
+def _rank_results(results: np.ndarray, sort_field: str, max_results: int) -> np.ndarray:
+    """
+    Sort results by a field in descending order and keep the best ones.
+    
+    Gives the same order as a stable sort in descending order, partitioning
+    out the top entries before sorting them.
+    
+    Args:
+        results: Structured array of results
+        sort_field: Name of the field to sort by
+        max_results: Number of results to keep, or 0 to keep all of them
+        
+    Returns:
+        Sorted structured array of results
+    """
+    count = len(results)
+    values = results[sort_field].astype(np.float64)
+    candidates = np.arange(count)
+    if max_results and max_results < count:
+        # Keep every value tied with the last one kept, so ties are broken by
+        # position like in the stable sort
+        kth = count - max_results
+        candidates = np.flatnonzero(values >= np.partition(values, kth)[kth])
+    
+    # Descending by value, then by original position
+    order = candidates[np.lexsort((candidates, -values[candidates]))]
+    if max_results:
+        order = order[:max_results]
+    return results[order]
+
+
+class NumericTableWidgetItem(QTableWidgetItem):
+    """Table item showing formatted text that sorts by the number in its UserRole."""
+    
+    def __lt__(self, other):
+        """
+        Compare items by their numeric UserRole values.
+        
+        Args:
+            other: Item to compare with
+            
+        Returns:
+            True if this item's value is smaller
+        """
+        return self.data(Qt.UserRole) < other.data(Qt.UserRole)
+
 
 class ProfitabilityAnalyzerWidget(QWidget):
     """Widget for analyzing item manufacturing profitability."""
     
     # Signals for worker thread
-    analysis_finished = Signal(list)
+    analysis_finished = Signal(object)
     analysis_error = Signal(str)
     analysis_progress = Signal(int, int)
+    analysis_cancelled = Signal()
     
     def __init__(self, db, parent=None):
         """
@@ -49,14 +143,19 @@ class ProfitabilityAnalyzerWidget(QWidget):
         # Initialize services
         self.db = db
         self.market_service = MarketService(db)
-        self.production_service = ProductionService(db)
+        self.production_service = ProductionService(db, market_service=self.market_service)
         self.search_service = SearchService(db)
         
         # State tracking
         self.analysis_results = []
-        self.analysis_thread = None
         self.is_analyzing = False
         
+        # Analyses run on a reusable worker thread and stop early once the
+        # cancel event is set
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profitability")
+        self._analysis_future = None
+        self._cancel_event = threading.Event()
+        
         # Initialize UI
         self._init_ui()
         
@@ -122,6 +221,11 @@ class ProfitabilityAnalyzerWidget(QWidget):
         self.analyze_button.clicked.connect(self.start_analysis)
         button_layout.addWidget(self.analyze_button)
         
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_analysis)
+        self.cancel_button.setEnabled(False)
+        button_layout.addWidget(self.cancel_button)
+        
         self.export_button = QPushButton("Export Results")
         self.export_button.clicked.connect(self.export_results)
         self.export_button.setEnabled(False)
@@ -163,6 +267,7 @@ class ProfitabilityAnalyzerWidget(QWidget):
         self.analysis_finished.connect(self.on_analysis_finished)
         self.analysis_error.connect(self.on_analysis_error)
         self.analysis_progress.connect(self.update_progress)
+        self.analysis_cancelled.connect(self.on_analysis_cancelled)
         
         # Set up layout
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -185,23 +290,47 @@ class ProfitabilityAnalyzerWidget(QWidget):
         include_components = self.include_components_check.isChecked()
         only_manufacturable = self.only_manufacturable_check.isChecked()
         max_results = self.max_results_spin.value()
+        sort_index = self.sort_by_combo.currentIndex()
+        sort_field = SORT_FIELDS[sort_index] if 0 <= sort_index < len(SORT_FIELDS) else SORT_FIELDS[0]
         
         # Update UI
         self.is_analyzing = True
         self.analyze_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.status_label.setText("Loading market data...")
         
-        # Start analysis in a thread
-        self.analysis_thread = threading.Thread(
-            target=self._run_analysis,
-            args=(me_level, min_margin, include_components, only_manufacturable, max_results)
+        # Start analysis on the worker thread
+        self._cancel_event.clear()
+        self._analysis_future = self._pool.submit(
+            self._run_analysis,
+            me_level, min_margin, include_components, only_manufacturable, max_results, sort_field
         )
-        self.analysis_thread.daemon = True
-        self.analysis_thread.start()
     
-    def _run_analysis(self, me_level, min_margin, include_components, only_manufacturable, max_results):
+    @Slot()
+    def cancel_analysis(self):
+        """Ask the running analysis to stop at its next progress check."""
+        if self.is_analyzing:
+            self._cancel_event.set()
+            self.cancel_button.setEnabled(False)
+            self.status_label.setText("Cancelling analysis...")
+    
+    def closeEvent(self, event):
+        """
+        Clean up resources when the widget is being closed.
+        
+        Cancels a running analysis and waits for the worker thread to stop.
+        
+        Args:
+            event: Close event
+        """
+        self._cancel_event.set()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        super().closeEvent(event)
+    
+    def _run_analysis(self, me_level, min_margin, include_components, only_manufacturable, max_results,
+                      sort_field='profit_margin'):
         """
         Run the analysis in a background thread.
         
@@ -211,6 +340,7 @@ class ProfitabilityAnalyzerWidget(QWidget):
             include_components: Whether to include component costs
             only_manufacturable: Only include manufacturable items
             max_results: Maximum number of results to return
+            sort_field: Result field to sort by, highest first
         """
         try:
             # Get all items with market data
@@ -222,8 +352,13 @@ class ProfitabilityAnalyzerWidget(QWidget):
                 self.analysis_error.emit("No market data available")
                 return
             
-            # Get list of all item IDs with market data
-            item_ids_with_market_data = list(market_data['items'].keys())
+            # Get list of all item IDs with market data, converted once
+            item_ids_with_market_data = []
+            for item_id in market_data['items']:
+                if str(item_id).isdigit():
+                    item_ids_with_market_data.append(int(item_id))
+                else:
+                    logger.warning(f"Skipping invalid item ID in market data: {item_id!r}")
             total_items = len(item_ids_with_market_data)
             logger.info(f"Found {total_items} items with market data")
             
@@ -234,20 +369,85 @@ class ProfitabilityAnalyzerWidget(QWidget):
             items_not_manufacturable = 0
             items_no_profit_data = 0
             items_below_margin = 0
+            items_failed = 0
             
-            # Process each item
-            for i, item_id in enumerate(item_ids_with_market_data):
-                if i % 10 == 0:
-                    self.analysis_progress.emit(i, total_items)
-                
+            # Load the names and manufacturability of all analyzed items up front
+            analysis_items = self._load_analysis_items(item_ids_with_market_data)
+            item_names = {item_id: name for item_id, (name, _) in analysis_items.items()}
+            manufacturable = None
+            if only_manufacturable:
+                manufacturable = {item_id for item_id, (_, has_blueprint) in analysis_items.items() if has_blueprint}
+            
+            # Each analysis thread queries through its own session and services, and
+            # keeps its own memo of results and component prices for this run, as
+            # the memo's nested dicts are updated in place without a lock
+            local = threading.local()
+            worker_sessions = []
+            
+            def production_service():
+                service = getattr(local, "production_service", None)
+                if service is None:
+                    session = Session(bind=self.db.get_bind())
+                    worker_sessions.append(session)
+                    market_service = MarketService(session)
+                    market_service._unified_market_data = market_data
+                    service = ProductionService(session, market_service=market_service)
+                    local.production_service = service
+                    local.memo = {}
+                return service
+            
+            # Bound methods used for every item, looked up once
+            is_cancelled = self._cancel_event.is_set
+            get_item_name = item_names.get
+            emit_progress = self.analysis_progress.emit
+            log_info = logger.info
+            add_result = results.append
+            
+            def compute(item_id_int):
+                """Classify one item, returning a (status, item_name, profit_data) tuple."""
+                if is_cancelled():
+                    return "cancelled", None, None
+                item_name = get_item_name(item_id_int)
+                if item_name is None:
+                    return "missing", None, None
+                if manufacturable is not None and item_id_int not in manufacturable:
+                    return "not_manufacturable", item_name, None
                 try:
-                    # Get item details
-                    item_id_int = int(item_id)
-                    item = self.db.query(Item).filter(
-                        Item.id == item_id_int
-                    ).first()
+                    service = production_service()
+                    profit_data = service.calculate_production_profit(
+                        item_id_int,
+                        quantity=1,
+                        me_level=me_level,
+                        include_components=include_components,
+                        memo=local.memo
+                    )
+                except Exception as e:
+                    return "error", item_name, e
+                return "profit", item_name, profit_data
+            
+            # Report progress about 100 times per run, whatever the item count
+            progress_step = max(1, total_items // 100)
+            
+            # Compute profits in parallel, handling results in item order
+            executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix="profitability-item")
+            try:
+                outcomes = executor.map(compute, item_ids_with_market_data)
+                for i, (item_id_int, (status, item_name, profit_data)) in enumerate(
+                        zip(item_ids_with_market_data, outcomes)):
+                    if i % progress_step == 0:
+                        if is_cancelled():
+                            logger.info(f"Profitability analysis cancelled after {i} of {total_items} items")
+                            self.analysis_cancelled.emit()
+                            return
+                        emit_progress(i, total_items)
                     
-                    if not item:
+                    # Workers skip the remaining items once cancelled; never report a partial run
+                    if status == "cancelled":
+                        logger.info(f"Profitability analysis cancelled after {i} of {total_items} items")
+                        self.analysis_cancelled.emit()
+                        return
+                    
+                    if status == "missing":
                         items_missing += 1
                         if items_missing <= 5:
                             logger.warning(f"Item not found in database: ID {item_id_int}")
@@ -255,144 +455,162 @@ class ProfitabilityAnalyzerWidget(QWidget):
                     
                     items_processed += 1
                     
-                    # If only_manufacturable, check if the item has a blueprint
-                    if only_manufacturable:
-                        blueprint = self.production_service._find_manufacturing_blueprint(item_id_int)
-                        if not blueprint:
-                            items_not_manufacturable += 1
-                            if items_not_manufacturable <= 5:
-                                logger.debug(f"Item {item.name} (ID: {item_id_int}) has no manufacturing blueprint")
-                            continue
+                    # Items without a manufacturing blueprint
+                    if status == "not_manufacturable":
+                        items_not_manufacturable += 1
+                        if items_not_manufacturable <= 5 and logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Item {item_name} (ID: {item_id_int}) has no manufacturing blueprint")
+                        continue
                     
-                    # Calculate production profit
-                    logger.debug(f"Calculating profit for {item.name} (ID: {item_id_int})")
-                    profit_data = self.production_service.calculate_production_profit(
-                        item_id_int,
-                        quantity=1,
-                        me_level=me_level,
-                        include_components=include_components
-                    )
+                    # Only the first failures carry a traceback
+                    if status == "error":
+                        items_failed += 1
+                        logger.error("Error processing item %s: %s", item_id_int, profit_data,
+                                     exc_info=profit_data if items_failed <= 5 else None)
+                        continue
                     
                     # Only include items with profit data
                     if not profit_data or 'profit_margin' not in profit_data:
                         items_no_profit_data += 1
                         if items_no_profit_data <= 5:
-                            logger.warning(f"No profit data for {item.name} (ID: {item_id_int})")
+                            logger.warning(f"No profit data for {item_name} (ID: {item_id_int})")
                         continue
                     
                     # Filter by minimum profit margin
                     if profit_data['profit_margin'] < min_margin:
                         items_below_margin += 1
-                        if items_below_margin <= 5:
-                            logger.debug(f"Item {item.name} (ID: {item_id_int}) profit margin {profit_data['profit_margin']:.2f}% is below threshold {min_margin}%")
+                        if items_below_margin <= 5 and logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Item {item_name} (ID: {item_id_int}) profit margin {profit_data['profit_margin']:.2f}% is below threshold {min_margin}%")
                         continue
                     
                     # Add to results
-                    logger.info(f"Found profitable item: {item.name} - Margin: {profit_data['profit_margin']:.2f}%, Profit: {profit_data.get('profit', 0)}")
-                    results.append({
-                        'item_id': item_id_int,
-                        'item_name': item.name,
-                        'production_cost': float(profit_data.get('production_cost', 0)),
-                        'market_price': float(profit_data.get('market_price', 0)),
-                        'profit': float(profit_data.get('profit', 0)),
-                        'profit_margin': float(profit_data.get('profit_margin', 0)),
-                        'volume': profit_data.get('daily_volume', 0),
-                        'material_efficiency': me_level
-                    })
-                except Exception as e:
-                    logger.error(f"Error processing item {item_id}: {e}", exc_info=True)
-                    continue
+                    log_info("Found profitable item: %s - Margin: %.2f%%, Profit: %s",
+                             item_name, profit_data['profit_margin'], profit_data.get('profit', 0))
+                    add_result((
+                        item_id_int,
+                        item_name,
+                        float(profit_data.get('production_cost', 0)),
+                        float(profit_data.get('market_price', 0)),
+                        float(profit_data.get('profit', 0)),
+                        float(profit_data.get('profit_margin', 0)),
+                        profit_data.get('daily_volume', 0),
+                        me_level
+                    ))
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+                for session in worker_sessions:
+                    session.close()
             
             logger.info(f"Analysis summary: {items_processed} items processed, {len(results)} profitable items found")
             logger.info(f"Items filtered out: {items_missing} missing, {items_not_manufacturable} not manufacturable, "
                        f"{items_no_profit_data} no profit data, {items_below_margin} below margin threshold")
             
-            # Sort results based on selected sort field
-            sort_field = {
-                0: 'profit_margin',
-                1: 'profit',
-                2: 'production_cost',
-                3: 'market_price'
-            }.get(self.sort_by_combo.currentIndex(), 'profit_margin')
-            
-            results.sort(key=lambda x: x[sort_field], reverse=True)
-            
-            # Limit results
-            if max_results:
-                results = results[:max_results]
+            # Rank and limit results
+            results = _rank_results(_results_array(results), sort_field, max_results)
             
             # Update UI with results
+            self.analysis_progress.emit(total_items, total_items)
             self.analysis_finished.emit(results)
             
         except Exception as e:
             logger.error(f"Analysis error: {e}", exc_info=True)
             self.analysis_error.emit(f"Error during analysis: {str(e)}")
-        finally:
-            self.analysis_progress.emit(total_items, total_items)
     
-    @Slot(list)
+    def _load_analysis_items(self, item_ids: List[int]) -> Dict[int, tuple]:
+        """
+        Look up the items of an analysis run with a single query.
+        
+        The IDs are uploaded into a temporary table and joined against the
+        items, so the query needs no bound parameter per item. An item counts
+        as manufacturable when a blueprint produces it.
+        
+        Args:
+            item_ids: IDs of the items with market data
+            
+        Returns:
+            Dictionary mapping the IDs of known items to (name, manufacturable) tuples
+        """
+        if not item_ids:
+            return {}
+        
+        manufacturable = (
+            select(BlueprintProduct.product_id)
+            .join(Blueprint, Blueprint.id == BlueprintProduct.blueprint_id)
+        )
+        
+        # The connection is rolled back on close, which discards the table contents
+        with self.db.get_bind().connect() as conn:
+            _ANALYSIS_ITEM_IDS.create(conn, checkfirst=True)
+            conn.execute(delete(_ANALYSIS_ITEM_IDS))
+            conn.execute(insert(_ANALYSIS_ITEM_IDS), [{"id": item_id} for item_id in set(item_ids)])
+            rows = conn.execute(
+                select(Item.id, Item.name, Item.id.in_(manufacturable))
+                .join(_ANALYSIS_ITEM_IDS, _ANALYSIS_ITEM_IDS.c.id == Item.id)
+            )
+            return {item_id: (name, bool(has_blueprint)) for item_id, name, has_blueprint in rows}
+    
+    @Slot(object)
     def on_analysis_finished(self, results):
         """
         Handle the completion of the analysis.
         
         Args:
-            results: Analysis results
+            results: Structured array of analysis results
         """
         self.analysis_results = results
         
+        # Suspend sorting and painting while the table is filled, so rows do not
+        # move or repaint as each cell is set
+        self.results_table.setSortingEnabled(False)
+        self.results_table.setUpdatesEnabled(False)
+        
         # Update table
         self.results_table.setRowCount(len(results))
         
+        # Format every cell up front: the item name and ID, then a (text, value)
+        # pair for each numeric column
+        money = "{:,.2f}".format
+        rows = [
+            (
+                item_name,
+                item_id,
+                (
+                    (money(production_cost), production_cost),
+                    (money(market_price), market_price),
+                    (money(profit), profit),
+                    (f"{profit_margin:.2f}%", profit_margin),
+                    (f"{volume:,}", volume),
+                    (str(material_efficiency), material_efficiency)
+                )
+            )
+            for (item_id, item_name, production_cost, market_price,
+                 profit, profit_margin, volume, material_efficiency) in results.tolist()
+        ]
+        
         # Populate table
-        for row, item in enumerate(results):
-            self.results_table.setItem(row, 0, QTableWidgetItem(item['item_name']))
-            
-            # Production cost
-            cost_item = QTableWidgetItem()
-            cost_item.setData(Qt.DisplayRole, f"{item['production_cost']:,.2f}")
-            cost_item.setData(Qt.UserRole, item['production_cost'])
-            self.results_table.setItem(row, 1, cost_item)
-            
-            # Market price
-            price_item = QTableWidgetItem()
-            price_item.setData(Qt.DisplayRole, f"{item['market_price']:,.2f}")
-            price_item.setData(Qt.UserRole, item['market_price'])
-            self.results_table.setItem(row, 2, price_item)
-            
-            # Profit
-            profit_item = QTableWidgetItem()
-            profit_item.setData(Qt.DisplayRole, f"{item['profit']:,.2f}")
-            profit_item.setData(Qt.UserRole, item['profit'])
-            self.results_table.setItem(row, 3, profit_item)
-            
-            # Profit margin
-            margin_item = QTableWidgetItem()
-            margin_item.setData(Qt.DisplayRole, f"{item['profit_margin']:.2f}%")
-            margin_item.setData(Qt.UserRole, item['profit_margin'])
-            self.results_table.setItem(row, 4, margin_item)
-            
-            # Volume
-            volume_item = QTableWidgetItem()
-            volume_item.setData(Qt.DisplayRole, f"{item['volume']:,}")
-            volume_item.setData(Qt.UserRole, item['volume'])
-            self.results_table.setItem(row, 5, volume_item)
+        for row, (item_name, item_id, cells) in enumerate(rows):
+            # Item name, storing the item ID for later reference
+            name_item = QTableWidgetItem(item_name)
+            name_item.setData(Qt.UserRole, item_id)
+            self.results_table.setItem(row, 0, name_item)
             
-            # ME level
-            me_item = QTableWidgetItem()
-            me_item.setData(Qt.DisplayRole, str(item['material_efficiency']))
-            me_item.setData(Qt.UserRole, item['material_efficiency'])
-            self.results_table.setItem(row, 6, me_item)
-            
-            # Store item ID in the first column for later reference
-            self.results_table.item(row, 0).setData(Qt.UserRole, item['item_id'])
+            # Production cost, market price, profit, profit margin, volume and ME level
+            for column, (text, value) in enumerate(cells, start=1):
+                cell_item = NumericTableWidgetItem(text)
+                cell_item.setData(Qt.UserRole, value)
+                self.results_table.setItem(row, column, cell_item)
+        
+        self.results_table.setUpdatesEnabled(True)
+        self.results_table.setSortingEnabled(True)
         
         # Update UI state
         self.is_analyzing = False
         self.analyze_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
         self.progress_bar.setVisible(False)
         self.export_button.setEnabled(True)
         
-        if results:
+        if len(results):
             self.status_label.setText(f"Analysis complete. Found {len(results)} profitable items.")
         else:
             self.status_label.setText("Analysis complete. No profitable items found.")
@@ -407,11 +625,22 @@ class ProfitabilityAnalyzerWidget(QWidget):
         """
         self.is_analyzing = False
         self.analyze_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
         self.progress_bar.setVisible(False)
         
         self.status_label.setText(f"Error: {error_message}")
         QMessageBox.critical(self, "Analysis Error", error_message)
     
+    @Slot()
+    def on_analysis_cancelled(self):
+        """Handle an analysis that was cancelled before it finished."""
+        self.is_analyzing = False
+        self.analyze_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+        self.progress_bar.setVisible(False)
+        
+        self.status_label.setText("Analysis cancelled")
+    
     @Slot(int, int)
     def update_progress(self, current, total):
         """
@@ -421,13 +650,17 @@ class ProfitabilityAnalyzerWidget(QWidget):
             current: Current progress
             total: Total items to process
         """
-        percent = int((current / total) * 100) if total > 0 else 0
+        # Progress still queued after the run ended must not replace its final status
+        if not self.is_analyzing:
+            return
+        
+        percent = current * 100 // total if total > 0 else 0
         self.progress_bar.setValue(percent)
         self.status_label.setText(f"Analyzing items... {current}/{total}")
     
     def export_results(self):
         """Export the analysis results to a CSV file."""
-        if not self.analysis_results:
+        if not len(self.analysis_results):
             QMessageBox.warning(self, "No Results", "No results to export")
             return
         
@@ -444,22 +677,8 @@ class ProfitabilityAnalyzerWidget(QWidget):
             output_path = Path(file_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Define CSV fields
-            import csv
-            fields = [
-                'item_id', 'item_name', 'production_cost', 'market_price', 
-                'profit', 'profit_margin', 'volume', 'material_efficiency'
-            ]
-            
-            # Write CSV file
-            with open(output_path, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fields)
-                writer.writeheader()
-                
-                for item in self.analysis_results:
-                    # Only write fields that are in our field list
-                    row = {field: item.get(field, '') for field in fields}
-                    writer.writerow(row)
+            # Write CSV file, one column per result field
+            pd.DataFrame(self.analysis_results).to_csv(output_path, index=False)
             
             self.status_label.setText(f"Results exported to {output_path}")
             QMessageBox.information(self, "Export Complete", f"Results exported to {output_path}")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EVE Frontier Blueprint Miracle - JSON Utility
+
+This module reads and writes JSON with orjson when it is installed, falling
+back to the standard library json module otherwise. Large files can be
+streamed with ijson when it is installed.
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def load_json(path):
+    """
+    Load a JSON file.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The decoded JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def iter_json_items(path, key=None):
+    """
+    Iterate over the key/value pairs of a JSON file's top-level object.
+
+    When ijson is installed the file is parsed incrementally, so only one
+    value is held in memory at a time.
+
+    Args:
+        path: Path to the JSON file
+        key: Optional top-level key whose object is iterated instead
+
+    Yields:
+        (key, value) tuples in file order
+    """
+    if ijson is None:
+        data = load_json(path)
+        if key is not None:
+            data = data.get(key, {})
+        yield from data.items()
+        return
+
+    with open(path, 'rb') as f:
+        yield from ijson.kvitems(f, key or '', use_float=True)
+
+def dumps_json(data, indent=False):
+    """
+    Serialize data to a JSON string.
+
+    Without indent the output has no optional whitespace.
+
+    Args:
+        data: The data to serialize
+        indent: Whether to indent nested values by two spaces
+
+    Returns:
+        The JSON document as a string
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option).decode()
+
+    if indent:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(',', ':'))
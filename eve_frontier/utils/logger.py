@@ -12,10 +12,25 @@ import os
 from pathlib import Path
 from datetime import datetime
 
+# File handlers by (logger name, log date), so a logger set up again on the
+# same day writes through the handler it already has
+_file_handlers = {}
+
+# Formatter shared by all handlers created here
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+# Whether the logs directory has been created by this process
+_log_dir_ready = False
+
 def setup_logger(name, log_level=logging.INFO):
     """
     Set up a logger with the specified name and log level.
     
+    Handlers are only created for loggers that have none yet. The log file is
+    opened on the first record written to it.
+    
     Args:
         name: The name of the logger
         log_level: The log level to use
@@ -23,37 +38,42 @@ def setup_logger(name, log_level=logging.INFO):
     Returns:
         A configured logger instance
     """
-    # Create logs directory if it doesn't exist
+    global _log_dir_ready
+    
+    # Get logger
+    logger = logging.getLogger(name)
+    logger.setLevel(log_level)
+    
+    # Keep the handlers the logger already has
+    if logger.handlers:
+        return logger
+    
+    # Create logs directory if it doesn't exist, once per process
     log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+    if not _log_dir_ready:
+        log_dir.mkdir(exist_ok=True)
+        _log_dir_ready = True
     
     # Generate log file name with timestamp
     timestamp = datetime.now().strftime("%Y%m%d")
     log_file = log_dir / f"{name}_{timestamp}.log"
     
-    # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    
-    # Create file handler
-    file_handler = logging.FileHandler(log_file)
+    # Create file handler, or reuse the one for today's file
+    file_handler = _file_handlers.get((name, timestamp))
+    if file_handler is None:
+        file_handler = logging.FileHandler(log_file, delay=True)
+        _file_handlers[(name, timestamp)] = file_handler
     file_handler.setLevel(log_level)
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(_FORMATTER)
     
     # Create console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
-    
-    # Get logger
-    logger = logging.getLogger(name)
-    logger.setLevel(log_level)
+    console_handler.setFormatter(_FORMATTER)
     
-    # Add handlers if they don't already exist
-    if not logger.handlers:
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+    # Add handlers
+    logger.addHandler(file_handler)
+    logger.addHandler(console_handler)
     
     return logger
 
@@ -20,11 +20,12 @@ Notes:
       it will be excluded from the output
 """
 
-import json
 import os
 import logging
 from pathlib import Path
 
+from eve_frontier.utils.json_utils import dumps_json, iter_json_items, load_json
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,17 +33,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger('filter_blueprints')
 
+def save_json(data, path):
+    """
+    Save data to a compact JSON file.
+    
+    Args:
+        data: JSON-serializable data
+        path: Path to the output file
+    """
+    Path(path).write_text(dumps_json(data), encoding='utf-8')
+
 def filter_blueprints():
     """
     Filter the blueprints.json file to only include blueprints with products
     that exist in the types_filtered.json file.
     
     The function:
-    1. Loads the blueprints.json and types_filtered.json files
+    1. Loads the types_filtered.json file
     2. Creates a set of valid typeIDs from types_filtered.json
     3. Filters blueprints to keep only those with:
        - The blueprint ID itself exists in valid_type_ids, OR
        - At least one manufacturing product with a typeID in valid_type_ids
+       Blueprints are read one at a time from blueprints.json when ijson is installed
     4. Saves the filtered blueprints to blueprints_filtered.json
     
     Returns:
@@ -54,48 +66,29 @@ def filter_blueprints():
     types_file = data_dir / 'types_filtered.json'
     output_file = data_dir / 'blueprints_filtered.json'
     
-    logger.info(f"Loading blueprints from {blueprints_file}")
-    with open(blueprints_file, 'r', encoding='utf-8') as f:
-        blueprint_data = json.load(f)
-    
-    # Extract blueprint count and blueprints
-    blueprint_count = blueprint_data.get("blueprint_count", 0)
-    blueprints = blueprint_data.get("blueprints", {})
-    logger.info(f"Loaded {blueprint_count} blueprints from file")
-    
     logger.info(f"Loading type data from {types_file}")
-    with open(types_file, 'r', encoding='utf-8') as f:
-        types_data = json.load(f)
+    types_data = load_json(types_file)
     
-    # Create a set of valid typeIDs for quick lookup
-    valid_type_ids = set(int(type_id) for type_id in types_data.keys())
+    # Create sets of valid typeIDs for quick lookup: strings to match blueprint
+    # IDs (JSON object keys) and ints to match product typeIDs (JSON numbers)
+    valid_type_id_strs = set(types_data.keys())
+    valid_type_ids = set(int(type_id) for type_id in valid_type_id_strs)
     logger.info(f"Found {len(valid_type_ids)} valid type IDs")
     
-    # Filter blueprints
+    # Filter blueprints as they are read
+    logger.info(f"Reading blueprints from {blueprints_file}")
     filtered_blueprints = {}
     kept_count = 0
     skipped_count = 0
     
-    for blueprint_id, blueprint_info in blueprints.items():
-        keep_blueprint = False
-        
-        # First check if the blueprint itself exists in valid_type_ids
-        if int(blueprint_id) in valid_type_ids:
-            keep_blueprint = True
-        
-        # Then check activities
-        if "activities" in blueprint_info:
-            activities = blueprint_info["activities"]
-            
-            # Check manufacturing
-            if "manufacturing" in activities:
-                manufacturing = activities["manufacturing"]
-                if "products" in manufacturing:
-                    products = manufacturing["products"]
-                    for product in products:
-                        if "typeID" in product and int(product["typeID"]) in valid_type_ids:
-                            keep_blueprint = True
-                            break
+    for blueprint_id, blueprint_info in iter_json_items(blueprints_file, key="blueprints"):
+        # Keep the blueprint if its own ID is a valid type, or else if any of
+        # its manufacturing products is
+        products = blueprint_info.get("activities", {}).get("manufacturing", {}).get("products", ())
+        keep_blueprint = (
+            blueprint_id in valid_type_id_strs
+            or any(product.get("typeID") in valid_type_ids for product in products)
+        )
         
         if keep_blueprint:
             filtered_blueprints[blueprint_id] = blueprint_info
@@ -111,10 +104,9 @@ def filter_blueprints():
         "blueprints": filtered_blueprints
     }
     
-    # Save filtered blueprints
+    # Save filtered blueprints without optional whitespace
     logger.info(f"Saving filtered blueprints to {output_file}")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(filtered_blueprint_data, f)
+    save_json(filtered_blueprint_data, output_file)
     
     logger.info("Filtering complete")
 
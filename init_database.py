@@ -5,6 +5,7 @@ Database Initialization Script for EVE Frontier Blueprint Miracle.
 This script initializes the database and loads sample data for testing.
 """
 
+import argparse
 import logging
 import sys
 import json
@@ -19,18 +20,24 @@ logging.basicConfig(
 logger = logging.getLogger("init_database")
 
 # Import required modules
+from sqlalchemy import delete, insert, literal, select
+
 from eve_frontier.models.base import init_db, get_db, Base, engine
 from eve_frontier.models import (
     Category, Group, Item, Blueprint, 
     BlueprintProduct, BlueprintMaterial, BlueprintActivity
 )
 from eve_frontier.services.data_loader import DataLoader
+from eve_frontier.utils.json_utils import dumps_json, load_json
+
+# Manifest in the data directory recording the files loaded by the last run
+MANIFEST_NAME = "_load_manifest.json"
 
 def table_is_empty(db, model):
     """Check if a table is empty."""
     try:
-        count = db.query(model).count()
-        return count == 0
+        # Fetch at most one row instead of counting them all
+        return db.execute(select(literal(1)).select_from(model).limit(1)).first() is None
     except Exception:
         # If an error occurs, assume the table is empty or doesn't exist
         return True
@@ -44,113 +51,86 @@ def create_sample_blueprints(db):
         logger.info("Blueprints already exist, skipping...")
         return
     
-    # Create a sample blueprint
-    blueprint = Blueprint(
-        id=1,
-        name="Steel Plates Blueprint",
-        max_production_limit=10
-    )
-    db.add(blueprint)
+    # Sample blueprints
+    blueprints = [
+        {"id": 1, "name": "Steel Plates Blueprint", "max_production_limit": 10},
+        {"id": 2, "name": "Shield Generator Blueprint", "max_production_limit": 5}
+    ]
     
-    # Add a manufacturing activity
-    activity = BlueprintActivity(
-        blueprint_id=1,
-        activity_name="Manufacturing",
-        time=300  # 5 minutes
-    )
-    db.add(activity)
+    # Manufacturing activities
+    activities = [
+        {"blueprint_id": 1, "activity_name": "Manufacturing", "time": 300},  # 5 minutes
+        {"blueprint_id": 2, "activity_name": "Manufacturing", "time": 600}   # 10 minutes
+    ]
     
-    # Add materials
+    # Materials
     materials = [
-        BlueprintMaterial(blueprint_id=1, material_id=84182, quantity=10),  # Steel
-        BlueprintMaterial(blueprint_id=1, material_id=84206, quantity=2)    # Steel Beams
+        {"blueprint_id": 1, "material_id": 84182, "quantity": 10},  # Steel
+        {"blueprint_id": 1, "material_id": 84206, "quantity": 2},   # Steel Beams
+        {"blueprint_id": 2, "material_id": 84712, "quantity": 3},   # Shield Generator Parts
+        {"blueprint_id": 2, "material_id": 84204, "quantity": 2}    # Steel Plates
     ]
-    db.add_all(materials)
     
-    # Add products
+    # Products
     products = [
-        BlueprintProduct(blueprint_id=1, product_id=84204, quantity=5)  # Steel Plates
-    ]
-    db.add_all(products)
-    
-    # Create another sample blueprint
-    blueprint2 = Blueprint(
-        id=2,
-        name="Shield Generator Blueprint",
-        max_production_limit=5
-    )
-    db.add(blueprint2)
-    
-    # Add a manufacturing activity
-    activity2 = BlueprintActivity(
-        blueprint_id=2,
-        activity_name="Manufacturing",
-        time=600  # 10 minutes
-    )
-    db.add(activity2)
-    
-    # Add materials
-    materials2 = [
-        BlueprintMaterial(blueprint_id=2, material_id=84712, quantity=3),  # Shield Generator Parts
-        BlueprintMaterial(blueprint_id=2, material_id=84204, quantity=2)   # Steel Plates
+        {"blueprint_id": 1, "product_id": 84204, "quantity": 5},  # Steel Plates
+        {"blueprint_id": 2, "product_id": 82652, "quantity": 1}   # Shield Generator
     ]
-    db.add_all(materials2)
     
-    # Add products
-    products2 = [
-        BlueprintProduct(blueprint_id=2, product_id=82652, quantity=1)  # Shield Generator
-    ]
-    db.add_all(products2)
+    # Insert each table's rows with one Core statement, bypassing the ORM unit of work
+    db.execute(insert(Blueprint.__table__), blueprints)
+    db.execute(insert(BlueprintActivity.__table__), activities)
+    db.execute(insert(BlueprintMaterial.__table__), materials)
+    db.execute(insert(BlueprintProduct.__table__), products)
     
     # Commit changes
     db.commit()
     logger.info("Sample blueprints created successfully")
 
-def main():
-    """Initialize the database and load sample data."""
+def file_signature(path):
+    """Get the (size, modification time) signature of a data file."""
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+def read_manifest(path):
+    """Read the manifest of the files loaded by the last run, if any."""
+    try:
+        return load_json(path)
+    except Exception:
+        return {}
+
+def main(force=False):
+    """
+    Initialize the database and load the data files.
+    
+    Files whose size and modification time match the manifest written by the
+    previous run are not loaded again, as long as their tables still hold
+    data. Once a file is reloaded, the files after it are reloaded too, since
+    they refer to its rows.
+    
+    Args:
+        force: Drop and recreate all tables and load every file
+    """
     logger.info("Initializing database...")
     
-    # Force recreate all tables
-    logger.info("Dropping all tables and recreating them...")
-    Base.metadata.drop_all(engine)
+    if force:
+        logger.info("Dropping all tables and recreating them...")
+        Base.metadata.drop_all(engine)
     Base.metadata.create_all(engine)
     
     # Get database session
     db = get_db()
     
     try:
-        # Create a data loader
-        loader = DataLoader(db)
+        # Create a data loader that leaves committing to us, so all files are
+        # loaded in a single transaction
+        loader = DataLoader(db, commit=False)
         
         # Define data directory
         data_dir = Path("data/json")
-        
-        # Load categories if needed
-        categories_file = data_dir / "categories.json"
-        if categories_file.exists():
-            logger.info(f"Loading categories from {categories_file}")
-            count = loader.load_categories(categories_file)
-            logger.info(f"Loaded {count} categories")
-        else:
-            logger.warning(f"Categories file not found: {categories_file}")
-        
-        # Load groups if needed
-        groups_file = data_dir / "groups.json"
-        if groups_file.exists():
-            logger.info(f"Loading groups from {groups_file}")
-            count = loader.load_groups(groups_file)
-            logger.info(f"Loaded {count} groups")
-        else:
-            logger.warning(f"Groups file not found: {groups_file}")
-        
-        # Load items if needed
-        items_file = data_dir / "types_filtered.json"
-        if items_file.exists():
-            logger.info(f"Loading items from {items_file}")
-            count = loader.load_items(items_file)
-            logger.info(f"Loaded {count} items")
-        else:
-            logger.warning(f"Items file not found: {items_file}")
+        manifest_file = data_dir / MANIFEST_NAME
+        previous_manifest = {} if force else read_manifest(manifest_file)
+        manifest = {}
         
         # Load blueprints from filtered file if it exists, otherwise fall back to original
         blueprints_file = data_dir / "blueprints_filtered.json"
@@ -159,15 +139,42 @@ def main():
             logger.info("Falling back to original blueprints.json")
             blueprints_file = data_dir / "blueprints.json"
         
-        if blueprints_file.exists():
-            logger.info(f"Loading blueprints from {blueprints_file}")
-            count = loader.load_blueprints(blueprints_file)
-            logger.info(f"Loaded {count} blueprints")
-        else:
-            logger.warning(f"Blueprints file not found: {blueprints_file}")
-            # Create sample blueprints for testing
-            create_sample_blueprints(db)
+        # Data files in load order, with the tables each one fills
+        steps = [
+            ("categories", data_dir / "categories.json", [Category], loader.load_categories),
+            ("groups", data_dir / "groups.json", [Group], loader.load_groups),
+            ("items", data_dir / "types_filtered.json", [Item], loader.load_items),
+            ("blueprints", blueprints_file,
+             [BlueprintProduct, BlueprintMaterial, BlueprintActivity, Blueprint], loader.load_blueprints),
+        ]
+        
+        reload = force
+        for name, data_file, models, load in steps:
+            if not data_file.exists():
+                logger.warning(f"{name.capitalize()} file not found: {data_file}")
+                if name == "blueprints":
+                    # Create sample blueprints for testing
+                    create_sample_blueprints(db)
+                continue
+            
+            entry = {"file": str(data_file), "signature": file_signature(data_file)}
+            manifest[name] = entry
+            if not reload and previous_manifest.get(name) == entry and not table_is_empty(db, models[-1]):
+                logger.info(f"{name.capitalize()} file unchanged since the last load, skipping {data_file}")
+                continue
+            reload = True
+            
+            # Replace the rows loaded from the previous version of the file
+            for model in models:
+                db.execute(delete(model))
+            
+            logger.info(f"Loading {name} from {data_file}")
+            count = load(data_file)
+            logger.info(f"Loaded {count} {name}")
         
+        # Commit everything loaded above at once, then remember what was loaded
+        db.commit()
+        manifest_file.write_text(dumps_json(manifest, indent=True))
         logger.info("Database initialization complete!")
     
     except Exception as e:
@@ -178,4 +185,7 @@ def main():
         db.close()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Initialize the EVE Frontier database")
+    parser.add_argument('--force', action='store_true', help='Drop all tables and reload every data file')
+    args = parser.parse_args()
+    main(force=args.force) 
\ No newline at end of file
@@ -12,12 +12,18 @@ import os
 import sys
 import logging
 import argparse
+import cProfile
+import pstats
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Dict, List, Tuple, Optional
 from decimal import Decimal
 from pathlib import Path
 import csv
 from datetime import datetime
 
+import numpy as np
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,18 +31,140 @@ logging.basicConfig(
 )
 logger = logging.getLogger("profitability_analyzer")
 
-# Ensure parent directory is in path for imports
-current_dir = Path(__file__).resolve().parent
-if str(current_dir) not in sys.path:
-    sys.path.insert(0, str(current_dir))
-
 from sqlalchemy.orm import Session
-from sqlalchemy import create_engine
+from sqlalchemy import bindparam, create_engine, select
 
-from eve_frontier.models import Item, Blueprint, MarketData
+from eve_frontier.models import Item, Blueprint, BlueprintProduct, MarketData
+from eve_frontier.models.base import tune_sqlite
 from eve_frontier.services.search_service import SearchService
 from eve_frontier.services.market_service import MarketService
 from eve_frontier.services.production_service import ProductionService
+from eve_frontier.utils.json_utils import dumps_json
+
+# Item IDs scored per worker process task, below SQLite's bound parameter limit
+SCORE_CHUNK_SIZE = 500
+
+# Each item's name and whether a blueprint manufactures it, for the items bound to
+# "item_ids"; built once and reused by every chunk
+_ITEMS_TO_SCORE = (
+    select(
+        Item.id,
+        Item.name,
+        Item.id.in_(
+            select(BlueprintProduct.product_id)
+            .join(Blueprint, Blueprint.id == BlueprintProduct.blueprint_id)
+        ).label("manufacturable")
+    )
+    .where(Item.id.in_(bindparam("item_ids", expanding=True)))
+)
+
+# Session, services and memo of the current worker process, set up by
+# _init_score_worker(); the memo lasts for one analysis run
+_worker_services = None
+
+
+def _init_score_worker(db_path: str) -> None:
+    """
+    Set up a worker process with its own read-only database connection.
+    
+    Args:
+        db_path: Path to the SQLite database file
+    """
+    global _worker_services
+    
+    engine = create_engine(f"sqlite:///file:{db_path}?mode=ro&uri=true")
+    tune_sqlite(engine, read_only=True)
+    session = Session(engine, autoflush=False, expire_on_commit=False)
+    market_service = MarketService(session)
+    _worker_services = (session, ProductionService(session, market_service=market_service), {})
+
+
+def _score_items(
+    item_ids: List[int],
+    min_profit_margin: float,
+    me_level: int,
+    include_components: bool,
+    only_manufacturable: bool
+) -> Tuple[List[Dict], int]:
+    """
+    Calculate the profitability of a chunk of items in a worker process.
+    
+    Args:
+        item_ids: IDs of the items to score
+        min_profit_margin: Minimum profit margin (%) to include in results
+        me_level: Material Efficiency level to assume for calculations
+        include_components: Whether to include component costs in calculations
+        only_manufacturable: Only include items that can be manufactured
+        
+    Returns:
+        Tuple of the profitable items' data and the number of skipped items
+    """
+    session, production_service, memo = _worker_services
+    results = []
+    skipped_items = 0
+    
+    # Load the names and manufacturability of the chunk's items with one query
+    item_names = {}
+    manufacturable = set() if only_manufacturable else None
+    for item_id, name, has_blueprint in session.execute(_ITEMS_TO_SCORE, {"item_ids": item_ids}):
+        item_names[item_id] = name
+        if has_blueprint and manufacturable is not None:
+            manufacturable.add(item_id)
+    
+    for item_id_int in item_ids:
+        try:
+            # Get item details
+            item_name = item_names.get(item_id_int)
+            if item_name is None:
+                logger.warning(f"Item {item_id_int} not found in database")
+                skipped_items += 1
+                continue
+            
+            # If only_manufacturable, check if the item has a blueprint
+            if manufacturable is not None and item_id_int not in manufacturable:
+                skipped_items += 1
+                continue
+            
+            # Calculate production profit, reusing the component results and
+            # prices computed for earlier items of the run
+            profit_data = production_service.calculate_production_profit(
+                item_id_int,
+                quantity=1,
+                me_level=me_level,
+                include_components=include_components,
+                memo=memo
+            )
+            
+            # Only include items with profit data
+            if not profit_data or 'profit_margin' not in profit_data:
+                skipped_items += 1
+                continue
+            
+            # Filter by minimum profit margin
+            if profit_data['profit_margin'] < min_profit_margin:
+                skipped_items += 1
+                continue
+            
+            # Add to results
+            results.append({
+                'item_id': item_id_int,
+                'item_name': item_name,
+                'production_cost': float(profit_data.get('production_cost', 0)),
+                'market_price': float(profit_data.get('market_price', 0)),
+                'profit': float(profit_data.get('profit', 0)),
+                'profit_margin': float(profit_data.get('profit_margin', 0)),
+                'volume': profit_data.get('daily_volume', 0),
+                'material_efficiency': me_level
+            })
+        except Exception as e:
+            logger.error(f"Error processing item {item_id_int}: {e}")
+            skipped_items += 1
+            continue
+    
+    # Drop the chunk's objects from the identity map so it stays bounded over the run
+    session.expunge_all()
+    
+    return results, skipped_items
 
 
 class ProfitabilityAnalyzer:
@@ -59,10 +187,14 @@ class ProfitabilityAnalyzer:
         if not db_path.exists():
             raise FileNotFoundError(f"Database file not found: {db_path}")
         
+        self.db_path = db_path
+        
         # Create engine and session
         engine_url = f"sqlite:///{db_path}"
         self.engine = create_engine(engine_url)
-        self.session = Session(self.engine)
+        tune_sqlite(self.engine)
+        # The analyzer only reads, so it never needs to flush or expire objects
+        self.session = Session(self.engine, autoflush=False, expire_on_commit=False)
         
         # Initialize services
         self.search_service = SearchService(self.session)
@@ -103,77 +235,55 @@ class ProfitabilityAnalyzer:
             logger.error("No market data available")
             return []
         
-        # Get list of all item IDs with market data
-        item_ids_with_market_data = list(market_data['items'].keys())
-        logger.info(f"Found {len(item_ids_with_market_data)} items with market data")
-        
         # Initialize results list
         results = []
         skipped_items = 0
         
-        # Process each item
-        for i, item_id in enumerate(item_ids_with_market_data):
-            if i % 100 == 0:
-                logger.info(f"Processed {i}/{len(item_ids_with_market_data)} items")
-            
-            try:
-                # Get item details
-                item_id_int = int(item_id)
-                item = self.session.query(Item).filter(Item.id == item_id_int).first()
-                if not item:
-                    logger.warning(f"Item {item_id} not found in database")
-                    skipped_items += 1
-                    continue
-                
-                # If only_manufacturable, check if the item has a blueprint
-                if only_manufacturable:
-                    blueprint = self.production_service._find_manufacturing_blueprint(item_id_int)
-                    if not blueprint:
-                        skipped_items += 1
-                        continue
-                
-                # Calculate production profit
-                profit_data = self.production_service.calculate_production_profit(
-                    item_id_int,
-                    quantity=1,
-                    me_level=me_level,
-                    include_components=include_components
-                )
-                
-                # Only include items with profit data
-                if not profit_data or 'profit_margin' not in profit_data:
-                    skipped_items += 1
-                    continue
-                
-                # Filter by minimum profit margin
-                if profit_data['profit_margin'] < min_profit_margin:
-                    skipped_items += 1
-                    continue
-                
-                # Add to results
-                results.append({
-                    'item_id': item_id_int,
-                    'item_name': item.name,
-                    'production_cost': float(profit_data.get('production_cost', 0)),
-                    'market_price': float(profit_data.get('market_price', 0)),
-                    'profit': float(profit_data.get('profit', 0)),
-                    'profit_margin': float(profit_data.get('profit_margin', 0)),
-                    'volume': profit_data.get('daily_volume', 0),
-                    'material_efficiency': me_level
-                })
-            except Exception as e:
-                logger.error(f"Error processing item {item_id}: {e}")
+        # Get list of all item IDs with market data, converted once
+        item_ids_with_market_data = []
+        for item_id in market_data['items']:
+            if str(item_id).isdigit():
+                item_ids_with_market_data.append(int(item_id))
+            else:
+                logger.warning(f"Skipping invalid item ID in market data: {item_id!r}")
                 skipped_items += 1
-                continue
+        logger.info(f"Found {len(item_ids_with_market_data)} items with market data")
         
-        logger.info(f"Analysis completed. Found {len(results)} profitable items. Skipped {skipped_items} items.")
+        # Score chunks of items in parallel worker processes, each with its own
+        # read-only connection; results come back in item order
+        chunks = [
+            item_ids_with_market_data[start:start + SCORE_CHUNK_SIZE]
+            for start in range(0, len(item_ids_with_market_data), SCORE_CHUNK_SIZE)
+        ]
+        if chunks:
+            with ProcessPoolExecutor(
+                max_workers=min(os.cpu_count() or 1, len(chunks)),
+                initializer=_init_score_worker,
+                initargs=(str(self.db_path),)
+            ) as executor:
+                processed = 0
+                for chunk, (chunk_results, chunk_skipped) in zip(chunks, executor.map(
+                    _score_items,
+                    chunks,
+                    repeat(min_profit_margin),
+                    repeat(me_level),
+                    repeat(include_components),
+                    repeat(only_manufacturable)
+                )):
+                    results.extend(chunk_results)
+                    skipped_items += chunk_skipped
+                    processed += len(chunk)
+                    logger.info(f"Processed {processed}/{len(item_ids_with_market_data)} items")
         
-        # Sort results by profit margin
-        results.sort(key=lambda x: x['profit_margin'], reverse=True)
+        logger.info(f"Analysis completed. Found {len(results)} profitable items. Skipped {skipped_items} items.")
         
-        # Limit results if specified
+        # Sort results by profit margin, highest first, keeping ties in item
+        # order like a stable sort, and limit them if specified
+        margins = np.fromiter((item['profit_margin'] for item in results), dtype=np.float64, count=len(results))
+        order = np.argsort(-margins, kind='stable')
         if limit_results:
-            results = results[:limit_results]
+            order = order[:limit_results]
+        results = [results[i] for i in order]
         
         return results
     
@@ -260,15 +370,11 @@ class ProfitabilityAnalyzer:
         ]
         
         try:
-            # Write CSV file
-            with open(output_path, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fields)
-                writer.writeheader()
-                
-                for item in results:
-                    # Only write fields that are in our field list
-                    row = {field: item.get(field, '') for field in fields}
-                    writer.writerow(row)
+            # Write CSV file, streaming only the listed fields of each result as a tuple
+            with open(output_path, 'w', newline='', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(fields)
+                writer.writerows(tuple(item.get(field, '') for field in fields) for item in results)
             
             logger.info(f"Results exported to {output_path}")
             
@@ -287,6 +393,10 @@ def main():
     parser.add_argument('--output', type=str, default='profitability_analysis.csv', help='Output CSV file path')
     parser.add_argument('--limit', type=int, help='Limit number of results')
     parser.add_argument('--include-all', action='store_true', help='Include non-manufacturable items')
+    parser.add_argument('--profile', nargs='?', const='analyzer.prof', metavar='PROF_FILE',
+                        help='Profile the analysis of all items, saving the stats to PROF_FILE '
+                             '(default: analyzer.prof; view with e.g. snakeviz). Only the main '
+                             'process is profiled, not the scoring worker processes')
     
     args = parser.parse_args()
     
@@ -317,38 +427,49 @@ def main():
                 
                 # Write manufacturing details
                 if 'manufacturing_details' in result and result['manufacturing_details']:
-                    import json
-                    f.write(json.dumps(result['manufacturing_details'], indent=2))
+                    f.write(dumps_json(result['manufacturing_details'], indent=True))
                 else:
                     f.write("No manufacturing details available.")
             
             print(f"\nDetailed manufacturing information saved to {detailed_output}")
             
         else:
-            # Analyze all items
+            # Analyze all items, under the profiler if requested
+            profiler = cProfile.Profile() if args.profile else None
+            if profiler:
+                profiler.enable()
             results = analyzer.analyze_all_items(
                 min_profit_margin=args.min_margin,
                 me_level=args.me_level,
                 only_manufacturable=not args.include_all,
                 limit_results=args.limit
             )
+            if profiler:
+                profiler.disable()
+                profiler.dump_stats(args.profile)
+                pstats.Stats(profiler).sort_stats('cumulative').print_stats(30)
+                logger.info(f"Profile saved to {args.profile}")
             
             # Export results
             analyzer.export_results_to_csv(results, args.output)
             
             # Print top 10 most profitable items
             if results:
-                print("\nTop 10 Most Profitable Items:")
-                print("-" * 80)
-                print(f"{'Item Name':<40} {'Profit Margin':<15} {'Profit':<15} {'Production Cost':<15}")
-                print("-" * 80)
-                
-                for i, item in enumerate(results[:10]):
-                    print(f"{item['item_name']:<40} {item['profit_margin']:<15.2f}% {item['profit']:<15,.2f} {item['production_cost']:<15,.2f}")
-                
-                print("-" * 80)
-                print(f"Total profitable items found: {len(results)}")
-                print(f"Full results saved to: {args.output}")
+                # Build the whole report, then write it in one call
+                lines = [
+                    "\nTop 10 Most Profitable Items:",
+                    "-" * 80,
+                    f"{'Item Name':<40} {'Profit Margin':<15} {'Profit':<15} {'Production Cost':<15}",
+                    "-" * 80
+                ]
+                lines.extend(
+                    f"{item['item_name']:<40} {item['profit_margin']:<15.2f}% {item['profit']:<15,.2f} {item['production_cost']:<15,.2f}"
+                    for item in results[:10]
+                )
+                lines.append("-" * 80)
+                lines.append(f"Total profitable items found: {len(results)}")
+                lines.append(f"Full results saved to: {args.output}")
+                sys.stdout.write("\n".join(lines) + "\n")
             else:
                 print("No profitable items found matching criteria.")
         
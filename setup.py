@@ -16,6 +16,7 @@ setup(
     author="EVE Frontier",
     author_email="info@evefrontier.org",
     packages=find_packages(),
+    py_modules=["item_profitability_analyzer"],
     python_requires=">=3.8",
     install_requires=[
         "PySide6>=6.4.0",
@@ -28,6 +29,7 @@ setup(
     entry_points={
         "console_scripts": [
             "eve-frontier=eve_frontier.main:main",
+            "eve-frontier-profit=item_profitability_analyzer:main",
         ],
     },
     classifiers=[
@@ -2,11 +2,12 @@
 Enhanced script to display detailed mapping between TypeIDs and human-readable names.
 """
 
-import json
 from pathlib import Path
 import logging
 from collections import defaultdict
 
+from eve_frontier.utils.json_utils import iter_json_items, load_json
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,15 +26,9 @@ def main():
         logger.error(f"Groups data file not found: {groups_path}")
         return
     
-    # Load the JSON data
-    logger.info(f"Loading types data from {types_path}")
-    with open(types_path, 'r') as f:
-        types_data = json.load(f)
-    
     logger.info(f"Loading groups data from {groups_path}")
     try:
-        with open(groups_path, 'r') as f:
-            groups_data = json.load(f)
+        groups_data = load_json(groups_path)
     except:
         logger.warning("Could not load groups data. Will continue without group information.")
         groups_data = {}
@@ -43,21 +38,37 @@ def main():
     for group_id, group_data in groups_data.items():
         group_names[int(group_id)] = group_data.get('groupNameID', f'Group {group_id}')
     
-    # Organize items by group
+    # Stream the types data, keeping the printed fields of the 5 lowest TypeIDs
+    # and a count per group
+    logger.info(f"Loading types data from {types_path}")
     items_by_group = defaultdict(list)
-    for type_id, item_data in types_data.items():
+    group_sizes = defaultdict(int)
+    total_items = 0
+    for type_id, item_data in iter_json_items(types_path):
         group_id = item_data.get('groupID', 0)
-        items_by_group[group_id].append((int(type_id), item_data))
+        items = items_by_group[group_id]
+        items.append((
+            int(type_id),
+            item_data.get('typeNameID', 'Unknown'),
+            item_data.get('basePrice', 0),
+            item_data.get('volume', 0)
+        ))
+        if len(items) > 5:
+            items.sort(key=lambda x: x[0])
+            items.pop()
+        group_sizes[group_id] += 1
+        total_items += 1
     
     # Display statistics
-    logger.info(f"Found {len(types_data)} items across {len(items_by_group)} groups")
+    logger.info(f"Found {total_items} items across {len(items_by_group)} groups")
     
     # Print a sample from each group (up to 5 items per group)
     print("\n=== MAPPING BETWEEN TYPEIDS AND HUMAN-READABLE NAMES ===\n")
     
     for group_id, items in items_by_group.items():
         group_name = group_names.get(group_id, f"Group {group_id}")
-        print(f"\n== GROUP: {group_name} (ID: {group_id}) - {len(items)} items ==")
+        group_size = group_sizes[group_id]
+        print(f"\n== GROUP: {group_name} (ID: {group_id}) - {group_size} items ==")
         print("{:<10} {:<50} {:<15} {:<10}".format("TypeID", "Name", "Base Price", "Volume"))
         print("-" * 85)
         
@@ -65,21 +76,16 @@ def main():
         items.sort(key=lambda x: x[0])
         
         # Show up to 5 items from each group
-        for i, (type_id, item_data) in enumerate(items):
-            if i >= 5:
-                print(f"... and {len(items) - 5} more items in this group")
-                break
-                
-            name = item_data.get('typeNameID', 'Unknown')
-            base_price = item_data.get('basePrice', 0)
-            volume = item_data.get('volume', 0)
-            
+        for type_id, name, base_price, volume in items:
             # Format base price with commas for readability
             price_str = f"{base_price:,.2f}" if base_price else "N/A"
             
             print("{:<10} {:<50} {:<15} {:<10}".format(
                 type_id, name[:48], price_str, volume
             ))
+        
+        if group_size > 5:
+            print(f"... and {group_size - 5} more items in this group")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
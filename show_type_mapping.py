@@ -2,10 +2,11 @@
 Script to display the mapping between TypeIDs and human-readable names.
 """
 
-import json
 from pathlib import Path
 import logging
 
+from eve_frontier.utils.json_utils import iter_json_items
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,13 +20,17 @@ def main():
         logger.error(f"Data file not found: {data_path}")
         return
     
-    # Load the JSON data
+    # Stream the JSON data, keeping only the first 20 items and a count
     logger.info(f"Loading data from {data_path}")
-    with open(data_path, 'r') as f:
-        types_data = json.load(f)
+    sample = []
+    total_items = 0
+    for type_id, item_data in iter_json_items(data_path):
+        if total_items < 20:
+            sample.append((type_id, item_data))
+        total_items += 1
     
     # Extract and display the mapping
-    logger.info(f"Found {len(types_data)} items in the types_filtered.json file")
+    logger.info(f"Found {total_items} items in the types_filtered.json file")
     logger.info("Sample of TypeID to Name mapping:")
     
     # Print header
@@ -33,13 +38,13 @@ def main():
     print("-" * 60)
     
     # Print a subset of the mapping (first 20 items)
-    for count, (type_id, item_data) in enumerate(types_data.items()):
+    for count, (type_id, item_data) in enumerate(sample):
         name = item_data.get('typeNameID', 'Unknown')
         print("{:<10} {:<50}".format(type_id, name))
         
         # Only show the first 20 mappings to avoid flooding the console
         if count >= 19:
-            print("\n... and {} more items".format(len(types_data) - 20))
+            print("\n... and {} more items".format(total_items - 20))
             break
 
 if __name__ == "__main__":
@@ -5,8 +5,6 @@
 Test script for the Blueprint Browser tab.
 """
 
-import sys
-import os
 import logging
 from pathlib import Path
 
@@ -14,9 +12,6 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("test_blueprint_browser")
 
-# Add the current directory to the path so we can import the application modules
-sys.path.append(os.getcwd())
-
 try:
     # Import the application modules
     from eve_frontier.models.base import get_db
@@ -42,9 +37,9 @@ try:
         
         logger.info(f"Found {len(blueprints)} blueprints matching '{query}'")
         
-        # Print the results
-        for blueprint in blueprints:
-            logger.info(f"  ID: {blueprint.id}, Name: {blueprint.name}")
+        # Print the results in one call
+        if blueprints:
+            logger.info("\n".join(f"  ID: {blueprint.id}, Name: {blueprint.name}" for blueprint in blueprints))
     
     except Exception as e:
         logger.error(f"Error searching for blueprints: {e}")
@@ -3,14 +3,17 @@ Test script for the DataLoader's load_items method.
 """
 
 import os
+import argparse
 import logging
 import json
 from pathlib import Path
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 
 # Import the necessary models and services
-from eve_frontier.models.item import Item, Base
+from eve_frontier.models.base import init_db, tune_sqlite
+from eve_frontier.models.item import Item
 from eve_frontier.services.data_loader import DataLoader
 
 # Set up logging
@@ -19,20 +22,31 @@ logger = logging.getLogger(__name__)
 
 def setup_test_db():
     """Set up an in-memory SQLite database for testing."""
-    # Create an in-memory SQLite database
-    engine = create_engine("sqlite:///:memory:")
+    # Create an in-memory SQLite database on a single shared connection, so
+    # the schema and loaded rows survive connection checkouts
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    tune_sqlite(engine)
     
     # Create all tables
-    Base.metadata.create_all(engine)
+    init_db(engine)
     
-    # Create a session factory
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # Create a session factory whose sessions keep loaded attributes after commits
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
     
     # Return a new session
     return SessionLocal()
 
-def main():
-    """Run the test for the DataLoader's load_items method."""
+def main(batch_size=1000):
+    """
+    Run the test for the DataLoader's load_items method.
+    
+    Args:
+        batch_size: Number of items per insert
+    """
     # Set up the test database
     logger.info("Setting up test database")
     db = setup_test_db()
@@ -49,17 +63,20 @@ def main():
     
     # Load the items
     logger.info(f"Loading items from {data_path}")
-    loader.load_items(str(data_path))
+    loader.load_items(str(data_path), batch_size=batch_size)
     
-    # Query some items to verify they were loaded correctly
-    items = db.query(Item).limit(10).all()
+    # Query some items to verify they were loaded correctly, as plain rows in ID
+    # order (the name index would otherwise pick the row order)
+    items = db.query(Item.id, Item.name).order_by(Item.id).limit(10).all()
     
-    logger.info("Sample items loaded:")
-    for item in items:
-        logger.info(f"ID: {item.id}, Name: {item.name}")
+    # Log the whole sample in one call
+    logger.info("Sample items loaded:\n%s", "\n".join(f"ID: {item_id}, Name: {name}" for item_id, name in items))
     
     # Close the database session
     db.close()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Test loading items with the DataLoader")
+    parser.add_argument('--batch-size', type=int, default=1000, help='Number of items per insert')
+    args = parser.parse_args()
+    main(batch_size=args.batch_size) 
\ No newline at end of file
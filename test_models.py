@@ -18,13 +18,71 @@ logging.basicConfig(
 logger = logging.getLogger("test_models")
 
 # Import required modules
-from eve_frontier.models.base import Base, init_db, get_db
+from sqlalchemy import bindparam, func, insert, select
+
+from eve_frontier.models.base import Base, SessionLocal, init_db
 from eve_frontier.models import (
     Item, Group, Category,
     Blueprint, BlueprintProduct, BlueprintMaterial, BlueprintActivity,
     Station, MarketData, MarketOrder
 )
 
+# Item ID and name lookup by the name bound to "name"; built once so its compiled SQL is cached
+ITEM_BY_NAME = select(Item.id, Item.name).where(Item.name == bindparam("name")).limit(1)
+
+# Sample rows for each model, in foreign key order
+SAMPLE_ROWS = (
+    (Category, ({"id": 1, "name": "Minerals", "published": True},)),
+    (Group, ({"id": 1, "name": "Basic Minerals", "category_id": 1, "published": True},)),
+    (Item, ({
+        "id": 34,
+        "name": "Tritanium",
+        "group_id": 1,
+        "base_price": 5.0,
+        "volume": 0.01,
+        "published": True,
+        "description": "The most common mineral in EVE."
+    },)),
+    (Blueprint, ({"id": 1, "name": "Tritanium Blueprint", "max_production_limit": 100},)),
+    (BlueprintActivity, ({
+        "blueprint_id": 1,
+        "activity_name": "Manufacturing",
+        "time": 300  # 5 minutes
+    },)),
+    (BlueprintProduct, ({
+        "blueprint_id": 1,
+        "product_id": 34,  # Tritanium
+        "quantity": 100
+    },)),
+    (BlueprintMaterial, ({
+        "blueprint_id": 1,
+        "material_id": 34,  # Tritanium (just for testing)
+        "quantity": 50
+    },)),
+    (Station, ({
+        "id": 60000004,
+        "name": "Jita IV - Moon 4 - Caldari Navy Assembly Plant",
+        "region": "The Forge"
+    },)),
+    (MarketData, ({
+        "item_id": 34,  # Tritanium
+        "station_id": 60000004,  # Jita
+        "buy_price": 5.5,
+        "sell_price": 6.0,
+        "buy_volume": 1000000,
+        "sell_volume": 500000
+    },)),
+    (MarketOrder, ({
+        "item_id": 34,  # Tritanium
+        "station_id": 60000004,  # Jita
+        "order_type": "sell",
+        "price": 6.0,
+        "volume": 100000,
+        "min_volume": 1,
+        "range_str": "region"
+    },)),
+)
+
 def test_models():
     """Test database models by creating them and performing basic operations."""
     logger.info("Testing database models...")
@@ -33,143 +91,48 @@ def test_models():
     logger.info("Initializing database...")
     init_db()
     
-    # Get a database session
-    db = get_db()
+    # Get a database session that keeps loaded attributes after commits
+    db = SessionLocal(expire_on_commit=False)
     
     try:
-        # Test Category model
-        logger.info("Testing Category model...")
-        category = Category(id=1, name="Minerals", published=True)
-        db.add(category)
-        db.commit()
-        logger.info("Added Category: %s", category)
-        
-        # Test Group model
-        logger.info("Testing Group model...")
-        group = Group(id=1, name="Basic Minerals", category_id=1, published=True)
-        db.add(group)
-        db.commit()
-        logger.info("Added Group: %s", group)
-        
-        # Test Item model
-        logger.info("Testing Item model...")
-        item = Item(
-            id=34,
-            name="Tritanium",
-            group_id=1,
-            base_price=5.0,
-            volume=0.01,
-            published=True,
-            description="The most common mineral in EVE."
-        )
-        db.add(item)
-        db.commit()
-        logger.info("Added Item: %s", item)
-        
-        # Test Blueprint model
-        logger.info("Testing Blueprint model...")
-        blueprint = Blueprint(
-            id=1,
-            name="Tritanium Blueprint",
-            max_production_limit=100
-        )
-        db.add(blueprint)
-        db.commit()
-        logger.info("Added Blueprint: %s", blueprint)
-        
-        # Test BlueprintActivity model
-        logger.info("Testing BlueprintActivity model...")
-        activity = BlueprintActivity(
-            blueprint_id=1,
-            activity_name="Manufacturing",
-            time=300  # 5 minutes
-        )
-        db.add(activity)
-        db.commit()
-        logger.info("Added BlueprintActivity: %s", activity)
-        
-        # Test BlueprintProduct model
-        logger.info("Testing BlueprintProduct model...")
-        product = BlueprintProduct(
-            blueprint_id=1,
-            product_id=34,  # Tritanium
-            quantity=100
-        )
-        db.add(product)
-        db.commit()
-        logger.info("Added BlueprintProduct: %s", product)
-        
-        # Test BlueprintMaterial model
-        logger.info("Testing BlueprintMaterial model...")
-        material = BlueprintMaterial(
-            blueprint_id=1,
-            material_id=34,  # Tritanium (just for testing)
-            quantity=50
-        )
-        db.add(material)
-        db.commit()
-        logger.info("Added BlueprintMaterial: %s", material)
-        
-        # Test Station model
-        logger.info("Testing Station model...")
-        station = Station(
-            id=60000004,
-            name="Jita IV - Moon 4 - Caldari Navy Assembly Plant",
-            region="The Forge"
-        )
-        db.add(station)
-        db.commit()
-        logger.info("Added Station: %s", station)
-        
-        # Test MarketData model
-        logger.info("Testing MarketData model...")
-        market_data = MarketData(
-            item_id=34,  # Tritanium
-            station_id=60000004,  # Jita
-            buy_price=5.5,
-            sell_price=6.0,
-            buy_volume=1000000,
-            sell_volume=500000
-        )
-        db.add(market_data)
-        db.commit()
-        logger.info("Added MarketData: %s", market_data)
-        
-        # Test MarketOrder model
-        logger.info("Testing MarketOrder model...")
-        market_order = MarketOrder(
-            item_id=34,  # Tritanium
-            station_id=60000004,  # Jita
-            order_type="sell",
-            price=6.0,
-            volume=100000,
-            min_volume=1,
-            range_str="region"
-        )
-        db.add(market_order)
-        db.commit()
-        logger.info("Added MarketOrder: %s", market_order)
+        # Insert every model's rows in a single transaction
+        with db.begin():
+            for model, model_rows in SAMPLE_ROWS:
+                logger.info("Testing %s model...", model.__name__)
+                db.execute(insert(model), list(model_rows))
+                logger.info("Added %s: %s", model.__name__, model_rows)
         
         # Test querying
         logger.info("Testing database queries...")
         
-        # Query for items
-        items = db.query(Item).all()
-        logger.info("Found %s items", len(items))
+        # Count items in the database rather than loading them
+        item_count = db.scalar(select(func.count()).select_from(Item))
+        logger.info("Found %s items", item_count)
         
-        # Query for a specific item
-        tritanium = db.query(Item).filter(Item.name == "Tritanium").first()
+        # Query for a specific item's ID and name only
+        tritanium = db.execute(ITEM_BY_NAME, {"name": "Tritanium"}).one_or_none()
         if tritanium:
-            logger.info("Found Tritanium: %s", tritanium)
+            logger.info("Found Tritanium: id=%s name=%s", tritanium.id, tritanium.name)
         
-        # Query for blueprints
-        blueprints = db.query(Blueprint).all()
-        logger.info("Found %s blueprints", len(blueprints))
+        # Count blueprints in the database rather than loading them
+        blueprint_count = db.scalar(select(func.count()).select_from(Blueprint))
+        logger.info("Found %s blueprints", blueprint_count)
         
-        # Query for blueprint products
-        products = db.query(BlueprintProduct).join(Item, BlueprintProduct.product_id == Item.id).all()
+        # Query for the blueprint product columns that are logged, joined with the
+        # product item's name in the same query
+        products = db.execute(
+            select(BlueprintProduct.blueprint_id, BlueprintProduct.quantity, Item.name)
+            .join(Item, BlueprintProduct.product_id == Item.id)
+        ).all()
         logger.info("Found %s blueprint products", len(products))
         
+        # Log every product in one call
+        if products:
+            logger.info("\n".join(
+                f"Blueprint {product.blueprint_id} produces {product.quantity} x {product.name}"
+                for product in products
+            ))
+        
         logger.info("Database models test completed successfully!")
     
     except Exception as e:
@@ -5,6 +5,9 @@ Test the ProductionService's get_manufacturing_details method for Steel Plates.
 """
 
 import logging
+
+from sqlalchemy import select
+
 from eve_frontier.models.base import get_db
 from eve_frontier.models import Item
 from eve_frontier.services.production_service import ProductionService
@@ -13,6 +16,24 @@ from eve_frontier.services.production_service import ProductionService
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+def load_item_ids_by_name(db):
+    """
+    Load the ID of every item, keyed by name, with one query.
+    
+    Name lookups are then dictionary lookups instead of a SELECT each. Where
+    several items share a name, the lowest ID wins.
+    
+    Args:
+        db: SQLAlchemy database session
+        
+    Returns:
+        Dictionary mapping item names to item IDs
+    """
+    item_ids = {}
+    for item_id, name in db.execute(select(Item.id, Item.name).order_by(Item.id)):
+        item_ids.setdefault(name, item_id)
+    return item_ids
+
 def main():
     """Main function."""
     # Get a database session
@@ -21,18 +42,19 @@ def main():
     # Initialize production service
     production_service = ProductionService(db)
     
-    # Get Steel Plates
-    steel_plates = db.query(Item).filter(Item.name == 'Steel Plates').first()
-    if steel_plates:
-        logger.info(f"Found Steel Plates with ID: {steel_plates.id}")
+    # Get the Steel Plates ID from the name map loaded once
+    item_ids_by_name = load_item_ids_by_name(db)
+    steel_plates_id = item_ids_by_name.get('Steel Plates')
+    if steel_plates_id is not None:
+        logger.info(f"Found Steel Plates with ID: {steel_plates_id}")
     else:
         logger.error("Steel Plates not found")
         return
     
-    # Get manufacturing details
-    logger.info(f"Getting manufacturing details for Steel Plates (ID: {steel_plates.id})")
+    # Get manufacturing details; material names come preloaded with the chain
+    logger.info(f"Getting manufacturing details for Steel Plates (ID: {steel_plates_id})")
     result = production_service.get_manufacturing_details(
-        item_id=steel_plates.id,
+        item_id=steel_plates_id,
         quantity=10,
         me_level=0,
         te_level=0,
@@ -48,8 +70,12 @@ def main():
         logger.info(f"Time: {result.time_required}s")
         logger.info(f"Materials: {len(result.materials)}")
         
-        for i, material in enumerate(result.materials):
-            logger.info(f"  Material {i+1}: {material.item_name} (ID: {material.item_id}) - Quantity: {material.quantity}")
+        # Log every material in one call
+        if result.materials:
+            logger.info("\n".join(
+                f"  Material {i+1}: {material.item_name} (ID: {material.item_id}) - Quantity: {material.quantity}"
+                for i, material in enumerate(result.materials)
+            ))
     else:
         logger.error("No manufacturing details found for Steel Plates")
 
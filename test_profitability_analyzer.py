@@ -3,8 +3,11 @@
 
 """
 Test script to run the profitability analyzer as a standalone tool.
+
+With --headless the analysis runs without Qt, so PySide6 is never imported.
 """
 
+import argparse
 import sys
 import logging
 from pathlib import Path
@@ -12,8 +15,7 @@ from pathlib import Path
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
-from PySide6.QtWidgets import QApplication, QMainWindow
-from PySide6.QtCore import QTimer
+from eve_frontier.models.base import tune_sqlite
 
 # Configure logging
 logging.basicConfig(
@@ -22,24 +24,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger("profitability_analyzer_test")
 
-def main():
-    """Run the profitability analyzer as a standalone application."""
-    # Get path to database
-    db_path = "eve_frontier.db"
-    if len(sys.argv) > 1:
-        db_path = sys.argv[1]
+# Number of top results logged by a headless run
+HEADLESS_TOP_RESULTS = 10
+
+def run_headless(db_path: Path) -> int:
+    """
+    Run the profitability analysis without the GUI and log the top results.
     
-    db_path = Path(db_path).resolve()
-    if not db_path.exists():
-        logger.error(f"Database file not found: {db_path}")
-        print(f"Error: Database file not found: {db_path}")
-        return 1
+    Uses the widget's default settings.
     
-    logger.info(f"Using database: {db_path}")
+    Args:
+        db_path: Path to the SQLite database file
+    
+    Returns:
+        Process exit code
+    """
+    from item_profitability_analyzer import ProfitabilityAnalyzer
+    
+    analyzer = ProfitabilityAnalyzer(db_path=str(db_path))
+    results = analyzer.analyze_all_items(
+        min_profit_margin=5.0,
+        me_level=0,
+        include_components=True,
+        only_manufacturable=True,
+        limit_results=100
+    )
+    
+    logger.info(f"Found {len(results)} profitable items")
+    if results:
+        logger.info("Top items:\n%s", "\n".join(
+            f"{item['item_name']}: {item['profit_margin']:.2f}% margin, {item['profit']:,.2f} ISK profit"
+            for item in results[:HEADLESS_TOP_RESULTS]
+        ))
+    return 0
+
+def run_gui(db_path: Path) -> int:
+    """
+    Show the profitability analyzer widget in its own window.
+    
+    Args:
+        db_path: Path to the SQLite database file
+    
+    Returns:
+        Process exit code
+    """
+    # Qt is only imported when the GUI is shown
+    from PySide6.QtWidgets import QApplication, QMainWindow
+    from PySide6.QtCore import QTimer
     
     # Create database connection
     engine_url = f"sqlite:///{db_path}"
     engine = create_engine(engine_url)
+    tune_sqlite(engine)
     session = Session(engine)
     
     # Create Qt application
@@ -64,7 +100,7 @@ def main():
         
         # Auto-start analysis after a short delay (optional)
         QTimer.singleShot(500, analyzer.start_analysis)
-        
+    
     except ImportError as e:
         logger.error(f"Error importing components: {e}")
         print(f"Error: {e}")
@@ -73,5 +109,27 @@ def main():
     # Run the application
     return app.exec()
 
+def main():
+    """Run the profitability analyzer as a standalone application."""
+    # Parse command-line arguments
+    parser = argparse.ArgumentParser(description="Run the profitability analyzer")
+    parser.add_argument('db_path', nargs='?', default="eve_frontier.db", help='Path to the database file')
+    parser.add_argument('--headless', action='store_true', help='Run the analysis without the GUI')
+    args = parser.parse_args()
+    
+    # Get path to database
+    db_path = Path(args.db_path).resolve()
+    if not db_path.exists():
+        logger.error(f"Database file not found: {db_path}")
+        print(f"Error: Database file not found: {db_path}")
+        return 1
+    
+    logger.info(f"Using database: {db_path}")
+    
+    # Skip Qt entirely for headless runs
+    if args.headless:
+        return run_headless(db_path)
+    return run_gui(db_path)
+
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(main())